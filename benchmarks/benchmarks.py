@@ -0,0 +1,601 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of Moliana, which do not need Dymola as checkModel() is applied by
+a FakeBackend.
+
+Without arguments, all benchmarks are run. With a path as argument, only the
+end-to-end suite() is run and its results are written to this JSON file:
+    python benchmarks.py results.json
+
+@author: jmoeckel
+"""
+
+import os
+import sys
+import cProfile
+import pstats
+import tempfile
+import time
+import tracemalloc
+
+pRoot = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, pRoot)
+import moliana
+
+pLib = os.path.join(pRoot,'examples','test_library')
+
+###############################################################################
+def profile_check(lib=pLib, latency=0, nrows=20):
+    """
+    Profiles DymolaMode.execute_check() for a given library.
+    - FakeBackend is used with given latency per checkModel()
+    - all levels are checked
+    - the nrows most expensive functions (cumulative time) are printed
+    """
+
+    backend = moliana.FakeBackend(latency=latency)
+    dm = moliana.DymolaMode(lib, None, checker_backend=backend, modelica_lib_depth=-1)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    dm.execute_check()
+    profiler.disable()
+
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(nrows)
+
+    return True
+
+def load_check(lib=pLib, repeat=100, latency=0, workers=1, overhead=0, batch_size=1):
+    """
+    Load test of DymolaMode.execute_check() for a given library.
+    - FakeBackend is used with given latency per checkModel() and overhead
+      per call of the checker
+    - checkModel() is applied by given number of parallel workers and in
+      batches of given size
+    - the check is repeated several times and the mean time per check and per
+      checked package/model is printed
+    """
+
+    backend = moliana.FakeBackend(latency=latency, overhead=overhead)
+    dm = moliana.DymolaMode(lib, None, checker_backend=backend, modelica_lib_depth=-1, workers=workers, batch_size=batch_size)
+
+    t0 = time.perf_counter()
+    for i in range(repeat):
+        rep = dm.execute_check()
+    dt = (time.perf_counter()-t0)/repeat
+
+    print('{:.6f} s per check, {:.6f} s per package/model'.format(dt, dt/max(len(rep.cont),1)))
+
+    return True
+
+def _synthetic_report(path, nrows, changed=0, shift=0):
+    """
+    Returns a Report instance with nrows synthetic packages/models. Each
+    changed-th row has a different result, the names are shifted by shift.
+    """
+
+    cont = []
+    for i in range(shift, nrows+shift):
+        res = 'False' if changed and i % changed == 0 else 'True'
+        cont.append({'Pck':'L1Pck{}.L2Model{}'.format(i // 100, i), 'Res':res, 'Err':str(int(res=='False')), 'Wrn':'0',
+                     'colPck':'white', 'colRes':'white', 'colErr':'white', 'colWrn':'white'})
+
+    meta = {'pck':'test_library', 'ped':False, 'lod':-1, 'git':'no git',
+            'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes'}
+
+    return moliana.Report(name='report', path=path, mode='full', cont=cont, meta=meta,
+                          disp=[{'Key':'Checked Library', 'Val':'test_library'}])
+
+def _synthetic_library(path, size=20000, breadth=20, depth=2, name='SyntheticLib'):
+    """
+    Generates a Modelica library with given name and returns its path. Each
+    package has breadth subpackages down to given depth, the size models are
+    distributed evenly over the packages of the lowest level. Each package has
+    a package.mo and package.order, each model its own .mo file.
+
+    Default: 20 packages, each with 20 subpackages, each with 50 models.
+    """
+
+    def write(dirpath, within, name, lOrder):
+        os.makedirs(dirpath)
+        with open(os.path.join(dirpath, 'package.mo'), 'w') as file:
+            file.write('within {};\npackage {}\nend {};\n'.format(within, name, name))
+        with open(os.path.join(dirpath, 'package.order'), 'w') as file:
+            file.write('\n'.join(lOrder))
+
+    nLeaves = breadth**depth
+    pLib = os.path.join(path, name)
+    lPackages = [(pLib, '', name)]
+    for level in range(depth+1):
+        lNext = []
+        for ind, (dirpath, within, pck) in enumerate(lPackages):
+            mopath = '{}.{}'.format(within, pck) if within else pck
+            if level < depth:
+                lNames = ['P{}'.format(i) for i in range(breadth)]
+                write(dirpath, within, pck, lNames)
+                lNext.extend((os.path.join(dirpath, sub), mopath, sub) for sub in lNames)
+                continue
+
+            #packages of the lowest level, the first ones get the remainder
+            lNames = ['M{}'.format(k) for k in range(size//nLeaves + (ind < size % nLeaves))]
+            write(dirpath, within, pck, lNames)
+            for model in lNames:
+                with open(os.path.join(dirpath, model + '.mo'), 'w') as file:
+                    file.write('within {};\nmodel {}\n  parameter Real k = 1;\n  Real x(start=0);\n'
+                               'equation\n  der(x) = -k*x;\nend {};\n'.format(mopath, model, model))
+        lPackages = lNext
+
+    return pLib
+
+def compare_scaling(sizes=(1000, 10000, 100000, 1000000)):
+    """
+    Scaling of Report.compare_to() with the number of rows.
+    - both reports have given number of rows, 1% of the results differ and
+      0.1% of the packages/models are added and removed respectively
+    - the time per comparison (including generation of the HTML file) and per
+      row is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for nrows in sizes:
+            rep1 = _synthetic_report(tmp, nrows, changed=100)
+            rep2 = _synthetic_report(tmp, nrows, shift=nrows//1000)
+
+            t0 = time.perf_counter()
+            rep1.compare_to(rep2)
+            dt = time.perf_counter()-t0
+
+            print('{:8d} rows: {:.3f} s per comparison, {:.2e} s per row'.format(nrows, dt, dt/nrows))
+
+    return True
+
+def memory_cont(nrows=1000000):
+    """
+    Memory of Report.cont compared to a list of dictionaries, as cont has
+    been stored in previous versions.
+    - nrows rows are parsed from synthetic log file rows
+    - allocated memory and the time to iterate over all values of all rows
+      is printed (for Report.cont by the internal iteration, which is used
+      e.g. by the Converter, and by dictionary access)
+    """
+
+    lines = ['L1Pck{}.L2Pck{}.L3Model{} {} {} {}'.format(i // 1000, i // 100, i, 'true' if i % 10 else 'false', int(i % 10 == 0), i % 3)
+             for i in range(nrows)]
+    colors = moliana.Report().colors
+
+    def dicts():
+        cont = []
+        for line in lines:
+            (pck,res,err,wrn) = line.split()
+            res = res.capitalize()
+            cont.append({'Pck':pck, 'Res':res, 'Err':err, 'Wrn':wrn, 'colPck':'white',
+                         'colRes':colors['cTrue'] if res=='True' else colors['cFalse'] if res=='False' else colors['cNF'],
+                         'colErr':'white' if err=='0' else colors['cErr'],
+                         'colWrn':'white' if wrn=='0' else colors['cWrn']})
+        return cont
+
+    def rows():
+        rep = moliana.Report()
+        rep.cont = []
+        for line in lines:
+            (pck,res,err,wrn) = line.split()
+            rep.cont.add(pck, res.capitalize(), int(err), int(wrn))
+        return rep.cont
+
+    def iterate(cont):
+        for dic in cont:
+            [dic[key] for key in ('Pck', 'Res', 'Err', 'Wrn', 'colPck', 'colRes', 'colErr', 'colWrn')]
+
+    for func in (dicts, rows):
+        tracemalloc.start()
+        cont = func()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        lTimes = []
+        for it in ([iterate] if func is dicts else [lambda cont: list(cont._iter_values()), iterate]):
+            t0 = time.perf_counter()
+            it(cont)
+            lTimes.append('{:.3f} s'.format(time.perf_counter()-t0))
+
+        print('{:6s}: {:8.1f} MB, {:.0f} bytes per row, iteration {}'.format(func.__name__, size/1e6, size/nrows, ' / '.join(lTimes)))
+        del cont
+
+    return True
+
+def html_generation(sizes=(1000, 100000, 1000000)):
+    """
+    Generation of HTML reports of different sizes.
+    - reports have given number of rows
+    - time, file size and peak memory (allocated by Python) is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for nrows in sizes:
+            rep = _synthetic_report(tmp, nrows, changed=100)
+
+            t0 = time.perf_counter()
+            rep.generate_html()
+            dt = time.perf_counter()-t0
+
+            tracemalloc.start()
+            rep.generate_html()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            size = os.path.getsize(os.path.join(tmp, 'report.html'))
+            print('{:8d} rows: {:.3f} s, {:.1f} MB ({:.0f} bytes per row), {:.1f} MB peak memory'.format(nrows, dt, size/1e6, size/nrows, peak/1e6))
+
+    return True
+
+def html_parsing(sizes=(1000, 100000, 1000000)):
+    """
+    Reading of HTML reports of different sizes.
+    - reports have given number of rows, some of them with changed colors
+    - time and throughput of Report.read_html() is printed, once using the
+      embedded report data and once parsing the HTML itself (as for reports
+      without report data)
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for nrows in sizes:
+            rep = _synthetic_report(tmp, nrows, changed=100)
+            rep.compare_to(_synthetic_report(tmp, nrows, shift=1))
+
+            for sMethod in ('data', 'html'):
+                if sMethod == 'html':
+                    #without the last line, the report data is not found
+                    filepath = os.path.join(tmp, 'report_compare.html')
+                    with open(filepath) as file:
+                        html = file.read()
+                    with open(filepath, 'w') as file:
+                        file.write(html[:html.rindex('\n')])
+
+                rep2 = moliana.Report(name='report_compare', path=tmp)
+                t0 = time.perf_counter()
+                rep2.read_html()
+                dt = time.perf_counter()-t0
+
+                assert len(rep2.cont) == len(rep.cont)
+                print('{:8d} rows ({}): {:.3f} s ({:.0f} rows/s)'.format(len(rep2.cont), sMethod, dt, len(rep2.cont)/dt))
+
+    return True
+
+def bulk_report(nrows=1000000):
+    """
+    Assembly of a large report from a list of dictionaries.
+    - time of assigning Report.cont (validated) and of Report.set_cont() with
+      trusted=True is printed
+    """
+
+    lRows = [{'Pck':'Lib.P{}.M{}'.format(i//1000, i), 'Res':'False' if i%100==0 else 'True',
+              'Err':str(i%3), 'Wrn':str(i%5)} for i in range(nrows)]
+
+    for bTrusted in (False, True):
+        rep = moliana.Report()
+        t0 = time.perf_counter()
+        if bTrusted:
+            rep.set_cont(lRows, trusted=True)
+        else:
+            rep.cont = lRows
+        dt = time.perf_counter()-t0
+
+        print('{:8d} rows ({}): {:.3f} s'.format(len(rep.cont), 'trusted' if bTrusted else 'validated', dt))
+
+    return True
+
+def matrix_scaling(sizes=(10000, 100000), nreports=10):
+    """
+    Scaling of ReportMatrix with the number of rows.
+    - given number of reports, each with given number of rows, 1% of the
+      results differ and the packages/models are shifted by 0.1% per report
+    - time to build the matrix, its summary and its HTML file is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for nrows in sizes:
+            lReports = [_synthetic_report(tmp, nrows, changed=100 if i % 2 else 0, shift=i*nrows//1000) for i in range(nreports)]
+
+            t0 = time.perf_counter()
+            matrix = moliana.ReportMatrix(lReports)
+            matrix.get_summary()
+            matrix.generate_html()
+            dt = time.perf_counter()-t0
+
+            print('{:8d} rows x {} reports: {:.3f} s, {:.2e} s per row'.format(nrows, nreports, dt, dt/nrows/nreports))
+
+    return True
+
+def _count_stat(func):
+    """
+    Calls func and returns its result, the elapsed time and the number of
+    calls of os.stat (e.g. by os.path.isdir()), which are expensive on network
+    drives.
+    """
+
+    nStat = [0]
+    stat = os.stat
+    def counting_stat(*args, **kwargs):
+        nStat[0] += 1
+        return stat(*args, **kwargs)
+
+    os.stat = counting_stat
+    try:
+        t0 = time.perf_counter()
+        result = func()
+        dt = time.perf_counter()-t0
+    finally:
+        os.stat = stat
+
+    return result, dt, nStat[0]
+
+def library_walk(depths=(1, 2, -1)):
+    """
+    Traversal of a synthetic library with 20k models by LibraryWalker.
+    - time and number of stat calls for each level of detail is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pLib = _synthetic_library(tmp)
+
+        for depth in depths:
+            lItems, dt, nStat = _count_stat(lambda: moliana.LibraryWalker(pLib).walk(depth=depth))
+            print('depth {:2d}: {:6d} items, {:.3f} s, {} stat calls'.format(depth, len(lItems), dt, nStat))
+
+    return True
+
+def library_index():
+    """
+    Traversal of a synthetic library with 20k models by LibraryWalker with a
+    persisted index.
+    - time and number of stat calls without index, for building the index,
+      for revalidating an unchanged index and after one package has changed
+      is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pLib = _synthetic_library(tmp)
+        pIndex = os.path.join(tmp, 'index.json')
+
+        def walk(index_path=None):
+            walker = moliana.LibraryWalker(pLib, index_path)
+            lItems = walker.walk(depth=-1)
+            walker.save()
+            return lItems
+
+        for label, index_path in [('no index', None), ('cold index', pIndex), ('warm index', pIndex)]:
+            lItems, dt, nStat = _count_stat(lambda: walk(index_path))
+            print('{:>12}: {:6d} items, {:.3f} s, {} stat calls'.format(label, len(lItems), dt, nStat))
+
+        with open(os.path.join(pLib, 'P0', 'P0', 'package.order'), 'a') as file:
+            file.write('\n')
+
+        lItems, dt, nStat = _count_stat(lambda: walk(pIndex))
+        print('{:>12}: {:6d} items, {:.3f} s, {} stat calls'.format('one changed', len(lItems), dt, nStat))
+
+    return True
+
+def import_time(repeat=10):
+    """
+    Import of moliana in a new interpreter (python -X importtime).
+    - median of the cumulative import time of the module itself and the
+      optional modules, which have been imported with it, are printed
+    """
+
+    import subprocess
+
+    lOptional = ['subprocess', 'sqlite3', 'hashlib', 'tempfile', 'shutil', 'win32ui', 'dde']
+    code = 'import sys, moliana; print(" ".join(sorted(set(sys.modules) & {{{}}})))'.format(', '.join(repr(mod) for mod in lOptional))
+
+    lTimes = []
+    for i in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=pRoot, universal_newlines=True,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        line = [line for line in proc.stderr.splitlines() if line.endswith('| moliana')][0]
+        lTimes.append(int(line.split('|')[1]))
+
+    lTimes.sort()
+    print('import moliana: {:.1f} ms (median of {}), optional modules imported: {}'.format(lTimes[repeat//2]/1000, repeat,
+                                                                                      proc.stdout.strip() or 'none'))
+
+    return True
+
+def history_insert(nrows=50000, runs=10):
+    """
+    Appending runs to a ResultHistory and querying it.
+    - each run has given number of rows
+    - time per run (a single transaction) and of the queries is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rep = _synthetic_report(tmp, nrows, changed=100)
+
+        with moliana.ResultHistory(os.path.join(tmp, 'history.db')) as history:
+            t0 = time.perf_counter()
+            for i in range(runs):
+                history.add_run(rep)
+            dt = (time.perf_counter()-t0)/runs
+            print('{:8d} rows: {:.3f} s per run'.format(nrows, dt))
+
+            for sQuery, func in (('first failure', lambda: history.get_first_failure('L1Pck0.L2Model0')),
+                                 ('warning trend', lambda: history.get_warning_trend()),
+                                 ('latest runs', lambda: history.get_latest_runs())):
+                t0 = time.perf_counter()
+                func()
+                print('{:>14}: {:.3f} s ({} runs)'.format(sQuery, time.perf_counter()-t0, runs))
+
+    return True
+
+def hooks_overhead(lib=pLib, repeat=100):
+    """
+    Overhead of the instrumentation hooks of DymolaMode.execute_check().
+    - FakeBackend without latency is used, so that the overhead is not hidden
+    - mean time per check without hooks, with an empty hook and with a
+      TraceCollector is printed
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = moliana.TraceCollector(os.path.join(tmp, 'trace.json'))
+
+        for label, hooks in (('no hooks', None), ('empty hook', [lambda event: None]), ('trace', [trace])):
+            dm = moliana.DymolaMode(lib, None, checker_backend=moliana.FakeBackend(), modelica_lib_depth=-1, hooks=hooks)
+
+            t0 = time.perf_counter()
+            for i in range(repeat):
+                dm.execute_check()
+            dt = (time.perf_counter()-t0)/repeat
+
+            print('{:>10}: {:.6f} s per check'.format(label, dt))
+
+        t0 = time.perf_counter()
+        trace.save()
+        print('{:>10}: {:.3f} s for {} events'.format('save', time.perf_counter()-t0, len(trace.events)))
+
+    return True
+
+def _phase_times(events):
+    """
+    Returns the summed durations of the phases of the events of
+    TraceCollector and the duration of the check loop, i.e. from the start
+    of the first to the end of the last package/model (dictionary).
+    """
+
+    dTimes = {}
+    dStarts = {}
+    lElements = []
+    for event in events:
+        key = (event['Name'], event['Thread'])
+        if event['Phase'] == 'Begin':
+            dStarts.setdefault(key, []).append(event['Time'])
+        else:
+            dTimes[event['Name']] = dTimes.get(event['Name'], 0) + event['Time'] - dStarts[key].pop()
+        if event['Name'] in ('element', 'batch'):
+            lElements.append(event['Time'])
+
+    dTimes['loop'] = lElements[-1] - lElements[0] if lElements else 0
+
+    return dTimes
+
+def suite(sizes=(100, 1000, 10000, 100000, 1000000), depth=2, models=50, batch_size=-1, output=None):
+    """
+    End-to-end benchmark of all stages for synthetic libraries of given
+    sizes (number of models), see _synthetic_library(). Each package of the
+    lowest level (at given depth) has about the given number of models.
+    - execute_check() is run with FakeBackend and given batch_size, its phases
+      are timed by a TraceCollector: traversal of the library ('walk'), the
+      check loop including assembly of the report ('check') and parsing of
+      the log files ('parse')
+    - the resulting report is assembled from its rows ('report'), written
+      ('html'), read ('read_html') and compared to a report with 1% changed
+      results ('compare')
+    - the time and time per element of each stage and size is printed and
+      returned. If output is given, the results are also written as JSON
+      file, e.g. to be compared to the results of another run by
+      compare_suites().
+    """
+
+    import json
+    import platform
+    import subprocess
+
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=pRoot, universal_newlines=True,
+                                         stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    dResults = {'commit':commit, 'python':platform.python_version(), 'platform':platform.platform(),
+                'started':time.strftime('%Y-%m-%dT%H:%M:%S'), 'batch_size':batch_size, 'results':[]}
+
+    def add(stage, size, dt):
+        dResults['results'].append({'stage':stage, 'size':size, 'time':round(dt, 6), 'per_element':dt/size})
+        print('{:>10} {:8d}: {:.3f} s, {:.2e} s per element'.format(stage, size, dt, dt/size))
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            breadth = max(1, int(round((size/models)**(1/depth))))
+            t0 = time.perf_counter()
+            pLib = _synthetic_library(tmp, size, breadth, depth)
+            print('{:>10} {:8d}: {:.3f} s, {} packages per level'.format('generate', size, time.perf_counter()-t0, breadth))
+
+            trace = moliana.TraceCollector(os.path.join(tmp, 'trace.json'))
+            dm = moliana.DymolaMode(pLib, None, checker_backend=moliana.FakeBackend(), modelica_lib_depth=-1,
+                                    batch_size=batch_size, report_path=tmp, hooks=[trace])
+            rep1 = dm.execute_check()
+
+            dTimes = _phase_times(trace.events)
+            add('walk', size, dTimes['worklist'])
+            add('check', size, dTimes['loop'])
+            add('parse', size, dTimes['parse'])
+
+            lRows = [dict(row) for row in rep1.cont]
+            t0 = time.perf_counter()
+            rep2 = moliana.Report(name='changed', path=tmp, cont=lRows, meta=rep1.meta, disp=rep1.disp)
+            add('report', size, time.perf_counter()-t0)
+
+            t0 = time.perf_counter()
+            rep1.generate_html()
+            add('html', size, time.perf_counter()-t0)
+
+            t0 = time.perf_counter()
+            moliana.Report().read_html(os.path.join(rep1.path, rep1.name + '.html'))
+            add('read_html', size, time.perf_counter()-t0)
+
+            for i, row in enumerate(rep2.cont):
+                if i % 100 == 0:
+                    row['Res'] = 'False'
+            t0 = time.perf_counter()
+            rep2.compare_to(rep1)
+            add('compare', size, time.perf_counter()-t0)
+
+    if output:
+        with open(output, 'w') as file:
+            json.dump(dResults, file, indent=1)
+
+    return dResults
+
+def compare_suites(filepath1, filepath2, ratio=1.2):
+    """
+    Compares the results of two runs of suite() (JSON files) and prints the
+    stages and sizes, which have become slower (second run) by more than given
+    ratio. Their list is returned.
+    """
+
+    import json
+
+    with open(filepath1) as file:
+        dOld = {(res['stage'], res['size']):res['time'] for res in json.load(file)['results']}
+    with open(filepath2) as file:
+        lNew = json.load(file)['results']
+
+    lSlower = []
+    for res in lNew:
+        old = dOld.get((res['stage'], res['size']))
+        if old and res['time'] > ratio*max(old, 1e-3):
+            lSlower.append((res['stage'], res['size'], old, res['time']))
+            print('{:>10} {:8d}: {:.3f} s -> {:.3f} s'.format(res['stage'], res['size'], old, res['time']))
+
+    return lSlower
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        suite(output=sys.argv[1])
+        sys.exit()
+
+    profile_check()
+    load_check()
+    load_check(repeat=5, latency=0.01)
+    load_check(repeat=5, latency=0.01, workers=4)
+    load_check(repeat=5, overhead=0.01)
+    load_check(repeat=5, overhead=0.01, batch_size=-1)
+    compare_scaling()
+    memory_cont()
+    html_generation()
+    html_parsing()
+    bulk_report()
+    matrix_scaling()
+    library_walk()
+    library_index()
+    history_insert()
+    hooks_overhead()
+    import_time()
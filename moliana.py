@@ -29,9 +29,32 @@ This module provides
     Report():
         Representation of results
 
+    ReportMatrix():
+        Comparison of several reports, e.g. of several runs or branches
+
     Converter():
         Converts content of Report instances to HTML files and vice versa
 
+    CheckerBackend(), DdeBackend(), FakeBackend():
+        Backends used by DymolaMode to actually apply checkModel(), i.e.
+        Dymola via DDE or an in-process stand-in without Dymola
+
+    CheckerSession():
+        Keeps checkers running and a library loaded across several checks
+
+    LibraryWalker():
+        Traverses the package tree of a Modelica library
+
+    DependencyIndex():
+        Dependencies between the files of a Modelica library
+
+    ResultHistory():
+        History of the results of several checks in a SQLite database
+
+    TraceCollector():
+        Writes the events of a check (see option 'hooks' of DymolaMode) as a
+        Chrome trace
+
 EXAMPLES:
 Several examples are provided on 'https://github.com/jmoeckel/moliana/wiki/Examples'.
 
@@ -43,13 +66,24 @@ SOFTWARE REQUIREMENTS:
 - This module has been implemented and tested with Python 3.4.3 on a Windows 7
   and Windows 10 platform
 - DymolaMode requires Dymola 2016 or newer.
+- DdeBackend requires pywin32 and thus Windows. All other classes, e.g.
+  Report and Converter, can be used on any platform.
 """
 
 import os;
-import subprocess;
-import win32ui;
-import dde;
 import time;
+import threading;
+import queue;
+import json;
+import re;
+import bisect;
+import heapq;
+import array;
+import collections.abc;
+
+#modules, which are only needed by some classes (e.g. subprocess, sqlite3 and
+#pywin32, which is only available on Windows), are imported on first use, so
+#that Report and Converter can be imported quickly on any platform
 
 ##############################################################################
 class DymolaMode(object):
@@ -68,9 +102,111 @@ class DymolaMode(object):
         Path to a Modelica library
 
     dymola_path(string):
-        Path to the Dymola installation, e.g. dymola.exe
+        Path to the Dymola installation, e.g. dymola.exe. May be None, if
+        a checker_backend is given.
 
     OPTIONAL ATTRIBUTES:
+    checker_backend (CheckerBackend, default=DdeBackend(dymola_path)):
+        Backend, which actually applies checkModel(), e.g. Dymola via DDE or
+        FakeBackend for testing and benchmarking without Dymola.
+
+    session (CheckerSession, default=None):
+        Session, which keeps Dymola (or respectively the checkers) running
+        and the library loaded after execute_check(). If given, its backend
+        is used as checker_backend.
+
+    workers (int, default=1):
+        Number of checker sessions (e.g. Dymola instances), which apply
+        checkModel() in parallel. Each worker is a clone of checker_backend.
+        The packages/models are distributed dynamically over all workers,
+        the order of the results is not affected.
+
+    cache_path (string, default=None):
+        Path to a file, in which results of checkModel() are cached. Only
+        packages/models, whose sources (or the pedantic mode or the checker)
+        have changed since the last check, are checked again. Numbers of
+        cache hits and misses are added to the reports disp attribute.
+
+    cache_size (int, default=10000):
+        Maximum number of packages/models in the cache.
+
+    history_path (string, default=None):
+        Path to a SQLite database (see ResultHistory), to which the results
+        of each check are appended together with branch, commit and timings.
+
+    library_index_path (string, default=None):
+        Path to a file, in which the index of the library tree is persisted
+        (see LibraryWalker). Subsequent checks only read those directories of
+        the library again, which have changed in the meantime.
+
+    git_base_ref (string, default=None):
+        A git reference, e.g. 'master', of the library. If given, only those
+        packages/models are checked, which are affected by files changed since
+        this reference. Results of all other packages/models are copied from
+        baseline_report.
+
+    baseline_report (Report or string, default=None):
+        Report instance (or path to its HTML file) of a complete check of the
+        library at git_base_ref with the same options.
+
+    batch_size (int, default=1):
+        Number of packages/models, which are checked by a single call of the
+        checker (e.g. one script in Dymola), which reduces the overhead of
+        each call. Setting batch_size to '-1' checks all packages/models of a
+        package at once.
+
+    check_timeout (float, default=None):
+        Maximum time in seconds for checkModel() of a single package/model
+        (for batches: times the number of packages/models of the batch). If
+        it expires, a watchdog kills the checker, which is started again and
+        loads the library. The package/model is recorded with the result
+        'Timeout' and the check continues with the next one. Requires a
+        checker backend, which can be killed (see CheckerBackend.kill()).
+
+    checkpoint_path (string, default=None):
+        Path to a file, to which the results are written durably as soon as
+        packages/models are finished, so that an interrupted check (e.g. by a
+        crash of Dymola or a reboot) can be resumed. The file is deleted at the
+        end of the check.
+
+    resume (bool, default=False):
+        If true, the check is resumed from checkpoint_path: packages/models,
+        which have been finished by the interrupted check, are not checked
+        again, but their results are reused. The report is the same as the one
+        of an uninterrupted check. Checkpoints of checks with other options or
+        of a changed library are ignored.
+
+    dependency_path (string, default=None):
+        Path to a file, in which the DependencyIndex of the library is
+        persisted. Dependencies are used by the result cache and checks based
+        on git_base_ref, so that a change of a class also invalidates all
+        packages/models, that depend (transitively) on it.
+
+    progress (callable, default=None):
+        Function, which is called by execute_check() whenever packages/models
+        are finished, e.g. to show the progress of long checks or to stop them
+        early by raising an exception. Its argument is a dictionary, see
+        iter_check().
+
+    hooks (list of callables, default=None):
+        Functions, which are called with an event (dictionary) at the
+        beginning and the end of each phase of the check, e.g. to trace
+        where time goes (see TraceCollector). Without hooks, no events are
+        generated.
+        Keys:
+        'Name' (phase: 'check', 'connect', 'startup', 'load', 'worklist',
+                'dependencies', 'element' (a single package/model) or 'batch'
+                (several packages/models, see batch_size), 'parse' (reading
+                of the log file), 'restart' (see check_timeout), 'cleanup',
+                'history' and 'render')
+        'Phase' ('Begin' or 'End')
+        'Time' (time.monotonic())
+        'Thread' (identifier of the thread, i.e. of the worker)
+        Payload, e.g. 'Path' and 'Level' of packages/models, 'Result',
+        'Errors' and 'Warnings' (int) at the end of 'element' or 'Count' at
+        the end of 'worklist'. 'End' is emitted even if a phase fails, then
+        with the name of the exception as 'Exception'.
+
     dymola_pedantic (bool, default=False):
         If true, checkModel() is executed in pedantic mode
 
@@ -116,6 +252,15 @@ class DymolaMode(object):
     report_colors (dictionary, default={'cTrue':'white','cFalse':'red', 'cNF':'yellow','cErr':'red','cWrn':'yellow'})
         colors attribute of a report instance
 
+    report_timing (bool, default=False):
+        If true, two durations of checkModel() are stored for each
+        package/model: the round-trip time of the call (key 'Time' of the
+        rows of cont, shared equally by all packages/models of a batch),
+        which includes the overhead of DDE, and the duration measured by
+        Dymola itself (key 'CheckerTime', only available for batch_size > 1,
+        otherwise -1). HTML reports get an additional column and a table of
+        the slowest packages/models (both by round-trip time).
+
     For more detailled informations regardings the reports attributes, take a
     look a the documentation of the report class
 
@@ -124,6 +269,10 @@ class DymolaMode(object):
         Applies Dymolas checkModel() on given library (modelica_lib_path) or
         respectively chosen top level package (modelica_lib_firstlevel).
 
+    iter_check():
+        Same as execute_check(), but yields the progress of the check and
+        results of finished packages/models.
+
     get_report():
         Returns the current Report instance.
 
@@ -139,7 +288,12 @@ class DymolaMode(object):
         self._options = ['dymola_pedantic', 'modelica_lib_firstlevel',
                          'modelica_lib_depth', 'git_mode', 'report_path',
                          'report_name', 'report_mode', 'report_disp',
-                         'report_colors']
+                         'report_colors', 'checker_backend', 'workers',
+                         'cache_path', 'cache_size', 'git_base_ref',
+                         'baseline_report', 'dependency_path', 'batch_size',
+                         'session', 'progress', 'history_path',
+                         'library_index_path', 'report_timing', 'hooks',
+                         'check_timeout', 'checkpoint_path', 'resume']
 
         #check if all options are allowed
         _Validator('general_kwargs',kwargs,self._options)
@@ -154,6 +308,22 @@ class DymolaMode(object):
         self.dymola_pedantic = kwargs['dymola_pedantic'] or False
         self.modelica_lib_firstlevel = os.path.join(self.modelica_lib_path, kwargs['modelica_lib_firstlevel'] or '')
         self.modelica_lib_depth =  kwargs['modelica_lib_depth'] or 1
+        self.session = kwargs['session']
+        self.checker_backend = kwargs['checker_backend'] or (self.session.checker_backend if self.session else DdeBackend(self.dymola_path))
+        self.workers = kwargs['workers'] or 1
+        self.cache_path = kwargs['cache_path']
+        self.cache_size = kwargs['cache_size'] or 10000
+        self.git_base_ref = kwargs['git_base_ref']
+        self.baseline_report = kwargs['baseline_report']
+        self.dependency_path = kwargs['dependency_path']
+        self.batch_size = kwargs['batch_size'] or 1
+        self.check_timeout = kwargs['check_timeout']
+        self.checkpoint_path = kwargs['checkpoint_path']
+        self.resume = kwargs['resume'] or False
+        self.progress = kwargs['progress']
+        self.hooks = kwargs['hooks']
+        self.history_path = kwargs['history_path']
+        self.library_index_path = kwargs['library_index_path']
 
         #initialize report attributes
         self.report_name = kwargs['report_name']
@@ -161,13 +331,17 @@ class DymolaMode(object):
         self.report_mode = kwargs['report_mode']
         self.report_colors = kwargs['report_colors']
         self.report_disp = kwargs['report_disp']
+        self.report_timing = kwargs['report_timing'] or False
 
         #additional variables
         self._Report = Report()
-        self._modelica_lib_firstlevel_mosyntax =  self.modelica_lib_firstlevel.replace(os.path.dirname(self.modelica_lib_path)+'\\','').replace('\\','.')
+        self._modelica_lib_firstlevel_mosyntax =  self.modelica_lib_firstlevel.replace(os.path.dirname(self.modelica_lib_path)+os.sep,'').replace(os.sep,'.')
         self._logFP = os.path.join(self.modelica_lib_firstlevel,'checklog.Log')
-        self._ddeServer = None
-        self._ddeConv = None
+        self._backends = []
+        self._cache = None
+        self._dependencies = None
+        self._startup = None
+        self._session = None
 
 
         if self._modelica_lib_firstlevel_mosyntax[-1]=='.':
@@ -177,7 +351,8 @@ class DymolaMode(object):
     ###########################################################################
     def execute_check(self,flag=None):
         """
-        Applies Dymolas checkModel() to chosen packages/models.
+        Applies Dymolas checkModel() to chosen packages/models. If option
+        'progress' is given, it is called after each finished package/model.
 
         ARGUMENTS:
         flag (string, default=None)
@@ -187,28 +362,82 @@ class DymolaMode(object):
         A Report instance, which contains the results of the check.
         """
 
-        #delete old log file (if existing)
-        try:
-            os.remove(self._logFP)
-        except OSError:
-            pass
+        for progress in self.iter_check(flag):
+            if self.progress:
+                self.progress(progress)
 
-        #open Dymola and load Library
-        self._establish_dymola_connection()
+        return self._Report
 
-        #check recursivley the library
-        self._manage_recursive_lib_check(self.modelica_lib_firstlevel,1)
 
-        #fill report element with data from logfile
-        self._fill_report()
+    def iter_check(self,flag=None):
+        """
+        Applies Dymolas checkModel() to chosen packages/models and yields the
+        progress of the check, whenever packages/models are finished. Their
+        results are already added to the current Report instance (see
+        get_report()), whose content is sorted by the order of the library
+        when the check is finished.
 
-        #cleaning up
-        self._cleanUp()
+        ARGUMENTS:
+        flag (string, default=None)
+            If flag is 'html', an HTML report is generated.
 
-        if flag == 'html':
-            self._Report.generate_html()
+        YIELDS:
+        progress (dictionary):
+            Keys:
+            'Rows' (rows of finished packages/models in Report.cont)
+            'Completed' (number of finished packages/models)
+            'Total' (number of all packages/models)
+            'Elapsed' (time in seconds since the start of the check)
+            'ETA' (estimated remaining time in seconds based on the throughput
+                   of the checkers so far, None if nothing was checked yet)
+        """
 
-        return self._Report
+        t0 = time.monotonic()
+        tStart = time.time()
+
+        with _Phase(self.hooks, 'check', Library=self._modelica_lib_firstlevel_mosyntax):
+            #delete old log file (if existing)
+            try:
+                os.remove(self._logFP)
+            except OSError:
+                pass
+
+            #load cached results
+            if self.cache_path:
+                self._cache = _ResultCache(self.cache_path, self.cache_size)
+
+            #open Dymola and load Library
+            self._establish_dymola_connection()
+
+            try:
+                #assemble recursivley all packages/models and check them,
+                #results are added to the report instance as soon as they are
+                #available
+                lWork = self._get_work_list()
+                yield from self._check_work_list(lWork, t0)
+
+            except GeneratorExit:
+                #iteration stopped by the caller
+                self._cleanUp()
+                raise
+
+            except BaseException:
+                #cleaning up, also if the checker failed
+                self._cleanUp(failed=True)
+                raise
+
+            #cleaning up
+            self._cleanUp()
+
+            #append results to the result history
+            if self.history_path:
+                with _Phase(self.hooks, 'history'), ResultHistory(self.history_path) as history:
+                    history.add_run(self._Report, commit=self._get_commit(self.modelica_lib_path), started=tStart,
+                                    duration=round(time.monotonic() - t0, 3), checker=self.checker_backend.version)
+
+            if flag == 'html':
+                with _Phase(self.hooks, 'render', Rows=len(self._Report.cont)):
+                    self._Report.generate_html()
 
 
     def get_report(self):
@@ -226,131 +455,564 @@ class DymolaMode(object):
     ###########################################################################
     def _establish_dymola_connection(self):
         """
-        Establish connection to Dymola and load chosen library.
-        Also parameter 'Advanced.PedanticModelica' is set.
+        Establish connection to Dymola and load chosen library for each
+        worker. Also parameter 'Advanced.PedanticModelica' is set. The time
+        needed is stored in the reports meta data ('startup').
+        If no session is given, a new one is used for this check only.
         """
 
-        #Establish connection
-        self._ddeServer = dde.CreateServer();
-        self._ddeServer.Create("TestClient");
-        self._ddeConv = dde.CreateConversation(self._ddeServer);
+        #a check can only be resumed from a checkpoint
+        assert self.checkpoint_path or not self.resume, \
+            '\n\n => Option \'resume\' requires option \'checkpoint_path\'! <='
+
+        #the watchdog of check_timeout must be able to kill the checker
+        if self.check_timeout:
+            assert type(self.checker_backend).kill is not CheckerBackend.kill, \
+                '\n\n => Option \'check_timeout\' requires a checker backend, which implements kill()! <='
+
+        t0 = time.monotonic()
+        with _Phase(self.hooks, 'connect', Workers=self.workers):
+            self._session = self.session or CheckerSession(self.checker_backend)
+            self._backends = self._session.acquire(self.modelica_lib_path, self.workers, self.hooks)
+
+            try:
+                #activate Modelica pedantic check
+                for backend in self._backends:
+                    backend.set_pedantic(self.dymola_pedantic)
+            except BaseException:
+                self._session.release(failed=True)
+                raise
+
+        self._startup = time.monotonic() - t0
+
+    def _get_work_list(self):
+        """
+        Returns the paths of all to be considered packages/models up to the
+        chosen level of detail (see LibraryWalker).
+        """
+
+        with _Phase(self.hooks, 'worklist') as end:
+            walker = LibraryWalker(self.modelica_lib_path, self.library_index_path)
+            lWork = [pCurEl for pmoCurEl, pCurEl, level, isPck in walker.walk(self.modelica_lib_firstlevel, self.modelica_lib_depth)]
+            walker.save()
+            end['Count'] = len(lWork)
+
+        return lWork
+
+
+    def _check_work_list(self, lWork, t0):
+        """
+        Applies checkModel() to all packages/models of the work list. They are
+        distributed dynamically over all workers. Results are added to the
+        report instance as soon as they are available, at the end they are
+        sorted in order of the work list.
+
+        ARGUMENTS:
+        lWork: paths of all packages/models, which are supposed to be checked
+               by checkModel() (list)
+        t0: start time of the check, given by time.monotonic() (float)
+
+        YIELDS:
+        progress: progress of the check, see iter_check() (dictionary)
+        """
+
+        #result rows of each package/model
+        lResults = [[] for item in lWork]
+
+        #dependencies between files, so that changes also affect dependent
+        #packages/models
+        if self.git_base_ref or self._cache:
+            with _Phase(self.hooks, 'dependencies'):
+                self._dependencies = DependencyIndex(self.modelica_lib_path, self.dependency_path)
+                self._dependencies.update()
+
+        #results of packages/models, which are not affected by changes since
+        #git_base_ref, are copied from the baseline report
+        sCopied = set()
+        if self.git_base_ref:
+            dBaseline = self._get_baseline_rows()
+            lChanged = self._get_changed_files(self.modelica_lib_path, self.git_base_ref)
+            sAffected = self._get_affected(lWork, list(self._dependencies.get_affected_files(lChanged)))
+            for ind, pCurEl in enumerate(lWork):
+                pModel = self._get_mopath(pCurEl)[1]
+                if not ind in sAffected and pModel in dBaseline and dBaseline[pModel].split()[1] != 'Timeout':
+                    lResults[ind] = [dBaseline[pModel]]
+                    sCopied.add(ind)
+
+        #results of an interrupted check are reused
+        checkpoint = self._get_checkpoint(lWork) if self.checkpoint_path else None
+        dResumed = checkpoint.load() if checkpoint and self.resume else {}
+
+        #only packages/models without cached results are checked
+        lKeys = [self._get_cache_key(pCurEl) for pCurEl in lWork] if self._cache else []
+
+        lItems = []
+        for ind, pCurEl in enumerate(lWork):
+            if ind in sCopied:
+                continue
+
+            if ind in dResumed:
+                lResults[ind] = dResumed[ind]
+                continue
+
+            lines = self._cache.get(lKeys[ind]) if self._cache else None
+            if lines is None:
+                lItems.append((ind, pCurEl))
+            else:
+                lResults[ind] = lines
+
+        #report instance without results so far
+        self._fill_report()
 
-        #open Dymola
-        subprocess.Popen(self.dymola_path, stdin=subprocess.PIPE);
-        time.sleep(10);
-        self._ddeConv.ConnectTo("dymola", " ");
+        #results, which are already known
+        lRows = [[] for item in lWork]
+        sChecked = set(ind for ind, pCurEl in lItems)
+        lDone = [ind for ind in range(len(lWork)) if not ind in sChecked]
+        nDone = len(lDone)
+        if lDone:
+            yield self._add_results(lDone, lResults, lRows, nDone, t0, None)
+
+        qWork = queue.Queue()
+        for batch in self._get_batches(lItems):
+            qWork.put(batch)
+
+        #results of the checkers, which are recorded by the checkpoint before
+        #anything else happens - also, if another worker fails
+        record = None
+        if checkpoint:
+            checkpoint.start(dResumed)
+            record = lambda batch: checkpoint.add([ind for ind, pCurEl in batch], lResults)
+
+        tCheck = time.monotonic()
+        args = [(backend, self._get_worker_logFP(i), qWork, lResults) for i, backend in enumerate(self._backends)]
+        try:
+            for batch in self._iter_workers(args, qWork, record):
+                lInds = [ind for ind, pCurEl in batch]
+
+                nDone += len(batch)
+                nChecked = nDone - len(lDone)
+                eta = (time.monotonic() - tCheck) / nChecked * (len(lWork) - nDone)
+                yield self._add_results(lInds, lResults, lRows, nDone, t0, eta)
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+        if self._cache:
+            #timeouts are not cached, they are checked again next time
+            for ind, key in enumerate(lKeys):
+                if not ind in sCopied and not any(line.split()[1] == 'Timeout' for line in lResults[ind]):
+                    self._cache.put(key, lResults[ind])
+            self._cache.save()
+
+        #sort content of the report in order of the work list
+        cont = _Rows(self._Report)
+        for rows in lRows:
+            for row in rows:
+                cont.add(*row)
+        self._Report.cont = cont
+
+        #the check is finished, it is not resumed anymore
+        if checkpoint:
+            checkpoint.close(remove=True)
+
+
+    def _get_checkpoint(self, lWork):
+        """
+        Returns the checkpoint of the check, which is identified by the
+        library, its sources, the work list, the pedantic mode and the
+        checker.
+
+        ARGUMENT:
+        lWork: paths of all packages/models, which are supposed to be checked
+               by checkModel() (list)
+        """
+
+        import hashlib;
 
-        #open library
-        self._ddeConv.Exec("openModel(\"" + os.path.join(self.modelica_lib_path,'package.mo').replace('\\', '/') + "\")");
+        sha = hashlib.sha1('\n'.join(self._get_mopath(pCurEl)[1] for pCurEl in lWork).encode('utf-8'))
+        header = {'library':self._modelica_lib_firstlevel_mosyntax,
+                  'sources':_get_fingerprint(self.modelica_lib_path),
+                  'work':sha.hexdigest(),
+                  'pedantic':self.dymola_pedantic,
+                  'checker':self.checker_backend.version}
 
-        #activate Modelica pedantic check
-        self._ddeConv.Exec("Advanced.PedanticModelica={}".format(str(self.dymola_pedantic).lower()));
+        return _Checkpoint(self.checkpoint_path, header)
 
-    def _manage_recursive_lib_check(self, curPckDP, curLevel):
+
+    def _iter_workers(self, args, qWork, record=None):
         """
-        Recursively assembling paths of all to be considered packages/models up
-        to the chosen level of detail.
+        Runs all workers and yields their finished batches. A single worker
+        runs within the current thread, several workers each in their own
+        thread. If the iteration is stopped or a worker fails, all other
+        workers finish their current batch.
 
         ARGUMENTS:
-        curPckDP: path to a directory, which must be a package, e.g. containing
-                  a file package.order (string)
-        curLevel: Level of curPckDP within the library starting from chosen
-                  TopPackage (int)
+        args: arguments of _run_worker() for each worker (list of tuples)
+        qWork: batches of tuples of index and path of to be checked
+               packages/models (Queue)
+
+        OPTIONAL ARGUMENTS:
+        record: called with each finished batch before it is yielded, also
+                with batches, which are finished after the iteration has
+                been stopped or a worker has failed (callable)
+
+        YIELDS:
+        batch: finished batch of tuples of index and path (list)
         """
 
-        #only check, if it is a package
-        if not os.path.exists(os.path.join(curPckDP,'package.order')):
+        if len(args) == 1:
+            for batch in self._run_worker(*args[0]):
+                if record:
+                    record(batch)
+                yield batch
             return
 
-        with open(os.path.join(curPckDP,'package.order')) as file:
-            lContent = file.read().splitlines();
+        #finished batches and exceptions of the workers, each worker
+        #finishes with None
+        qDone = queue.Queue()
+        def target(*arg):
+            try:
+                for batch in self._run_worker(*arg):
+                    qDone.put(batch)
+            except BaseException as e:
+                qDone.put(e)
+            qDone.put(None)
+
+        threads = [threading.Thread(target=target, args=arg) for arg in args]
+        for thread in threads:
+            thread.start()
+
+        try:
+            nRunning = len(threads)
+            while nRunning:
+                batch = qDone.get()
+                if batch is None:
+                    nRunning -= 1
+                elif isinstance(batch, BaseException):
+                    raise batch
+                else:
+                    if record:
+                        record(batch)
+                    yield batch
+        finally:
+            #stop all workers
+            _clear_queue(qWork)
+            for thread in threads:
+                thread.join()
+
+            #batches, which have been finished meanwhile
+            while record and not qDone.empty():
+                batch = qDone.get_nowait()
+                if isinstance(batch, list):
+                    record(batch)
+
+
+    def _add_results(self, lInds, lResults, lRows, nDone, t0, eta):
+        """
+        Adds results of finished packages/models to the report instance.
+
+        ARGUMENTS:
+        lInds: indices of finished packages/models in the work list (list)
+        lResults: result rows for each index of the work list (list)
+        lRows: parsed result rows for each index of the work list (list)
+        nDone: number of all finished packages/models (int)
+        t0: start time of the check, given by time.monotonic() (float)
+        eta: estimated remaining time in seconds (float)
+
+        RETURNS:
+        progress: progress of the check, see iter_check() (dictionary)
+        """
 
-        #check if max LoD is reached
-        if self.modelica_lib_depth ==-1  or curLevel < self.modelica_lib_depth:
+        cont = self._Report.cont
+        nRows = len(cont)
+        for ind in lInds:
+            lRows[ind] = self._parse_rows(lResults[ind])
+            for row in lRows[ind]:
+                cont.add(*row)
 
-            for elem in lContent:
+        return {'Rows':cont[nRows:],
+                'Completed':nDone,
+                'Total':len(lRows),
+                'Elapsed':time.monotonic() - t0,
+                'ETA':eta}
 
-                #path for filesystem
-                pCurEl = os.path.join(curPckDP,elem)
 
-                #if it is dir/pck -> go one step further,
-                #if not, it is a mo file -> check
-                if os.path.isdir(pCurEl):
-                    self._manage_recursive_lib_check(pCurEl,curLevel+1)
+    def _get_batches(self, lItems):
+        """
+        Splits the to be checked packages/models into batches, which are
+        checked by a single call of the checker.
+
+        ARGUMENT:
+        lItems: tuples of index and path of to be checked packages/models (list)
+
+        RETURNS:
+        lBatches: batches of tuples of index and path (list of lists)
+        """
 
+        if self.batch_size == -1:
+            #one batch per package
+            lBatches = []
+            for item in lItems:
+                if lBatches and os.path.dirname(lBatches[-1][-1][1]) == os.path.dirname(item[1]):
+                    lBatches[-1].append(item)
                 else:
-                    self._executing_dymola_checkModel(pCurEl)
+                    lBatches.append([item])
+            return lBatches
+
+        return [lItems[i:i+self.batch_size] for i in range(0, len(lItems), self.batch_size)]
+
+
+    def _run_worker(self, backend, logFP, qWork, lResults):
+        """
+        Applies checkModel() to batches of packages/models of the work queue
+        until it is empty and yields each finished batch.
+
+        ARGUMENTS:
+        backend: checker backend of the worker (CheckerBackend)
+        logFP: filepath of the log file of the worker (string)
+        qWork: batches of tuples of index and path of to be checked
+               packages/models (Queue)
+        lResults: result rows for each index of the work list (list)
+        """
+
+        pos = 0
+        while True:
+            try:
+                batch = qWork.get_nowait()
+            except queue.Empty:
+                return
+
+            if self.hooks:
+                self._emit_batch(batch, 'Begin')
+
+            try:
+                lFinished, pos = self._check_batch(batch, backend, logFP, pos, qWork, lResults)
+            except BaseException as e:
+                #stop all other workers, too
+                _clear_queue(qWork)
+                if self.hooks:
+                    self._emit_batch(batch, 'End', lResults, Exception=type(e).__name__)
+                raise
+
+            if self.hooks:
+                self._emit_batch(batch, 'End', lResults)
+
+            yield lFinished
+
+
+    def _check_batch(self, batch, backend, logFP, pos, qWork, lResults):
+        """
+        Applies checkModel() to a batch of packages/models and assigns the
+        result rows of the log file to them. If the checker has been killed
+        (see check_timeout), packages/models without results are put back
+        into the work queue, except for the first one, which has timed out.
+
+        ARGUMENTS:
+        batch: tuples of index and path of packages/models (list)
+        backend: checker backend of the worker (CheckerBackend)
+        logFP: filepath of the log file of the worker (string)
+        pos: position in the log file, from which on rows are read (int)
+        qWork: batches of to be checked packages/models (Queue)
+        lResults: result rows for each index of the work list (list)
+
+        RETURNS:
+        lFinished: tuples of index and path of finished packages/models (list)
+        pos: new position in the log file (int)
+        """
+
+        tCall = time.monotonic()
+        expired = self._call_checker(batch, backend, logFP)
+        tCall = time.monotonic() - tCall
+        if expired:
+            self._restart_checker(backend, batch)
+
+        #assign result rows to packages/models by their names, each row gets
+        #its share of the round-trip time followed by the duration measured
+        #by the checker (-1, if not available)
+        with _Phase(self.hooks, 'parse') as end:
+            lines, pos = backend.get_results(logFP, pos)
+            dLines = {}
+            for line in lines:
+                lValues = line.split()
+                line = '{} {:.3f} {}'.format(' '.join(lValues[:4]), tCall/len(batch), lValues[4] if len(lValues) > 4 else -1)
+                dLines.setdefault(lValues[0], []).append(line)
+
+            lFinished = list(batch)
+            if expired:
+                #the first package/model without results has timed out, all
+                #following ones are checked again
+                lMissing = [item for item in batch if not self._get_mopath(item[1])[1] in dLines]
+                if lMissing:
+                    pModel = self._get_mopath(lMissing[0][1])[1]
+                    dLines[pModel] = ['{} Timeout 0 0 {:.3f} -1'.format(pModel, self.check_timeout)]
+                if lMissing[1:]:
+                    qWork.put(lMissing[1:])
+                    lFinished = [item for item in batch if not item in lMissing[1:]]
+
+            for ind, pCurEl in lFinished:
+                lResults[ind] = dLines.get(self._get_mopath(pCurEl)[1], [])
+            end['Rows'] = len(lines)
+
+        return lFinished, pos
+
+
+    def _call_checker(self, batch, backend, logFP):
+        """
+        Applies checkModel() to a batch of packages/models. If check_timeout
+        is given, a watchdog kills the checker as soon as it expires.
+
+        ARGUMENTS:
+        batch: tuples of index and path of packages/models (list)
+        backend: checker backend of the worker (CheckerBackend)
+        logFP: filepath of the log file of the worker (string)
+
+        RETURNS:
+        expired: True, if the checker has been killed (bool)
+        """
+
+        lCurEl = [pCurEl for ind, pCurEl in batch]
+        if not self.check_timeout:
+            self._executing_dymola_checkModel(lCurEl, backend, logFP)
+            return False
+
+        expired = threading.Event()
+        def watchdog():
+            expired.set()
+            backend.kill()
+
+        timer = threading.Timer(self.check_timeout*len(batch), watchdog)
+        timer.daemon = True
+        timer.start()
+        try:
+            self._executing_dymola_checkModel(lCurEl, backend, logFP)
+        except Exception:
+            #a killed checker fails in any way
+            if not expired.is_set():
+                raise
+        finally:
+            #the watchdog might be running right now
+            timer.cancel()
+            timer.join()
+
+        return expired.is_set()
+
+
+    def _restart_checker(self, backend, batch):
+        """
+        Restarts a killed checker of a worker, see option 'check_timeout'.
+
+        ARGUMENTS:
+        backend: checker backend of the worker (CheckerBackend)
+        batch: tuples of index and path of packages/models, which have been
+               checked when the checker was killed (list)
+        """
+
+        with _Phase(self.hooks, 'restart', Paths=[self._get_mopath(pCurEl)[0] for ind, pCurEl in batch]):
+            self._session.restart(backend, self.hooks)
+            backend.set_pedantic(self.dymola_pedantic)
+
+
+    def _emit_batch(self, batch, phase, lResults=None, **payload):
+        """
+        Calls the hooks with an event of a single package/model ('element')
+        or of several ones ('batch'), see option 'hooks'.
+
+        ARGUMENTS:
+        batch: tuples of index and path of packages/models (list)
+        phase: 'Begin' or 'End' (string)
+        lResults: result rows for each index of the work list, given at the
+                  end (list)
+        payload: additional keys of the event, e.g. Exception='CheckerError'
+        """
+
+        def values(ind):
+            #result, number of errors and warnings of the first result row
+            if not lResults[ind]:
+                return {'Result':None, 'Errors':None, 'Warnings':None}
+            res, err, wrn = lResults[ind][0].split()[1:4]
+            return {'Result':res, 'Errors':int(err), 'Warnings':int(wrn)}
+
+        if len(batch) == 1:
+            ind, pCurEl = batch[0]
+            payload.update({'Path':self._get_mopath(pCurEl)[0],
+                            'Level':os.path.relpath(pCurEl, self.modelica_lib_firstlevel).count(os.sep) + 1})
+            if lResults is not None:
+                payload.update(values(ind))
+            _emit(self.hooks, 'element', phase, **payload)
         else:
+            payload['Paths'] = [self._get_mopath(pCurEl)[0] for ind, pCurEl in batch]
+            if lResults is not None:
+                payload['Results'] = [values(ind) for ind, pCurEl in batch]
+            _emit(self.hooks, 'batch', phase, **payload)
 
-            for elem in lContent:
-                self._executing_dymola_checkModel(os.path.join(curPckDP,elem))
 
+    def _get_cache_key(self, pCurEl):
+        """
+        Returns the key of a package/model in the result cache.
 
-    def _executing_dymola_checkModel(self, pCurEl):
+        ARGUMENT:
+        pCurEl: path to a package/model (string)
         """
-        Applied Dymolas checkModel() to a given package/model.
-        Results are written to a .log file (this is executed within Dymola).
+
+        pmoCurEl, pModel = self._get_mopath(pCurEl)
+        return self._cache.get_key(pCurEl, pModel, self.dymola_pedantic, self.checker_backend.version,
+                                   self._dependencies.get_dependencies(pCurEl))
+
+
+    def _get_mopath(self, pCurEl):
+        """
+        Returns the path of a package/model in Modelica syntax (including the
+        library name) and its name in the report.
 
         ARGUMENT:
-        pCurEl: path (using back-slashes) to current package/model that is
-                supposed to be checked by checkModel() (string)
+        pCurEl: path to a package/model (string)
         """
 
-        #path within library in modelica syntax
-        pmoCurEl = pCurEl.replace(os.path.dirname(self.modelica_lib_path)+'\\','').replace('\\','.')
+        pmoCurEl = pCurEl.replace(os.path.dirname(self.modelica_lib_path)+os.sep,'').replace(os.sep,'.')
         pModel = pmoCurEl[pmoCurEl.index('.')+1:]
 
-        #replace \ with / to escape \t,\b etc
-        pathFP = self._logFP.replace('\\','/')
+        return pmoCurEl, pModel
 
-        #actually applying the check and saving the result
-        moCode = ["if bCheck then ",
-                  "s = getLastError(); ",
-                  "indW1 = Modelica.Utilities.Strings.findLast(s,\"WARNING:\"); ",
-                  "if indW1>0 then ",
-                  "indW2 = Modelica.Utilities.Strings.findLast(s,\" warnings were issued\"); ",
-                  "if indW2 >0 then ",
-                  "nWarnings = Modelica.Utilities.Strings.substring(s,indW1+9,indW2-1); ",
-                  "else ",
-                  "nWarnings = \"1\"; "
-                  "end if; ",
-                  "Modelica.Utilities.Streams.print(\"{} True 0 \" + nWarnings,\"{}\"); ".format(pModel, pathFP),
-                  "else ",
-                  "Modelica.Utilities.Streams.print(\"{} True 0 0\",\"{}\"); ".format(pModel, pathFP),
-                  "end if; ",
-                  "else ",
-                  "s = getLastError(); ",
-                  "indE1 = Modelica.Utilities.Strings.findLast(s,\"ERROR:\"); ",
-                  "if indE1>0 then ",
-                  "indE2 = Modelica.Utilities.Strings.findLast(s,\" errors were found\"); ",
-                  "if indE2 >0 then ",
-                  "nErrors = Modelica.Utilities.Strings.substring(s,indE1+7,indE2-1); ",
-                  "else ",
-                  "nErrors = \"1\"; ",
-                  "end if; ",
-                  "indW1 = Modelica.Utilities.Strings.findLast(s,\"WARNING:\"); ",
-                  "indW2 = Modelica.Utilities.Strings.findLast(s,\" warnings were issued\"); ",
-                  "if indW2 >0 then ",
-                  "nWarnings = Modelica.Utilities.Strings.substring(s,indW1+9,indW2-1); ",
-                  "else ",
-                  "nWarnings = \"1\"; "
-                  "end if; ",
-                  "Modelica.Utilities.Streams.print(\"{} False \" + nErrors + \" \" + nWarnings,\"{}\"); ".format(pModel, pathFP),
-                  "else ",
-                  "if Modelica.Utilities.Strings.findLast(s,\"Did not find model\")>0 then ",
-                  "Modelica.Utilities.Streams.print(\"{} Not_found 0 0\",\"{}\"); ".format(pModel, pathFP),
-                  "end if; ",
-                  "end if; ",
-                  "end if; "]
 
-        smoCode =  " ".join("{}".format(row) for row in moCode)
-        self._ddeConv.Exec("bCheck = checkModel(\"{}\"); ".format(pmoCurEl))
-        self._ddeConv.Exec(smoCode)
+    def _get_worker_logFP(self, ind):
+        """
+        Returns the filepath of the log file of a worker.
+
+        ARGUMENT:
+        ind: index of the worker (int)
+        """
+
+        if self.workers == 1:
+            return self._logFP
+
+        return os.path.join(self.modelica_lib_firstlevel,'checklog{}.Log'.format(ind))
+
+
+    def _executing_dymola_checkModel(self, lCurEl, backend, logFP):
+        """
+        Applied Dymolas checkModel() to given packages/models.
+        Results are written to a .log file (this is executed within Dymola).
+
+        ARGUMENT:
+        lCurEl: paths (using back-slashes) to packages/models that are
+                supposed to be checked by checkModel() (list of strings)
+        backend: checker backend, which applies checkModel() (CheckerBackend)
+        logFP: filepath of the log file, the result is written to (string)
+        """
+
+        #paths within library in modelica syntax
+        lItems = [self._get_mopath(pCurEl) for pCurEl in lCurEl]
+
+        if len(lItems) == 1:
+            backend.check_model(lItems[0][0], lItems[0][1], logFP)
+        else:
+            backend.check_models(lItems, logFP)
 
 
     def _fill_report(self):
         """
-        Report instance is filled with all available informations.
+        Report instance is filled with all available informations, except for
+        the results of the check.
         """
 
         #set reports attributes equal to user settings or default values
@@ -367,15 +1029,47 @@ class DymolaMode(object):
                              'ped':self.dymola_pedantic,
                              'lod':self.modelica_lib_depth,
                              'git':self._get_branch(self.modelica_lib_path),
-                             'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes'}
+                             'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes',
+                             'startup':round(self._startup, 3)}
+
+        #reference of a selective check
+        if self.git_base_ref:
+            self._Report.disp = self._Report.disp + [{'Key':'Changes Since', 'Val':self.git_base_ref}]
+
+        #statistics of the result cache
+        if self._cache:
+            self._Report.disp = self._Report.disp + [{'Key':'Cache Hits', 'Val':self._cache.hits},
+                                                     {'Key':'Cache Misses', 'Val':self._cache.misses}]
 
         #replace default colors with user input
         if self.report_colors:
             for key in self.report_colors:
                 self._Report.colors[key] = self.report_colors[key]
 
-        #read content from logfile
-        self._Report.cont = self._read_log(self._logFP)
+        #results are added during the check
+        self._Report.cont = []
+
+    def _get_commit(self,modelica_lib_path):
+        """
+        Get the current commit of the git repository (if the chosen library is
+        actually one).
+
+        ARGUMENTS:
+        modelica_lib_path (string):
+            path of the modelica library.
+
+        RETURNS:
+        commit (string):
+            if modelica_lib_path is a git repository => hash of HEAD
+            else: None
+        """
+
+        import subprocess;
+
+        try:
+            return subprocess.check_output(['git','rev-parse','HEAD'],cwd=modelica_lib_path,universal_newlines=True,stderr=subprocess.DEVNULL).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
 
     def _get_branch(self,modelica_lib_path):
         """
@@ -392,95 +1086,201 @@ class DymolaMode(object):
             else: empty string.
         """
 
-        currentDir = os.getcwd();
-        os.chdir(modelica_lib_path)
+        import subprocess;
+
         try: 
-           s = subprocess.check_output('git branch',universal_newlines=True) 
+           s = subprocess.check_output(['git','branch'],cwd=modelica_lib_path,universal_newlines=True,stderr=subprocess.DEVNULL) 
            
            branch = s[s.find('*')+1:s.find('\n',s.find('*'))].strip()
         except:
            branch = 'no git'
 
-        os.chdir(currentDir)
         return branch
 
 
-    def _read_log(self,logFP):
+    def _get_changed_files(self,modelica_lib_path,ref):
         """
-        Content of .log file is read and returned as a list of dictionaries
+        Get all files of the modelica library, which have been changed (also
+        added, deleted or not yet committed) since a given git reference.
 
-        ARGUMENT:
-        logFP (string):
-            filepath of log file
+        ARGUMENTS:
+        modelica_lib_path (string):
+            path of the modelica library, which must be a git repository.
 
-        RETURN:
-        lst (list of dictionaries):
-            actual results of the check
+        ref (string):
+            git reference, e.g. a branch name or a commit
+
+        RETURNS:
+        lChanged (list of strings):
+            paths of all changed files within modelica_lib_path
         """
 
-        #validate, that logfile exist
-        _Validator('general_filepath','logfile',logFP)
+        import subprocess;
 
-        #read in logfile and save to cont
-        lst = []
-        with open(logFP) as file:
-            for line in file:
-                dic = {}
-                (pck,res,err,wrn) = line.split()
-                dic['Pck']=pck
-                dic['Res']=res.capitalize()
-                dic['Err']=err
-                dic['Wrn']=wrn
+        try:
+            sRoot = subprocess.check_output(['git','rev-parse','--show-toplevel'],cwd=modelica_lib_path,universal_newlines=True,stderr=subprocess.DEVNULL).strip()
+            sDiff = subprocess.check_output(['git','diff','--name-only',ref,'--','.'],cwd=modelica_lib_path,universal_newlines=True,stderr=subprocess.DEVNULL)
+            sNew = subprocess.check_output(['git','ls-files','--others','--exclude-standard','--full-name','.'],cwd=modelica_lib_path,universal_newlines=True,stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            raise ValueError('\n\n => Could not get changes of \'{}\' since git reference \'{}\'! <='.format(modelica_lib_path, ref)) from None
 
-                dic['colPck']= 'white'
-                dic['colRes']='{}'.format(self._Report.colors['cTrue'] if dic['Res']=='True' else self._Report.colors['cFalse'] if dic['Res']=='False' else self._Report.colors['cNF'])
-                dic['colErr']='{}'.format('white' if dic['Err']=='0' else self._Report.colors['cErr'])
-                dic['colWrn']='{}'.format('white' if dic['Wrn']=='0' else self._Report.colors['cWrn'])
+        pLib = os.path.realpath(modelica_lib_path)
 
-                lst.append(dic)
+        lChanged = []
+        for line in (sDiff + sNew).splitlines():
+            if line:
+                rel = os.path.relpath(os.path.realpath(os.path.join(sRoot, line)), pLib)
+                lChanged.append(os.path.join(modelica_lib_path, rel))
 
-        return lst
+        return lChanged
 
 
-    def _cleanUp(self):
-        """
-        Several actions after finishing the library check, e.g. closing Dymola
-        or deleting the temporarily .log file
+    def _get_affected(self, lWork, lChanged):
         """
+        Get all packages/models of the work list, which are affected by
+        changed files, i.e. which contain a changed file or are contained in a
+        package, whose package.mo has been changed.
 
-        #close dymola
-        self._ddeConv.Exec('exit()')
+        ARGUMENTS:
+        lWork (list of strings):
+            paths of all packages/models, which are supposed to be checked
 
-        #shutdown server
-        self._ddeServer.Shutdown()
+        lChanged (list of strings):
+            paths of changed files
 
-        #delete log file
-        try:
-            os.remove(self._logFP)
-        except OSError:
-            pass
+        RETURNS:
+        sAffected (set of ints):
+            indices of all affected packages/models in lWork
+        """
 
+        #all directories, which contain changed files
+        sDirs = set()
+        #all directories, whose package.mo has been changed
+        sPackages = set()
+        for changed in lChanged:
+            if os.path.basename(changed) == 'package.mo':
+                sPackages.add(os.path.dirname(changed))
+
+            changed = os.path.dirname(changed)
+            while changed not in sDirs and len(changed) > len(self.modelica_lib_path):
+                sDirs.add(changed)
+                changed = os.path.dirname(changed)
+
+        sFiles = set(lChanged)
+
+        sAffected = set()
+        for ind, pCurEl in enumerate(lWork):
+            if pCurEl in sDirs or pCurEl + '.mo' in sFiles:
+                sAffected.add(ind)
+                continue
 
-    ###########################################################################
-    #PYTHON-LIKE GETTER AND SETTER METHODS
-    ###########################################################################
-    @property
-    def dymola_path(self):
-        return self.__dymola_path
+            pParent = os.path.dirname(pCurEl)
+            while len(pParent) >= len(self.modelica_lib_path):
+                if pParent in sPackages:
+                    sAffected.add(ind)
+                    break
+                pParent = os.path.dirname(pParent)
 
-    @dymola_path.setter
-    def dymola_path(self,s):
-        _Validator('dymola_path',s)
-        self.__dymola_path = s
+        return sAffected
 
-    @property
-    def dymola_pedantic(self):
-        return self.__dymola_pedantic
 
-    @dymola_pedantic.setter
-    def dymola_pedantic(self,s):
-        _Validator('dymola_pedantic',s)
-        self.__dymola_pedantic = s
+    def _get_baseline_rows(self):
+        """
+        Get the result rows of the baseline report in the format of the log
+        file.
+
+        RETURNS:
+        dic (dictionary):
+            rows for each package/model of the baseline report
+        """
+
+        assert self.baseline_report, '\n\n => A baseline report is required, if \'git_base_ref\' is given! <='
+
+        baseline = self.baseline_report
+        if not isinstance(baseline, Report):
+            baseline = Report()
+            baseline.read_html(self.baseline_report)
+
+        assert baseline.mode == 'full', '\n\n => Baseline report must be a \'full\' report! <='
+        assert baseline.meta['pck'] == self._modelica_lib_firstlevel_mosyntax, '\n\n => Baseline report corresponds to a different Modelica library! <='
+        assert str(baseline.meta['lod']) == str(self.modelica_lib_depth), '\n\n => Baseline report has a different level of detail! <='
+        assert str(baseline.meta['ped']) == str(self.dymola_pedantic), '\n\n => Baseline report corresponds to a different Dymola checkModel() mode! <='
+
+        return {dic['Pck']:'{} {} {} {}'.format(dic['Pck'], dic['Res'], dic['Err'], dic['Wrn']) for dic in baseline.cont}
+
+
+    def _parse_rows(self,lines):
+        """
+        Result rows of the log file are parsed and returned as a list of
+        tuples
+
+        ARGUMENT:
+        lines (list of strings):
+            rows of the log file
+
+        RETURN:
+        lst (list of tuples):
+            name, result, number of errors and warnings, round-trip time and
+            duration measured by the checker in seconds (-1, if not available
+            or report_timing is False) of each row
+        """
+
+        lst = []
+        for line in lines:
+            lValues = line.split()
+            (pck,res,err,wrn) = lValues[:4]
+            dur = float(lValues[4]) if self.report_timing and len(lValues) > 4 else -1
+            durChecker = float(lValues[5]) if self.report_timing and len(lValues) > 5 else -1
+            lst.append((pck, res.capitalize(), int(err), int(wrn), dur, durChecker))
+
+        return lst
+
+
+    def _cleanUp(self, failed=False):
+        """
+        Several actions after finishing the library check, e.g. closing Dymola
+        or deleting the temporarily .log file
+
+        OPTIONAL ARGUMENT:
+        failed: True, if the check failed. Then also checkers of a session
+                are closed (bool)
+        """
+
+        with _Phase(self.hooks, 'cleanup', Failed=failed):
+            #close dymola and the connection of each worker - unless they are
+            #part of a session, which is still in use
+            self._backends = []
+            self._session.release(failed or self._session is not self.session)
+            self._session = None
+
+            #delete log files
+            for logFP in [self._logFP] + [self._get_worker_logFP(i) for i in range(self.workers)]:
+                try:
+                    os.remove(logFP)
+                except OSError:
+                    pass
+
+
+    ###########################################################################
+    #PYTHON-LIKE GETTER AND SETTER METHODS
+    ###########################################################################
+    @property
+    def dymola_path(self):
+        return self.__dymola_path
+
+    @dymola_path.setter
+    def dymola_path(self,s):
+        _Validator('dymola_path',s)
+        self.__dymola_path = s
+
+    @property
+    def dymola_pedantic(self):
+        return self.__dymola_pedantic
+
+    @dymola_pedantic.setter
+    def dymola_pedantic(self,s):
+        _Validator('dymola_pedantic',s)
+        self.__dymola_pedantic = s
 
     @property
     def modelica_lib_path(self):
@@ -545,6 +1345,15 @@ class DymolaMode(object):
         _Validator('report_disp',lst)
         self.__report_disp = lst
 
+    @property
+    def report_timing(self):
+        return self.__report_timing
+
+    @report_timing.setter
+    def report_timing(self,s):
+        _Validator('report_timing',s)
+        self.__report_timing = s
+
     @property
     def report_colors(self):
         return self.__report_colors
@@ -554,6 +1363,150 @@ class DymolaMode(object):
         _Validator('report_colors',dic)
         self.__report_colors = dic
 
+    @property
+    def workers(self):
+        return self.__workers
+
+    @workers.setter
+    def workers(self,n):
+        _Validator('workers',n)
+        self.__workers = n
+
+    @property
+    def cache_path(self):
+        return self.__cache_path
+
+    @cache_path.setter
+    def cache_path(self,s):
+        _Validator('cache_path',s)
+        self.__cache_path = s
+
+    @property
+    def cache_size(self):
+        return self.__cache_size
+
+    @cache_size.setter
+    def cache_size(self,n):
+        _Validator('cache_size',n)
+        self.__cache_size = n
+
+    @property
+    def git_base_ref(self):
+        return self.__git_base_ref
+
+    @git_base_ref.setter
+    def git_base_ref(self,s):
+        _Validator('git_base_ref',s)
+        self.__git_base_ref = s
+
+    @property
+    def baseline_report(self):
+        return self.__baseline_report
+
+    @baseline_report.setter
+    def baseline_report(self,rep):
+        _Validator('baseline_report',rep)
+        self.__baseline_report = rep
+
+    @property
+    def dependency_path(self):
+        return self.__dependency_path
+
+    @dependency_path.setter
+    def dependency_path(self,s):
+        _Validator('dependency_path',s)
+        self.__dependency_path = s
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+    @batch_size.setter
+    def batch_size(self,n):
+        _Validator('batch_size',n)
+        self.__batch_size = n
+
+    @property
+    def check_timeout(self):
+        return self.__check_timeout
+
+    @check_timeout.setter
+    def check_timeout(self,t):
+        _Validator('check_timeout',t)
+        self.__check_timeout = t
+
+    @property
+    def checkpoint_path(self):
+        return self.__checkpoint_path
+
+    @checkpoint_path.setter
+    def checkpoint_path(self,s):
+        _Validator('checkpoint_path',s)
+        self.__checkpoint_path = s
+
+    @property
+    def resume(self):
+        return self.__resume
+
+    @resume.setter
+    def resume(self,b):
+        _Validator('resume',b)
+        self.__resume = b
+
+    @property
+    def progress(self):
+        return self.__progress
+
+    @progress.setter
+    def progress(self,func):
+        _Validator('progress',func)
+        self.__progress = func
+
+    @property
+    def hooks(self):
+        return self.__hooks
+
+    @hooks.setter
+    def hooks(self,lst):
+        _Validator('hooks',lst)
+        self.__hooks = lst
+
+    @property
+    def history_path(self):
+        return self.__history_path
+
+    @history_path.setter
+    def history_path(self,s):
+        _Validator('history_path',s)
+        self.__history_path = s
+
+    @property
+    def library_index_path(self):
+        return self.__library_index_path
+
+    @library_index_path.setter
+    def library_index_path(self,s):
+        _Validator('library_index_path',s)
+        self.__library_index_path = s
+
+    @property
+    def session(self):
+        return self.__session
+
+    @session.setter
+    def session(self,session):
+        _Validator('session',session)
+        self.__session = session
+
+    @property
+    def checker_backend(self):
+        return self.__checker_backend
+
+    @checker_backend.setter
+    def checker_backend(self,backend):
+        _Validator('checker_backend',backend)
+        self.__checker_backend = backend
+
 
 class Report(object):
     """
@@ -578,7 +1531,14 @@ class Report(object):
         Content of the report, so the actual results of the check including
         color informations for each result.
         Mandatory keys: 'Pck', 'Res', 'Err', 'Wrn'
+        Optional keys: 'Time' (round-trip time of the check in seconds as
+        float), 'CheckerTime' (duration measured by the checker in seconds
+        as float, -1 if not available)
         Example: cont = [{'Pck':Lib, 'Res':'True', 'Err':'9', 'Wrn':'2'}]
+        Rows are stored in a compact, column-oriented way, but still can be
+        accessed like dictionaries, e.g. cont[0]['Err']. Colors ('colPck',
+        'colRes', 'colErr', 'colWrn' and 'colTime') are derived from attribute
+        colors, unless they have been set explicitly.
 
     mode (string, default=None):
         Either an HTML report only contains the name of the package/model and
@@ -594,6 +1554,8 @@ class Report(object):
             'ped' (Dymola checkModel() mode)
             'lod' (level of detail)
             'viewport' (viewoptions for html)
+        Optional keys (not stored in the <meta> tags of HTML reports):
+            'startup' (time in seconds to start the checker and load the library)
 
     colors (dictionary, default= {'cTrue':'white','cFalse':'red', 'cNF':'yellow','cErr':'red','cWrn':'yellow'})
         Background colors of cells in the HTML report.
@@ -603,6 +1565,9 @@ class Report(object):
             'cNF' (cells in the result-column, which contain the keyword 'Not found')
             'cErr' (cells in the errors-column, which have entries greater than 0)
             'cWrn' (cells in the warnings-column, which have entries greater than 0)
+        Optional keys:
+            'cTO' (cells in the result-column, which contain the keyword
+                   'Timeout', default='orange')
 
 
     API:
@@ -618,11 +1583,21 @@ class Report(object):
         If filepath is not given, this reports name and path are checked for a
         HTML file.
 
-    compare_to(rep2):
+    compare_to(rep2, time_ratio=None, time_key='Time'):
         Results of this report instance are compared to results of report
         instance rep2. Both report instances must correspond to the same
         library, the same level of detail and the same dymola checkModel()
-        mode.
+        mode. Packages/models are matched by their names, added and removed
+        ones are highlighted, too. If time_ratio is given, also durations of
+        the check (given by time_key) are compared.
+
+    get_slowest(n=10, time_key='Time'):
+        Returns the n packages/models with the longest durations of the
+        check (given by time_key).
+
+    set_cont(cont, trusted=False):
+        Sets the content like attribute cont. Trusted content (e.g. generated
+        by moliana itself) is neither validated nor copied.
 
     For more details take a look at the module itsself
     """
@@ -640,18 +1615,19 @@ class Report(object):
              if not option in kwargs:
                  kwargs[option] = None
 
-        #set default values
+        #set default values (colors first, as colors of cont are derived
+        #from them)
+        self.colors = kwargs['colors'] or {'cTrue':'white',
+                                           'cFalse':'red',
+                                           'cNF':'yellow',
+                                           'cErr':'red',
+                                           'cWrn':'yellow'}
         self.name = kwargs['name']
         self.path = kwargs['path']
         self.disp = kwargs['disp']
         self.cont = kwargs['cont']
         self.mode = kwargs['mode']
         self.meta = kwargs['meta']
-        self.colors = kwargs['colors'] or {'cTrue':'white',
-                                           'cFalse':'red',
-                                           'cNF':'yellow',
-                                           'cErr':'red',
-                                           'cWrn':'yellow'}
 
 
     #PUBLIC API
@@ -685,12 +1661,12 @@ class Report(object):
         self.name = name
         self.path = path
         self.disp = disp
-        self.cont = cont
+        self.set_cont(cont, trusted=True)
         self.meta = meta
         self.mode = mode
 
 
-    def compare_to(self,rep2):
+    def compare_to(self,rep2,time_ratio=None,time_key='Time'):
         """
         Compares this Report instance to the the instance rep2. An HTML is
         generated, which have the same layout as the usual HTML report, but
@@ -700,70 +1676,227 @@ class Report(object):
         If the result is worse, the cell's background color is set to red.
         If there is no change, cell's background color remains white.
 
+        Packages/models, which do not exist in rep2, are highlighted in light
+        blue. Packages/models, which only exist in rep2, are inserted with the
+        result 'Removed' and a light grey background color.
+
         The new report has an additonal information, to which instance it has
-        been compared.
+        been compared, and the numbers of added and removed packages/models.
 
         ARGUMENTS:
         rep2 (Report):
             A Report instance, which is compare to the self instance
 
+        OPTIONAL ARGUMENTS:
+        time_ratio (float, default=None):
+            If given, durations of the check (see time_key) are compared,
+            too: If a package/model took more than time_ratio times as long
+            as in rep2, the cell's background color is set to red, if it took
+            less than 1/time_ratio times as long, it is set to green.
+            Packages/models without the duration in one of the reports are
+            not compared.
+
+        time_key (string, default='Time'):
+            Compared durations, i.e. key of cont: 'Time' (round-trip time) or
+            'CheckerTime' (duration measured by the checker), see option
+            report_timing of DymolaMode
+
         RETURNS:
         A HTML file is generated which displays the results of the comparison.
         The filename is '[self.name]_compare.html'
+
+        dic (dictionary):
+            Names of added ('Added') and removed ('Removed') packages/models
+            and, if time_ratio is given, of packages/models, whose check
+            became slower ('Slower')
         """
 
         #ensure, that rep2 is a valid report instance
         _Validator('report',rep2)
         _Validator('report_compare',self,rep2)
+        _Validator('time_ratio',time_ratio)
+        _Validator('time_key',time_key)
 
         rep1 = self
-        for dic1 in rep1.cont:
-            pck = dic1['Pck']
-            dic2 = next((item for item in rep2.cont if item['Pck'] == pck),None)
+        cont1 = rep1.cont
+        cont2 = rep2.cont
+        dIndex1 = rep1._get_index()
+        dIndex2 = rep2._get_index()
+
+        lAdded = []
+        lSlower = []
+        for ind1, pck in enumerate(cont1._iter_names()):
+            ind2 = dIndex2.get(pck)
 
-            if dic2 == None:
+            if ind2 == None:
                 #pck does not exist in rep2
+                cont1._set(ind1,'colPck','lightblue')
+                lAdded.append(pck)
                 continue
 
-            if not dic1['Res']==dic2['Res']:
-                if dic1['Res']=='True':
-                    dic1['colRes']='green'
-                elif dic1['Res']=='False':
-                    dic1['colRes']='red'
+            res1 = cont1._lRes[cont1._res[ind1]]
+            if not res1==cont2._lRes[cont2._res[ind2]]:
+                if res1=='True':
+                    cont1._set(ind1,'colRes','green')
+                elif res1=='False':
+                    cont1._set(ind1,'colRes','red')
                 else:
-                    dic1['colRes']='yellow'
+                    cont1._set(ind1,'colRes','yellow')
             else:
-                dic1['colRes']='white'
+                cont1._set(ind1,'colRes','white')
 
 
             if rep1.mode=='full':
-                nWrn1 = int(dic1['Wrn'])
-                nWrn2 = int(dic2['Wrn'])
-                nErr1 = int(dic1['Err'])
-                nErr2 = int(dic2['Err'])
+                nWrn1 = cont1._wrn[ind1]
+                nWrn2 = cont2._wrn[ind2]
+                nErr1 = cont1._err[ind1]
+                nErr2 = cont2._err[ind2]
 
                 if nWrn1>nWrn2:
-                    dic1['colWrn']='red'
+                    cont1._set(ind1,'colWrn','red')
                 elif nWrn1<nWrn2:
-                    dic1['colWrn']='green'
+                    cont1._set(ind1,'colWrn','green')
                 else:
-                    dic1['colWrn']='white'
+                    cont1._set(ind1,'colWrn','white')
 
                 if nErr1>nErr2:
-                    dic1['colErr']='red'
+                    cont1._set(ind1,'colErr','red')
                 elif nErr1<nErr2:
-                    dic1['colErr']='green'
+                    cont1._set(ind1,'colErr','green')
                 else:
-                    dic1['colErr']='white'
+                    cont1._set(ind1,'colErr','white')
+
+            tCheck1 = cont1._get_time(ind1, time_key)
+            tCheck2 = cont2._get_time(ind2, time_key)
+            if time_ratio and tCheck1>=0 and tCheck2>=0:
+                #durations are given in seconds, durations below 1 ms are
+                #compared as 1 ms
+                if tCheck1>time_ratio*max(tCheck2,0.001):
+                    cont1._set(ind1,'colTime','red')
+                    lSlower.append(pck)
+                elif max(tCheck1,0.001)*time_ratio<tCheck2:
+                    cont1._set(ind1,'colTime','green')
+                else:
+                    cont1._set(ind1,'colTime','white')
+
+        #packages/models, which do not exist anymore, are inserted after their
+        #predecessor in rep2
+        lRemoved = []
+        dRemoved = {}
+        prev = None
+        for ind2, pck in enumerate(cont2._iter_names()):
+            if pck in dIndex1:
+                prev = pck
+            else:
+                lRemoved.append(pck)
+                dRemoved.setdefault(prev, []).append(dict(cont2[ind2], Res='Removed', colPck='lightgrey', colRes='lightgrey',
+                                                          colErr='lightgrey', colWrn='lightgrey', colTime='lightgrey'))
+
+        if lRemoved:
+            cont = _Rows(rep1, dRemoved.get(None, []))
+            for ind1, pck in enumerate(cont1._iter_names()):
+                cont._add_row(cont1, ind1)
+                cont.extend(dRemoved.get(pck, []))
+            rep1.cont = cont
 
         if rep1.meta['git'] == rep2.meta['git']:
             rep1.disp.append({'Key':'Compared to', 'Val': rep2.name})
         else:
              rep1.disp.append({'Key':'Compared to', 'Val': rep2.meta['git']})
 
+        if lAdded:
+            rep1.disp.append({'Key':'Added', 'Val': len(lAdded)})
+        if lRemoved:
+            rep1.disp.append({'Key':'Removed', 'Val': len(lRemoved)})
+
+        if lSlower:
+            rep1.disp.append({'Key':'Slower', 'Val': len(lSlower)})
+
         rep1.name = '{}_compare'.format(rep1.name)
         rep1.generate_html()
 
+        dic = {'Added':lAdded, 'Removed':lRemoved}
+        if time_ratio:
+            dic['Slower'] = lSlower
+
+        return dic
+
+
+    def get_slowest(self, n=10, time_key='Time'):
+        """
+        Returns the packages/models with the longest durations of the check.
+
+        OPTIONAL ARGUMENTS:
+        n (int, default=10):
+            maximum number of returned packages/models
+
+        time_key (string, default='Time'):
+            durations, i.e. key of cont: 'Time' (round-trip time) or
+            'CheckerTime' (duration measured by the checker)
+
+        RETURNS:
+        lst (list of tuples):
+            name and duration in seconds of each package/model, in descending
+            order of their durations
+        """
+
+        _Validator('time_key',time_key)
+
+        cont = self.cont
+        if not cont:
+            return []
+
+        return [(cont._get(ind, 'Pck'), cont._get_time(ind, time_key)) for ind in cont._get_slowest(n, time_key)]
+
+
+    def set_cont(self, cont, trusted=False):
+        """
+        Sets the content of the report, like assigning attribute cont.
+
+        ARGUMENTS:
+        cont (list of dictionaries or rows of another report)
+
+        OPTIONAL ARGUMENTS:
+        trusted (bool, default=False):
+            If true, cont is not validated and rows of another report with the
+            same colors are taken over instead of being copied, so that large
+            reports are assembled without touching each row twice. Use it for
+            content, which has been generated by moliana itself, and do not
+            use cont otherwise afterwards.
+        """
+
+        if not trusted:
+            _Validator('report_cont',cont)
+
+        if cont is None or (isinstance(cont,_Rows) and cont._report is self):
+            self.__cont = cont
+        elif isinstance(cont,_Rows) and cont._report.colors == self.colors:
+            #colors are derived in the same way, so columns can be reused
+            if trusted:
+                cont._report = self
+                self.__cont = cont
+            else:
+                self.__cont = cont._copy(self)
+        else:
+            self.__cont = _Rows(self,cont)
+        self._index = None
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _get_index(self):
+        """
+        Returns a dictionary, which maps the name of each package/model to the
+        index of its row in cont. The index is only built again, if cont has
+        been set or names of its rows have been added or changed since the
+        last call.
+        """
+
+        if self._index is None or self._index[0] != self.cont._changes:
+            self._index = (self.cont._changes, {pck:ind for ind, pck in enumerate(self.cont._iter_names())})
+
+        return self._index[1]
+
 
     ###########################################################################
     #PYTHON-LIKE GETTER AND SETTER METHODS
@@ -801,8 +1934,7 @@ class Report(object):
 
     @cont.setter
     def cont(self,lst):
-        _Validator('report_cont',lst)
-        self.__cont = lst
+        self.set_cont(lst)
 
     @property
     def mode(self):
@@ -823,6 +1955,276 @@ class Report(object):
         self.__meta = dic
 
 
+class ReportMatrix(object):
+    """
+    Returns a new ReportMatrix instance.
+
+    Comparison of several reports of the same library, e.g. of several runs
+    or branches. All packages/models are aligned by their names in a single
+    matrix (in order of their first appearance) and the result of each
+    report is compared to a reference report. Given reports are not changed.
+
+    States of a package/model in a report compared to the reference:
+        'Regression': result changed to something else than 'True', or
+                      the result is the same and errors/warnings increased
+        'Improvement': result changed to 'True', or the result is the same
+                       and errors/warnings decreased
+        'Changed': any other change (e.g. from 'False' to 'Not_found')
+        'Unchanged', 'Added', 'Removed'
+
+    ATTRIBUTES:
+    reports (list of Reports):
+        At least two reports, which correspond to the same library, level of
+        detail and checkModel() mode.
+
+    OPTIONAL ATTRIBUTES:
+    reference (string, default='first'):
+        Each report is compared to the 'first' report or to the 'previous'
+        one.
+
+    labels (list of strings, default=[names of the reports]):
+        Column headers of the reports.
+
+    name (string, default='matrix'):
+        Name of the HTML file (without file extension).
+
+    path (string, default=[path of the first report]):
+        Path to the directory, where the HTML file is stored.
+
+    API:
+    get_names():
+        Returns the names of all packages/models.
+
+    get_results(name):
+        Returns the result, errors and warnings of a package/model in each
+        report.
+
+    get_deltas(name):
+        Returns the state and the changes of a package/model in each report.
+
+    get_summary():
+        Returns the numbers of regressions, improvements, ... of each report.
+
+    generate_html():
+        Generates an HTML file, which contains the summary and the matrix.
+
+    For more details take a look at the module itsself
+    """
+
+    _states = ['Unchanged', 'Changed', 'Regression', 'Improvement', 'Added', 'Removed']
+
+    #background colors of the states
+    _colors = {'Unchanged':'white', 'Changed':'yellow', 'Regression':'red', 'Improvement':'green',
+               'Added':'lightblue', 'Removed':'lightgrey'}
+
+    def __init__(self, reports, reference='first', labels=None, name='matrix', path=None):
+
+        assert isinstance(reports, (list, tuple)) and len(reports) > 1, '\n\n => \'reports\' must be a list of at least two reports! <='
+        for rep in reports:
+            _Validator('report', rep)
+            _Validator('report_compare', reports[0], rep)
+        assert reference in ('first', 'previous'), '\n\n => Value of \'reference\' must be either \'first\' or \'previous\', but is \'{}\'! <='.format(reference)
+        assert labels is None or len(labels) == len(reports), '\n\n => \'labels\' must have one entry for each report! <='
+        _Validator('report_name', name)
+
+        self.reports = list(reports)
+        self.reference = reference
+        self.labels = list(labels or [rep.name for rep in reports])
+        self.name = name
+        self.path = path if path is not None else reports[0].path
+
+        #index of each package/model in the matrix
+        self._dIndex = {}
+        self._names = []
+        for rep in self.reports:
+            for pck in self._get_cont(rep)._iter_names():
+                if not pck in self._dIndex:
+                    self._dIndex[pck] = len(self._names)
+                    self._names.append(pck)
+
+        #columns of each report: result codes (index of _lRes, -1 if the
+        #package/model does not exist), errors and warnings (-1, if not given)
+        self._lRes = []
+        self._res = []
+        self._err = []
+        self._wrn = []
+        for rep in self.reports:
+            cont = self._get_cont(rep)
+            for result in cont._lRes:
+                if not result in self._lRes:
+                    self._lRes.append(result)
+            lCodes = [self._lRes.index(result) for result in cont._lRes]
+
+            res = array.array('h', [-1]) * len(self._names)
+            err = array.array('l', [-1]) * len(self._names)
+            wrn = array.array('l', [-1]) * len(self._names)
+            for ind, pck in enumerate(cont._iter_names()):
+                i = self._dIndex[pck]
+                res[i] = lCodes[cont._res[ind]]
+                err[i] = cont._err[ind]
+                wrn[i] = cont._wrn[ind]
+            self._res.append(res)
+            self._err.append(err)
+            self._wrn.append(wrn)
+
+
+    #PUBLIC API
+    ###########################################################################
+    def get_names(self):
+        """
+        Returns the names of all packages/models (list of strings).
+        """
+
+        return list(self._names)
+
+    def get_results(self, name):
+        """
+        Returns the results of a package/model.
+
+        ARGUMENTS:
+        name (string): name of the package/model
+
+        RETURNS:
+        lResults (list):
+            tuple (result, errors, warnings) for each report, errors and
+            warnings are None in mode 'compact'. None, if the package/model
+            does not exist in a report.
+        """
+
+        ind = self._dIndex[name]
+        return [self._get_result(i, ind) for i in range(len(self.reports))]
+
+    def get_deltas(self, name):
+        """
+        Returns the changes of a package/model compared to the reference.
+
+        ARGUMENTS:
+        name (string): name of the package/model
+
+        RETURNS:
+        lDeltas (list):
+            dictionary for each report with the keys 'State', 'Res' (result of
+            the reference, if the result has changed, else None), 'Err' and
+            'Wrn' (differences of the numbers of errors and warnings, None if
+            not available). None for the reference itself.
+        """
+
+        ind = self._dIndex[name]
+
+        lDeltas = []
+        for i in range(len(self.reports)):
+            ref = self._get_reference(i)
+            if ref is None:
+                lDeltas.append(None)
+                continue
+
+            res0, err0, wrn0 = self._get_result(ref, ind) or (None, None, None)
+            res1, err1, wrn1 = self._get_result(i, ind) or (None, None, None)
+            lDeltas.append({'State':self._states[self._get_state(ref, i, ind)],
+                            'Res':res0 if res0 != res1 else None,
+                            'Err':err1 - err0 if err0 is not None and err1 is not None else None,
+                            'Wrn':wrn1 - wrn0 if wrn0 is not None and wrn1 is not None else None})
+
+        return lDeltas
+
+    def get_summary(self):
+        """
+        Returns a summary of the changes of each report compared to its
+        reference.
+
+        RETURNS:
+        lSummary (list of dictionaries):
+            for each report the keys 'Label', 'Reference' (label of the
+            reference, None for the reference itself), the numbers of all
+            states (e.g. 'Regression') and the sums of the differences of
+            errors and warnings ('Err', 'Wrn').
+        """
+
+        lSummary = []
+        for i in range(len(self.reports)):
+            dic = dict({state:0 for state in self._states}, Label=self.labels[i], Reference=None, Err=0, Wrn=0)
+
+            ref = self._get_reference(i)
+            if ref is not None:
+                dic['Reference'] = self.labels[ref]
+                nStates = [0] * len(self._states)
+                err0, err1, wrn0, wrn1 = self._err[ref], self._err[i], self._wrn[ref], self._wrn[i]
+                for ind in range(len(self._names)):
+                    nStates[self._get_state(ref, i, ind)] += 1
+                    if err0[ind] >= 0 and err1[ind] >= 0:
+                        dic['Err'] += err1[ind] - err0[ind]
+                        dic['Wrn'] += wrn1[ind] - wrn0[ind]
+                dic.update(zip(self._states, nStates))
+
+            lSummary.append(dic)
+
+        return lSummary
+
+    def generate_html(self):
+        """
+        Generates an HTML file, which contains the summary and the matrix.
+        Cells are colored by the state of the package/model. Files location
+        is given by name and path.
+        """
+
+        conv = Converter()
+        conv.matrix_to_html(self)
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _get_cont(self, rep):
+        return rep.cont if rep.cont is not None else _Rows(rep)
+
+    def _get_reference(self, i):
+        """
+        Returns the index of the reference of the i-th report (None, if it is
+        the reference itself).
+        """
+
+        if i == 0:
+            return None
+
+        return 0 if self.reference == 'first' else i - 1
+
+    def _get_result(self, i, ind):
+        code = self._res[i][ind]
+        if code < 0:
+            return None
+
+        err = self._err[i][ind]
+        wrn = self._wrn[i][ind]
+        return (self._lRes[code], err if err >= 0 else None, wrn if wrn >= 0 else None)
+
+    def _get_state(self, ref, i, ind):
+        """
+        Returns the state (index of _states) of a package/model in the i-th
+        report compared to the report ref.
+        """
+
+        res0 = self._res[ref][ind]
+        res1 = self._res[i][ind]
+
+        if res0 < 0:
+            return 0 if res1 < 0 else 4
+        if res1 < 0:
+            return 5
+
+        if res0 != res1:
+            #code of 'True' is 0
+            return 3 if res1 == 0 else 2 if res0 == 0 else 1
+
+        err0, err1 = self._err[ref][ind], self._err[i][ind]
+        wrn0, wrn1 = self._wrn[ref][ind], self._wrn[i][ind]
+        if err0 < 0 or err1 < 0 or (err0 == err1 and wrn0 == wrn1):
+            return 0
+        if err1 >= err0 and wrn1 >= wrn0:
+            return 2
+        if err1 <= err0 and wrn1 <= wrn0:
+            return 3
+        return 1
+
+
 class Converter(object):
     """
     Returns a new Converter instance.
@@ -830,8 +2232,9 @@ class Converter(object):
     Instance converts content of Report instances to different file formats.
 
     API:
-    report_to_html(report):
-        Generates a HTML file based on Report instance 'report'
+    report_to_html(report, rows=None):
+        Generates a HTML file based on Report instance 'report'. Rows may
+        also be given by an iterator, e.g. while a check is still running.
 
     html_to_report(html):
         Transfers content of the HTML-file 'html' into a Report instance.
@@ -840,30 +2243,110 @@ class Converter(object):
         Same as html_to_report, but does not return a Report instance but its
         attributes
 
+    matrix_to_html(matrix):
+        Generates a HTML file based on ReportMatrix instance 'matrix'.
+
+    HTML reports contain all data of the report additionally as JSON (see
+    _dataSchema), which is used, when a report is read. Reports without
+    such data (e.g. of previous versions) are parsed as HTML.
+
     For more details take a look at the module itsself
     """
 
+    #keys of Report.meta, which are stored as <meta> tags
+    _htmlMeta = ['git','lod','pck','ped','viewport']
+
+    #CSS rules of HTML reports (background colors are added)
+    _htmlStyle = ['table.disp {margin-bottom: 2em; margin-left: 2em}',
+                  'table.cont {margin-left: 2em}',
+                  'th, table.cont td {padding-right: 1em; padding-left: 1em; text-align: center}',
+                  'td.key {padding-left: 1em; text-align: right}',
+                  'td.val {padding-left: 1em}',
+                  'table.cont td:first-child {text-align: left}']
+
+    #background colors, which are always defined as CSS classes
+    _htmlColors = ['white','red','green','yellow','lightblue','lightgrey']
+
+    #size of the buffer, when HTML reports are written
+    _bufferSize = 1024*1024
+
+    #number of packages/models in the table of the slowest ones
+    _htmlSlowest = 10
+
+    #table cell of HTML reports, e.g. '<td id="Err" class="bg-red">3</td>'
+    _htmlCell = re.compile(r'<td id="(\w+)"([^>]*)>(.*)</td>$')
+
+    #row of the results table, errors and warnings only exist in mode 'full',
+    #durations only in reports with durations (see Report.get_slowest())
+    _htmlRow = re.compile(r'\s*<tr>\s*<td id="Pck"([^>]*)>([^<]*)</td>\s*<td id="Res"([^>]*)>([^<]*)</td>\s*'
+                          r'(?:<td id="Err"([^>]*)>(\d+)</td>\s*<td id="Wrn"([^>]*)>(\d+)</td>\s*)?'
+                          r'(?:<td id="Time"([^>]*)>(\d+\.\d+|)</td>\s*)?</tr>')
+
+    #table of the slowest packages/models, which follows the results table
+    _htmlSlowestTable = re.compile(r'\s*<table class="cont slowest".*?</table>', re.DOTALL)
+
+    #version of the report data, which is embedded into HTML reports as JSON:
+    #{"schema": 1, "mode": ..., "meta": {...}, "disp": [...], "colors": {...},
+    # "rows": [[Pck, Res, Err, Wrn], ...]}
+    #Err and Wrn are only given in mode 'full'. Durations are given after Wrn
+    #(with Err and Wrn -1 in mode 'compact'), e.g. ["L1Pck1", "True", 0, 0, 1.5],
+    #followed by the duration measured by the checker, if available, e.g.
+    #["L1Pck1", "True", 0, 0, 1.5, 0.8].
+    #Colors of a row, which differ from the ones derived from "colors", are
+    #given by an additional object, e.g. ["L1Pck1", "True", 0, 0, {"colPck": "lightblue"}].
+    _dataSchema = 1
+
+    #last line of HTML reports, which gives the position of the report data
+    _dataFooter = '<!-- report-data: {} -->'
+    _dataFooterPattern = re.compile(r'<!-- report-data: (\d+) -->\s*$')
+    _dataTag = '\n\t\t<script type="application/json" id="report-data">\n'
+
     def __init__(self):
         pass
 
 
     #PUBLIC API
     ###########################################################################
-    def report_to_html(self,report):
+    def report_to_html(self,report,rows=None):
         """
         Based on contents of a report instance, an HTML file is generated.
-        Files location is given by reports name and path.
+        Files location is given by reports name and path. The file is written
+        row by row.
 
         ARGUMENTS:
         report (Report):
             instance, that is converted into an HTML file.
 
+        OPTIONAL ARGUMENTS:
+        rows (iterable of dictionaries, default=None):
+            Rows, which are written instead of report.cont as soon as they are
+            available, e.g. rows of a running check:
+                dm = DymolaMode(...)
+                rows = (row for progress in dm.iter_check() for row in progress['Rows'])
+                Converter().report_to_html(dm.get_report(), rows)
+            All other attributes of the report are read, when the first row
+            is available. Durations are shown, if the first row has one.
+
         RETURNS:
         If generation was successfull, TRUE is returned.
         """
 
+        if rows is None:
+            _Validator('report',report)
+            self._generate_html(report)
+            return True
+
+        rows = iter(rows)
+        first = next(rows, None)
+
+        def values():
+            if first is not None:
+                yield first
+                yield from rows
+
         _Validator('report',report)
-        self._generate_html(report)
+        self._generate_html(report, (tuple(row.get(key) for key in _Rows._keysValues) for row in values()),
+                            first is not None and 'Time' in first)
         return True
 
 
@@ -885,7 +2368,7 @@ class Converter(object):
         report.name = name
         report.path = path
         report.disp = disp
-        report.cont = cont
+        report.set_cont(cont, trusted=True)
         report.meta = meta
 
         return report
@@ -907,34 +2390,91 @@ class Converter(object):
         return name, path, disp, cont, meta, mode
 
 
-    #PRIVATE API
-    ###########################################################################
-    def _generate_html(self,report):
+    def matrix_to_html(self,matrix):
         """
-        Generates HTML file based on a report instance
+        Based on a ReportMatrix instance, an HTML file is generated, which
+        contains a summary of the changes of each report and the matrix of all
+        packages/models. Files location is given by matrix' name and path.
+        The file is written row by row.
+
+        ARGUMENTS:
+        matrix (ReportMatrix):
+            instance, that is converted into an HTML file.
+
+        RETURNS:
+        If generation was successfull, TRUE is returned.
+        """
+
+        with open('{}.html'.format(os.path.join(matrix.path,matrix.name)),'w',buffering=self._bufferSize) as file:
+            file.write('<!doctype html>')
+            file.write('\n<html lang=\"de\">')
+            file.write('\n\t<head>')
+            file.write('\n\t\t<meta charset = \"utf8\">')
+            file.write(self._generate_html_style(self._htmlColors))
+            file.write('\n\t</head>')
+            file.write('\n\t<body>')
+            file.write('\n\t\t<h2>{}</h2>'.format(matrix.name))
+            file.write('\n')
+            file.write(self._generate_html_matrix_summary(matrix))
+            file.write('\n')
+            file.writelines(self._generate_html_matrix(matrix))
+            file.write('\n\t</body>')
+            file.write('\n</html>')
+
+        return True
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _generate_html(self,report,rows=None,timing=False):
+        """
+        Generates HTML file based on a report instance. The file is written
+        row by row, so the complete HTML code is never kept in memory.
 
         ARGUMENTS:
         report (Report):
             instance, that is converted into a HTML file.
 
+        OPTIONAL ARGUMENTS:
+        rows (iterable of tuples, default=None):
+            values of the rows of the results table, see
+            _generate_html_table_content_rows(). If not given, the rows of
+            report.cont are used.
+
+        timing (bool, default=False):
+            If true, durations of the given rows are shown. For the rows of
+            report.cont, they are shown, if any row has a duration.
+
         RETURNS:
         An HTML file is generated. Files location is given by reports name and
         path
         """
-        sDocType = '<!doctype html>'
-        sTag0 = '\n<html lang=\"de\">'
-        sHead = self._generate_html_head(report)
-        sBody = self._generate_html_body(report)
-        sTag1 = '\n</html>'
-
-        #full string
-        sHtml = "{}{}{}{}{}".format(sDocType,sTag0,sHead,sBody,sTag1)
 
-        with open('{}.html'.format(os.path.join(report.path,report.name)),'w') as file:
-            file.write(sHtml)
+        import tempfile;
 
-
-    def _generate_html_head(self,report):
+        if rows is None:
+            lColors = self._get_html_colors(report,report.cont)
+            rows = report.cont._iter_values()
+            timing = bool(report.cont._get_slowest(1))
+        else:
+            lColors = self._get_html_colors(report)
+
+        #rows are written as JSON to a temporary file at the same time, as
+        #the report data is placed behind the tables
+        with open('{}.html'.format(os.path.join(report.path,report.name)),'w',buffering=self._bufferSize) as file, \
+             tempfile.TemporaryFile('w+',buffering=self._bufferSize) as data:
+            file.write('<!doctype html>')
+            file.write('\n<html lang=\"de\">')
+            file.write(self._generate_html_head(report,lColors))
+            file.writelines(self._generate_html_body(report,self._iter_html_data(report,rows,data),set(lColors),timing))
+            pos = file.tell()
+            file.writelines(self._generate_html_data(report,data))
+            file.write('\n\t</body>')
+            file.write('\n</html>')
+            file.write('\n{}'.format(self._dataFooter.format(pos)))
+
+
+    def _generate_html_head(self,report,lColors):
         """
         Generates HTML <head> code as a string
 
@@ -942,6 +2482,9 @@ class Converter(object):
         report (Report):
             instance, that is converted into a HTML file.
 
+        lColors (list of strings):
+            background colors, which are defined as CSS classes
+
         RETURNS:
         sHead (string):
             the corresponding HTML-formatted string
@@ -949,33 +2492,225 @@ class Converter(object):
 
         sTag0 = '\n\t<head>'
         sMeta = self._generate_html_meta(report)
+        sStyle = self._generate_html_style(lColors)
         sTag1 = '\n\t</head>'
 
-        sHead = '{}{}{}'.format(sTag0,sMeta,sTag1)
+        sHead = '{}{}{}{}'.format(sTag0,sMeta,sStyle,sTag1)
         return sHead
 
 
-    def _generate_html_body(self,report):
+    def _generate_html_body(self,report,rows,sColors,timing=False):
         """
-        Generates HTML <body> code as a string
+        Generates HTML <body> code (except for the report data and the
+        closing tag)
 
         ARGUMENTS:
         report (Report):
             instance, that is converted into a HTML file.
 
-        RETURNS:
+        rows (iterable of tuples):
+            values of the rows of the results table
+
+        sColors (set of strings):
+            background colors, which are defined as CSS classes
+
+        OPTIONAL ARGUMENTS:
+        timing (bool, default=False):
+            If true, durations are shown in an additional column and the
+            slowest packages/models are listed in a table after the results
+
+        YIELDS:
         sBody (string):
+            the corresponding HTML-formatted string, piece by piece
+        """
+
+        yield '\n\t<body>'
+        yield '\n\t\t<h2>{}</h2>'.format(report.name)
+        yield '\n'
+        yield self._generate_html_table_disp(report)
+        yield '\n'
+
+        if not timing:
+            yield from self._generate_html_table_content(report,rows,sColors)
+            return
+
+        #the slowest rows are collected, while the results are written
+        lSlowest = []
+        def collect(rows):
+            for row in rows:
+                if row[8] is not None:
+                    if len(lSlowest) < self._htmlSlowest:
+                        heapq.heappush(lSlowest, (row[8], row[0]))
+                    elif row[8] > lSlowest[0][0]:
+                        heapq.heapreplace(lSlowest, (row[8], row[0]))
+                yield row
+
+        yield from self._generate_html_table_content(report,collect(rows),sColors,timing)
+        yield self._generate_html_table_slowest(sorted(lSlowest, reverse=True))
+
+
+    def _generate_html_matrix_summary(self,matrix):
+        """
+        Generates HTML <table> code as a string, which contains the summary of
+        a ReportMatrix instance (see ReportMatrix.get_summary()).
+
+        ARGUMENTS:
+        matrix (ReportMatrix):
+            instance, that is converted into a HTML file.
+
+        RETURNS:
+        sSummary (string):
             the corresponding HTML-formatted string
         """
 
-        sTag0 = '\n\t<body>'
-        sTitle = '\n\t\t<h2>{}</h2>'.format(report.name)
-        sTableDisp = self._generate_html_table_disp(report)
-        sTableCont = self._generate_html_table_content(report)
-        sTag1 = '\n\t</body>'
+        lKeys = ['Label', 'Reference', 'Regression', 'Improvement', 'Changed', 'Added', 'Removed', 'Err', 'Wrn']
+        lHeader = ['Report', 'Compared to', 'Regressions', 'Improvements', 'Changed', 'Added', 'Removed', 'Errors', 'Warnings']
+
+        lRows = ['\n\t\t<table class=\"disp cont\" border=\"1\" frame=\"box\">',
+                 '\n\t\t\t<tr>{}\n\t\t\t</tr>'.format(''.join('\n\t\t\t\t<th>{}</th>'.format(s) for s in lHeader))]
+
+        for dic in matrix.get_summary():
+            if dic['Reference'] is None:
+                lValues = [dic['Label']] + [''] * (len(lKeys) - 1)
+            else:
+                lValues = [dic[key] for key in lKeys[:-2]] + ['{:+d}'.format(dic['Err']), '{:+d}'.format(dic['Wrn'])]
+            lRows.append('\n\t\t\t<tr>{}\n\t\t\t</tr>'.format(''.join('\n\t\t\t\t<td>{}</td>'.format(val) for val in lValues)))
+
+        lRows.append('\n\t\t</table>')
+
+        sSummary = ''.join(lRows)
+        return sSummary
+
+
+    def _generate_html_matrix(self,matrix):
+        """
+        Generates HTML <table> code for the matrix of a ReportMatrix instance.
+        Each cell contains the result, errors and warnings of a package/model
+        and the differences of errors and warnings to the reference. Its
+        background color is given by the state (see ReportMatrix._colors).
+
+        ARGUMENTS:
+        matrix (ReportMatrix):
+            instance, that is converted into a HTML file.
+
+        YIELDS:
+        sMatrix (string):
+            the corresponding HTML-formatted string, row by row
+        """
+
+        yield '\n\t\t<table class=\"cont\" border=\"1\" frame=\"box\">'
+        yield '\n\t\t\t<tr>\n\t\t\t\t<th>Package/Model</th>{}\n\t\t\t</tr>'.format(''.join('\n\t\t\t\t<th>{}</th>'.format(label) for label in matrix.labels))
+
+        lRefs = [matrix._get_reference(i) for i in range(len(matrix.reports))]
+        lColors = [matrix._colors[state] for state in matrix._states]
+
+        for ind, pck in enumerate(matrix._names):
+            lRow = ['\n\t\t\t<tr>', '\n\t\t\t\t<td id=\"Pck\">{}</td>'.format(pck)]
+
+            for i, ref in enumerate(lRefs):
+                result = matrix._get_result(i, ind)
+                state = 0 if ref is None else matrix._get_state(ref, i, ind)
+
+                if result is None:
+                    sVal = '-'
+                else:
+                    res, err, wrn = result
+                    sVal = res if err is None else '{} {}/{}'.format(res, err, wrn)
+                    if ref is not None and err is not None and matrix._err[ref][ind] >= 0:
+                        dErr = err - matrix._err[ref][ind]
+                        dWrn = wrn - matrix._wrn[ref][ind]
+                        if dErr or dWrn:
+                            sVal = '{} ({:+d}/{:+d})'.format(sVal, dErr, dWrn)
+
+                if state == 0:
+                    lRow.append('\n\t\t\t\t<td>{}</td>'.format(sVal))
+                else:
+                    lRow.append('\n\t\t\t\t<td class=\"bg-{}\">{}</td>'.format(lColors[state], sVal))
+
+            lRow.append('\n\t\t\t</tr>')
+            yield ''.join(lRow)
+
+        yield '\n\t\t</table>'
+
+
+    def _iter_html_data(self,report,rows,data):
+        """
+        Yields given rows and writes them as JSON to data, see _dataSchema.
+
+        ARGUMENTS:
+        report (Report):
+            instance, that is converted into a HTML file.
+
+        rows (iterable of tuples):
+            values of the rows of the results table
+
+        data (file object):
+            file, the rows are written to (separated by commas)
+
+        YIELDS:
+        row (tuple):
+            the given rows
+        """
+
+        colors = report.colors
+        encode = json.encoder.encode_basestring_ascii
+
+        sSep = '\n'
+        for row in rows:
+            (pck,res,err,wrn) = row[:4]
+            (dur,colTime,durChecker) = row[8:]
+
+            lValues = [encode(pck), encode(res)]
+            if err is not None:
+                lValues += [str(err), str(wrn)]
+            if dur is not None:
+                if err is None:
+                    lValues += ['-1', '-1']
+                lValues.append(repr(dur))
+                if durChecker is not None and durChecker >= 0:
+                    lValues.append(repr(durChecker))
+
+            derived = _Rows._derive_colors(colors,res,err,wrn) + (('white',) if dur is not None else (None,))
+            if row[4:8] + (colTime,) != derived:
+                dCol = {key:col for key,col,col2 in zip(_Rows._keysFull[4:] + ('colTime',),row[4:8] + (colTime,),derived) if col != col2}
+                lValues.append(json.dumps(dCol))
+
+            data.write('{}[{}]'.format(sSep,','.join(lValues)))
+            sSep = ',\n'
+
+            yield row
+
+
+    def _generate_html_data(self,report,data):
+        """
+        Generates the HTML <script> code, which contains the report data as
+        JSON, see _dataSchema.
+
+        ARGUMENTS:
+        report (Report):
+            instance, that is converted into a HTML file.
+
+        data (file object):
+            file, which contains the rows (see _iter_html_data())
+
+        YIELDS:
+        sData (string):
+            the corresponding HTML-formatted string, piece by piece
+        """
+
+        dHeader = {'schema':self._dataSchema, 'mode':report.mode, 'meta':dict(sorted((report.meta or {}).items())),
+                   'disp':report.disp, 'colors':report.colors}
+
+        #'<' is escaped, so the data can never close the <script> tag
+        yield self._dataTag
+        yield json.dumps(dHeader, default=str)[:-1].replace('<', '\\u003c')
+        yield ', "rows": ['
+
+        data.seek(0)
+        for chunk in iter(lambda: data.read(self._bufferSize), ''):
+            yield chunk.replace('<', '\\u003c')
 
-        sBody = '{}{}\n{}\n{}{}'.format(sTag0,sTitle,sTableDisp,sTableCont,sTag1)
-        return sBody
+        yield '\n]}\n\t\t</script>'
 
 
     def _generate_html_meta(self,report):
@@ -994,12 +2729,57 @@ class Converter(object):
         sTemplate = '\n\t\t<meta name=\"{}\" content=\"{}\">'
 
         sChar = '\n\t\t<meta charset = \"utf8\">'
-        sRows = ''.join(sTemplate.format(key, value) for key,value in sorted(report.meta.items()))
+        sRows = ''.join(sTemplate.format(key, value) for key,value in sorted(report.meta.items()) if key in self._htmlMeta)
 
         sMeta = '{}{}'.format(sChar,sRows)
         return sMeta
 
 
+    def _generate_html_style(self,lColors):
+        """
+        Generates HTML <style> code as a string, which defines the CSS classes
+        of all tables and of given background colors.
+
+        ARGUMENTS:
+        lColors (list of strings):
+            background colors, which are defined as CSS classes
+
+        RETURNS:
+        sStyle (string):
+            the corresponding HTML-formatted string
+        """
+
+        lRules = self._htmlStyle + ['.bg-{0} {{background-color: {0}}}'.format(color) for color in lColors]
+
+        sStyle = '\n\t\t<style>{}\n\t\t</style>'.format(''.join('\n\t\t\t{}'.format(rule) for rule in lRules))
+        return sStyle
+
+
+    def _get_html_colors(self,report,cont=None):
+        """
+        Returns all background colors, which are defined as CSS classes: The
+        colors of the report, all colors used by Report.compare_to() and all
+        colors, which have been set explicitly in cont or are needed by its
+        results (if given). Only
+        alphanumeric colors (e.g. 'red', but not '#ff0000') can be used as
+        class names.
+        """
+
+        sColors = set(report.colors.values())
+        if cont:
+            for col in cont._col.values():
+                sColors.update(col.values())
+            if cont._dRes['Timeout'] in cont._res:
+                sColors.add(cont._get_res_color(report.colors, 'Timeout'))
+
+        lColors = []
+        for color in self._htmlColors + sorted(sColors):
+            if color.isalnum() and not color in lColors:
+                lColors.append(color)
+
+        return lColors
+
+
     def _generate_html_table_disp(self,report):
         """
         Generates HTML <table> code as a string, which contains the reports
@@ -1014,7 +2794,7 @@ class Converter(object):
             the corresponding HTML-formatted string
         """
 
-        sTag0 = '\n\t\t<table style=\"margin-bottom: 2em; margin-left: 2em\">'
+        sTag0 = '\n\t\t<table class=\"disp\">'
         sHead = self._generate_html_table_disp_header()
         sRows = ''.join(self._generate_html_table_disp_rows(dic) for dic in report.disp)
         sTag1 = '\n\t\t</table>'
@@ -1034,11 +2814,11 @@ class Converter(object):
         """
 
         row = ['\n\t\t\t<tr>',
-               '\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\"></th>',
-               '\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\"></th>',
+               '\n\t\t\t\t<th></th>',
+               '\n\t\t\t\t<th></th>',
                '\n\t\t\t</tr>']
 
-        srow = ''.join('{}'.format(r) for r in row)
+        srow = ''.join(row)
         return srow
 
 
@@ -1057,37 +2837,45 @@ class Converter(object):
         """
 
         row = ["\n\t\t\t<tr>",
-               "\n\t\t\t\t<td id=\"Key\" style=\"padding-left: 1em; text-align: right\">{}:</td>".format(dic['Key']),
-               "\n\t\t\t\t<td id=\"Val\" style=\"padding-left: 1em\">{}</td>".format(dic['Val']),
+               "\n\t\t\t\t<td id=\"Key\" class=\"key\">{}:</td>".format(dic['Key']),
+               "\n\t\t\t\t<td id=\"Val\" class=\"val\">{}</td>".format(dic['Val']),
                "\n\t\t\t</tr>"]
 
-        srow = ''.join('{}'.format(r) for r in row)
+        srow = ''.join(row)
         return srow
 
 
-    def _generate_html_table_content(self,report):
+    def _generate_html_table_content(self,report,rows,sColors,timing=False):
         """
-        Generates HTML <table> code for report.cont as a string
+        Generates HTML <table> code for the results of the check
 
         ARGUMENTS:
         report (Report):
             instance, that is converted into a HTML file.
 
-        RETURNS:
+        rows (iterable of tuples):
+            values of the rows of the results table
+
+        sColors (set of strings):
+            background colors, which are defined as CSS classes
+
+        OPTIONAL ARGUMENTS:
+        timing (bool, default=False):
+            if true, an additional column for durations is generated
+
+        YIELDS:
         sCont (string):
-            the corresponding HTML-formatted string
+            the corresponding HTML-formatted string, row by row
         """
 
-        sTag0 = '\n\t\t<table style=\"margin-left: 2em\" border=\"1\" frame=\"box\">'
-        sHead = self._generate_html_table_content_header(report.mode)
-        sRows = ''.join(self._generate_html_table_content_rows(dic,report.mode) for dic in report.cont)
-        sTag1 = '\n\t\t</table>'
-
-        sCont = '{}{}{}{}'.format(sTag0,sHead,sRows,sTag1)
-        return sCont
+        yield '\n\t\t<table class=\"cont\" border=\"1\" frame=\"box\">'
+        yield self._generate_html_table_content_header(report.mode,timing)
+        for row in rows:
+            yield self._generate_html_table_content_rows(row,report.mode,sColors,timing)
+        yield '\n\t\t</table>'
 
 
-    def _generate_html_table_content_header(self,mode):
+    def _generate_html_table_content_header(self,mode,timing=False):
         """
         Generates an HTML string for the header of the table for the test
         results
@@ -1097,383 +2885,3127 @@ class Converter(object):
             if mode = 'full', additional columns for errors and warnings are
             generated
 
+        OPTIONAL ARGUMENTS:
+        timing (bool, default=False):
+            if true, an additional column for durations is generated
+
         RETURNS:
         srow (string):
             the corresponding HTML-formatted string
         """
 
         row = ['\n\t\t\t<tr>',
-               '\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\">Package/Model</th>',
-               '\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\">Result</th>',
-               '{}'.format('\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\">Errors</th>' if mode=='full' else ''),
-               '{}'.format('\n\t\t\t\t<th style=\"padding-right: 1em; padding-left: 1em; text-align: center\">Warnings</th>' if mode=='full' else ''),
+               '\n\t\t\t\t<th>Package/Model</th>',
+               '\n\t\t\t\t<th>Result</th>',
+               '{}'.format('\n\t\t\t\t<th>Errors</th>' if mode=='full' else ''),
+               '{}'.format('\n\t\t\t\t<th>Warnings</th>' if mode=='full' else ''),
+               '{}'.format('\n\t\t\t\t<th>Time [s]</th>' if timing else ''),
                '\n\t\t\t</tr>']
 
-        srow = ''.join('{}'.format(r) for r in row)
+        srow = ''.join(row)
         return srow
 
 
-    def _generate_html_table_content_rows(self,dic,mode):
+    def _generate_html_table_content_rows(self,row,mode,sColors,timing=False):
         """
         Generates an HTML string for one row of the table for the test results
 
         ARGUMENT:
-        dic (dictionary):
-            values gives the result for a package/model
+        row (tuple):
+            values of a row of report.cont, ordered as 'Pck', 'Res', 'Err',
+            'Wrn', 'colPck', 'colRes', 'colErr', 'colWrn', 'Time', 'colTime',
+            'CheckerTime'
 
-         mode (string):
+        mode (string):
             if mode = 'full', additional columns for errors and warnings are
             generated
 
+        sColors (set of strings):
+            background colors, which are defined as CSS classes. Other
+            colors are given as inline style, white is not given at all.
+
+        OPTIONAL ARGUMENTS:
+        timing (bool, default=False):
+            if true, an additional column for the duration is generated,
+            which is empty for rows without duration
+
         RETURNS:
         srow (string):
             the corresponding HTML-formatted string
         """
 
-        style ='\"padding-right: 1em; padding-left: 1em; text-align: {}; background-color: {}\"'
+        (pck,res,err,wrn,colPck,colRes,colErr,colWrn,dur,colTime,durChecker) = row
 
-        row = ['\n\t\t\t<tr>',
-               '\n\t\t\t\t<td id=\"Pck\" style={}>{}</td>'.format(style.format('left',dic['colPck']), dic['Pck']),
-               '\n\t\t\t\t<td id=\"Res\" style={}>{}</td>'.format(style.format('center','{}'.format(dic['colRes'])), dic['Res']),
-               '{}'.format('\n\t\t\t\t<td id=\"Err\" style={}>{}</td>'.format(style.format('center','{}'.format(dic['colErr'])), dic['Err']) if mode=='full' else ''),
-               '{}'.format('\n\t\t\t\t<td id=\"Wrn\" style={}>{}</td>'.format(style.format('center','{}'.format(dic['colWrn'])), dic['Wrn']) if mode=='full' else ''),
-               '\n\t\t\t</tr>']
+        def cell(sid,color,val):
+            #white is the default background color
+            if color == 'white':
+                return '\n\t\t\t\t<td id=\"{}\">{}</td>'.format(sid,val)
+            if color in sColors:
+                return '\n\t\t\t\t<td id=\"{}\" class=\"bg-{}\">{}</td>'.format(sid,color,val)
+            return '\n\t\t\t\t<td id=\"{}\" style=\"background-color: {}\">{}</td>'.format(sid,color,val)
+
+        lRow = ['\n\t\t\t<tr>',
+                cell('Pck',colPck,pck),
+                cell('Res',colRes,res)]
+
+        if mode=='full':
+            lRow.append(cell('Err',colErr,err))
+            lRow.append(cell('Wrn',colWrn,wrn))
+
+        if timing:
+            lRow.append(cell('Time','white','') if dur is None else cell('Time',colTime,'{:.3f}'.format(dur)))
 
-        srow = ''.join('{}'.format(r) for r in row)
+        lRow.append('\n\t\t\t</tr>')
+
+        srow = ''.join(lRow)
         return srow
 
 
-    def _read_html(self,html):
+    def _generate_html_table_slowest(self,lSlowest):
         """
-        Parses a given HTML file (based on name and path) and stores available
-        information within the report instance.
+        Generates HTML <table> code as a string, which lists the slowest
+        packages/models. It is not read again by _read_html().
 
         ARGUMENTS:
-        html (string):
-            path to a report-html, which is converted into a report instance.
+        lSlowest (list of tuples):
+            duration and name of the slowest packages/models
 
         RETURNS:
-        name, path, disp, cont, meta, mode (Report attributes):
-            resulting instance attributes of the conversion.
+        sSlowest (string):
+            the corresponding HTML-formatted string
         """
 
-        #TODO: Check for valid Report HTML
+        lRows = ['\n\t\t<table class=\"cont slowest\" border=\"1\" frame=\"box\" style=\"margin-top: 2em\">',
+                 '\n\t\t\t<tr>\n\t\t\t\t<th>Slowest Packages/Models</th>\n\t\t\t\t<th>Time [s]</th>\n\t\t\t</tr>']
 
-        with open(html) as file:
-            lst = file.readlines()
+        for dur, pck in lSlowest:
+            lRows.append('\n\t\t\t<tr>\n\t\t\t\t<td>{}</td>\n\t\t\t\t<td>{:.3f}</td>\n\t\t\t</tr>'.format(pck, dur))
 
-        path, name = os.path.split(html)
-        name = name.replace('.html','')
-        meta = self._parse_html_meta(lst)
-        disp,cont = self._parse_html_tables(lst)
-        mode = self._get_mode(cont[0])
+        lRows.append('\n\t\t</table>')
 
-        return name, path, disp, cont, meta, mode
+        sSlowest = ''.join(lRows)
+        return sSlowest
 
 
-    def _parse_html_meta(self,lst):
+    def _read_html(self,html):
         """
-        Parses given list instance for Reports meta information.
+        Parses a given HTML file (based on name and path) and stores available
+        information within the report instance. The file is read in a single
+        pass: Meta information and the first table line by line, the rows of
+        the results table in chunks. Reports of the current and of previous
+        versions (with inline styles) are supported.
 
         ARGUMENTS:
-        lst (list):
-            each entry is a row of the HTML code.
+        html (string):
+            path to a report-html, which is converted into a report instance.
 
         RETURNS:
-        dic (dictionary):
-            key-value pairs of meta information.
+        name, path, disp, cont, meta, mode (Report attributes):
+            resulting instance attributes of the conversion.
         """
-        #Parse Meta
-        ind = [i for i, j in enumerate(lst) if j.strip().startswith('<meta')]
 
-        dic = {}
-        for i in ind:
-            s = lst[i]
-            if s.strip()=='<meta charset = "utf8">':
-                continue
+        data = self._read_html_data(html)
+        if data is not None:
+            return data
 
-            else:
-                #search for name-value
-                sKey = self._parse_keyvalue_pair(s,'name')
-                #search for content-value
-                sVal = self._parse_keyvalue_pair(s,'content')
+        path, name = os.path.split(html)
+        name = name.replace('.html','')
 
-                dic[sKey]=sVal
+        meta = {}
+        disp = []
+        cont = _Rows(Report())
+        mode = None
 
-        return dic
+        nLine = 0
+        nTables = 0     #number of started tables (1: disp, 2: cont)
+        bTable = False  #within a table
+        lRow = None     #cells of the current row, None outside of a row
+        nHeader = 0     #number of header cells of the current row
+
+        with open(html) as file:
+            for line in iter(file.readline, ''):
+                nLine += 1
+                line = line.strip()
+
+                if line.startswith('<td'):
+                    if lRow is None:
+                        self._raise_invalid_html(html, nLine, 'cell outside of a table row')
+                    match = self._htmlCell.match(line)
+                    if match is None:
+                        self._raise_invalid_html(html, nLine, 'invalid table cell')
+                    sid, attrs, val = match.groups()
+                    lRow.append((sid, val))
+
+                elif line == '<tr>':
+                    if not bTable or lRow is not None:
+                        self._raise_invalid_html(html, nLine, 'unexpected table row')
+                    lRow = []
+                    nHeader = 0
+
+                elif line == '</tr>':
+                    if lRow is None:
+                        self._raise_invalid_html(html, nLine, 'unexpected end of a table row')
+
+                    if nTables == 1 and lRow:
+                        self._add_html_disp_row(html, nLine, lRow, disp)
+                    elif nTables == 2:
+                        #header of the results table defines the mode, all
+                        #following rows belong to the results
+                        if lRow or not nHeader in (2, 3, 4, 5):
+                            self._raise_invalid_html(html, nLine, 'header of the results table must have 2 to 5 columns')
+                        mode = 'full' if nHeader >= 4 else 'compact'
+                        self._read_html_rows(html, file, nLine, mode, cont, nHeader in (3, 5))
+                        break
+                    lRow = None
+
+                elif line.startswith('<th'):
+                    if lRow is None:
+                        self._raise_invalid_html(html, nLine, 'header cell outside of a table row')
+                    nHeader += 1
+
+                elif line.startswith('<meta'):
+                    if not line.startswith('<meta charset'):
+                        meta[self._parse_html_attribute(html, nLine, line, 'name')] = self._parse_html_attribute(html, nLine, line, 'content')
+
+                elif line.startswith('<table'):
+                    if bTable:
+                        self._raise_invalid_html(html, nLine, 'nested table')
+                    bTable = True
+                    nTables += 1
+
+                elif line.startswith('</table'):
+                    if not bTable or lRow is not None:
+                        self._raise_invalid_html(html, nLine, 'unexpected end of a table')
+                    bTable = False
+
+        if mode is None:
+            self._raise_invalid_html(html, nLine, 'results table is missing')
+        for key in self._htmlMeta:
+            if not key in meta:
+                self._raise_invalid_html(html, nLine, 'meta information \'{}\' is missing'.format(key))
+
+        #types of the meta information, which are lost in <meta> tags
+        if meta['ped'] in ('True', 'False'):
+            meta['ped'] = meta['ped'] == 'True'
+        if meta['lod'].lstrip('-').isdigit():
+            meta['lod'] = int(meta['lod'])
+
+        return name, path, disp, cont, meta, mode
 
 
-    def _parse_html_tables(self, lst):
+    def _read_html_data(self,html):
         """
-        Parses given list instance for Reports disp and meta information.
+        Reads the report data, which is embedded into a HTML report as JSON
+        (see _dataSchema). Its position is given by the last line of the file.
 
         ARGUMENTS:
-        lst (list):
-            each entry is a row of the HTML code.
+        html (string):
+            path to a report-html, which is converted into a report instance.
 
         RETURNS:
-        disp, cont (list of dictionaries):
-            Report attributes disp and cont
+        name, path, disp, cont, meta, mode (Report attributes):
+            resulting instance attributes of the conversion. None, if the
+            file contains no report data of a supported schema.
         """
-        #Parse Tables
-        start = [i for i, j in enumerate(lst) if j.strip().startswith('<table')]
-        stop = [i for i, j in enumerate(lst) if j.strip().startswith('</table')]
 
-        disp = self._parse_html_table(lst[start[0]+1:stop[0]])
-        cont = self._parse_html_table(lst[start[1]+1:stop[1]])
+        with open(html,'rb') as file:
+            file.seek(0, os.SEEK_END)
+            file.seek(max(file.tell() - 64, 0))
+            footer = self._dataFooterPattern.search(file.read().decode('ascii', 'replace'))
+        if footer is None:
+            return None
 
-        return disp, cont
+        with open(html) as file:
+            file.seek(int(footer.group(1)))
+            sData = file.read()
 
+        if not sData.startswith(self._dataTag):
+            return None
 
-    def _parse_html_table(self,lst):
-        """
-        Extracts values of 'td' rows of a given list.
+        try:
+            data = json.loads(sData[len(self._dataTag):sData.index('</script>')])
+            if data.get('schema') != self._dataSchema:
+                return None
+
+            cont = _Rows(Report(colors=data['colors']))
+            for row in data['rows']:
+                if isinstance(row[-1], dict):
+                    dCol = row.pop()
+                    cont.add(*row)
+                    for key, col in dCol.items():
+                        cont._set(len(cont) - 1, key, col)
+                else:
+                    cont.add(*row)
 
-        ARGUMENT:
-        lst (list of strings):
-           each item is a row of an HTML table
+            disp = data['disp']
+            meta = data['meta']
+            mode = data['mode']
+        except (ValueError, KeyError, TypeError, IndexError, AttributeError):
+            #report data is damaged, so the HTML is parsed instead
+            return None
 
-        RETURN:
-        res (list of dictionaries):
-            converted information.
-        """
-        #get each HTML row as a list item
-        rows = list(self._parse_splitted_lst(lst,"\t\t\t<tr>\n"))
-        #ignore first item, as it is the header line and an empty entry
-        rows.pop(0)
-        rows.pop(0)
-        #ignore the last entry of each row, as it is the closure of a row "</tr>"
-        [row.pop() for row in rows]
-
-        res = []
-        for row in rows:
-            dic={}
-            for column in row:
+        path, name = os.path.split(html)
+        name = name.replace('.html','')
+
+        return name, path, disp, cont, meta, mode
 
-                #get the id
-                sid = self._parse_keyvalue_pair(column,'id')
-                #get the value
-                sval = self._parse_keyvalue_pair(column,'<',['>','<'])
 
-                if sval[-1]==':':
-                    sval=sval[:-1]
+    def _read_html_rows(self,html,file,nLine,mode,cont,timing=False):
+        """
+        Parses the rows of the results table and appends them to cont. The
+        remaining file is read in chunks.
 
-                dic[sid]=sval
-                if sid in ('Pck', 'Res', 'Err', 'Wrn'):
-                    col = self._parse_keyvalue_pair(column,'background-color',[': ','"'])
-                    dic['col{}'.format(sid)]=col.strip()
+        ARGUMENTS:
+        html (string): path of the parsed file
+        file (file object): file, which is positioned behind the header of
+            the results table
+        nLine (int): number of lines, which have been read already
+        mode (string): mode of the report, i.e. 'full' or 'compact'
+        cont (_Rows): rows, the results are appended to
+
+        OPTIONAL ARGUMENTS:
+        timing (bool): True, if the results table has a column of durations
+        """
 
-            res.append(dic)
+        match = self._htmlRow.match
+        bFull = mode == 'full'
+        bWhite = cont._report.colors['cTrue'] == 'white'
+
+        buf = ''
+        pos = 0
+        bEOF = False
+
+        while True:
+            row = match(buf, pos)
+
+            if row is None:
+                if bEOF or buf.find('</tr>', pos) >= 0:
+                    break
+                #the next row is incomplete, so the next chunk is read
+                nLine += buf.count('\n', 0, pos)
+                chunk = file.read(self._bufferSize)
+                bEOF = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
 
-        return res
+            colPck, pck, colRes, res, colErr, err, colWrn, wrn, colTime, dur = row.groups()
+            if bFull != (err is not None) or timing != (dur is not None):
+                self._raise_invalid_html(html, nLine + 1 + buf.count('\n', 0, row.end()), 'unexpected cells in a {} results table'.format(mode))
+            pos = row.end()
 
-    def _get_mode(self,dic):
+            dur = float(dur) if dur else -1
+            if bFull:
+                cont.add(pck, res, int(err), int(wrn), dur)
+            else:
+                cont.add(pck, res, -1, -1, dur)
+
+            #colors must only be set, if they can differ from the derived ones
+            if colPck or colRes or colErr or colWrn or colTime or not bWhite or res != 'True' or err not in (None, '0') or wrn not in (None, '0'):
+                ind = len(cont) - 1
+                for key, attrs in (('colPck', colPck), ('colRes', colRes), ('colErr', colErr), ('colWrn', colWrn), ('colTime', colTime)):
+                    if attrs is not None and (key != 'colTime' or dur >= 0):
+                        cont._set(ind, key, self._parse_html_color(html, nLine, attrs) if attrs else 'white')
+
+        #the results table must be closed and must be the last one (except
+        #for the table of the slowest packages/models)
+        rest = buf[pos:] + file.read()
+        nLine += 1 + buf.count('\n', 0, pos)
+        if not rest.lstrip().startswith('</table>'):
+            self._raise_invalid_html(html, nLine + rest.count('\n', 0, len(rest) - len(rest.lstrip())), 'invalid row of the results table')
+        if timing:
+            iEnd = rest.index('</table>') + len('</table>')
+            slowest = self._htmlSlowestTable.match(rest, iEnd)
+            if slowest:
+                rest = rest[:iEnd] + '\n' * rest.count('\n', iEnd, slowest.end()) + rest[slowest.end():]
+        for tag in ('<table', '<tr', '<td', '<th'):
+            if tag in rest:
+                self._raise_invalid_html(html, nLine + rest.count('\n', 0, rest.find(tag)), 'a report must contain exactly two tables')
+
+
+    def _parse_html_color(self,html,nLine,attrs):
         """
-        Based on entrys in report.cont, the report.mode is determined.
+        Returns the background color of a table cell based on its attributes
+        (except for its id), e.g. ' class="bg-red"'.
 
         ARGUMENTS:
-        dic (dictionary):
-            Entry of report.cont. If it has 8 entries, the corresponding mode
-            is 'full', if there are only 4 entries, mode is 'compact'
+        html (string): path of the parsed file
+        nLine (int): number of the line in the parsed file
+        attrs (string): attributes of the cell
 
         RETURNS:
-        mode (string):
-            Either 'full' or 'compact'
+        col (string):
+            background color, which is given by an inline style (as in
+            previous versions) or a CSS class 'bg-[color]'. Default is 'white'.
         """
 
-        if len(dic)==8:
-            mode = 'full'
-        elif len(dic)==4:
-            mode = 'compact'
+        if 'background-color' in attrs:
+            return self._parse_html_attribute(html, nLine, attrs, 'background-color', ':', ';"').strip()
 
-        return mode
+        for cls in self._parse_html_attribute(html, nLine, attrs, 'class').split() if 'class=' in attrs else []:
+            if cls.startswith('bg-'):
+                return cls[3:]
 
-    def _parse_keyvalue_pair(self,s,key,sep=['"','"']):
-        """
-        Parses a given string for substring key and extract the substring,
-        which is included by the next seperators.
-        Used to get the value of key-value pairs of a string.
+        return 'white'
 
-        ARGUMENTS:
-        s (string):
-            string, that is parsed for substrings
-        key (string):
-            substrings, which must be followed by sep
 
-        OPTIONAL:
-        sep (list of strings, default: ['"','"']):
-            seperators of the searched value. First entry is the left
-            seperator, second the right one.
-             Default:
+    def _parse_html_attribute(self,html,nLine,line,key,sep1='="',sep2='"'):
+        """
+        Returns the value of an attribute of a line, e.g. 'git' for key 'name'
+        and the line '<meta name="git" content="master">'.
 
-        RETURN:
-        sVal (string)
-            corresponding value for key
+        ARGUMENTS:
+        html (string): path of the parsed file
+        nLine (int): number of the line in the parsed file
+        line (string): line, which contains the attribute
+        key (string): name of the attribute
+
+        OPTIONAL ARGUMENTS:
+        sep1 (string, default='="'): separator between key and value
+        sep2 (string, default='"'): possible characters after the value
         """
 
-        try:
-            ind = s.index(key)
-            indKey0 = s.index(sep[0],ind)
-            indKey1 = s.index(sep[1],indKey0+1)
-            sVal = s[indKey0+1:indKey1]
+        ind = line.find(key + sep1)
+        if ind < 0:
+            self._raise_invalid_html(html, nLine, 'attribute \'{}\' is missing'.format(key))
+
+        ind += len(key) + len(sep1)
+        ind2 = min([i for i in (line.find(s, ind) for s in sep2) if i >= 0] or [len(line)])
 
-        except ValueError:
-            raise ValueError('\n\nSubstring not found in given string {}'.format(s)) from None
-        except TypeError:
-            raise TypeError('\n\n Input \'s\' must be a string but is a \'{}\''.format(s.__class__)) from None
-        return sVal
+        return line[ind:ind2]
 
 
-    def _parse_splitted_lst(self, lst, sep):
+    def _add_html_disp_row(self,html,nLine,lRow,disp):
+        """
+        Appends a parsed row of the first table to disp.
         """
-        Splits a list of strings into several sublist, where sep is the
-        seperator string.
 
-        Example: lst = ['A','B','C'], sep='B'
-                 list(_parse_splitted_lst(lst,sep)) will return [['A'],['C']]
+        if [cell[0] for cell in lRow] != ['Key', 'Val']:
+            self._raise_invalid_html(html, nLine, 'rows of the first table must have the cells \'Key\' and \'Val\'')
 
-        ARGUMENTS:
-        lst (list of strings):
-            list that should be splitted into several lists.
+        key = lRow[0][1]
+        if key[-1:] == ':':
+            key = key[:-1]
+        val = lRow[1][1]
+        if val[-1:] == ':':
+            val = val[:-1]
 
-        sep (string):
-            an entry of lst, which is interpreted as a separator
+        disp.append({'Key':key, 'Val':val})
 
-        RETUNRS:
-        sublists of lst.
-        """
-        ind1 = 0
-        while ind1 < len(lst):
-            try:
-               ind2 = ind1 + lst[ind1:].index(sep)
-               yield lst[ind1:ind2]
-               ind1 = ind2 + 1
-            except ValueError:
-               yield lst[ind1:]
-               break
+
+    def _raise_invalid_html(self,html,nLine,msg):
+        raise ValueError('\n\n => \'{}\' is not a valid report (line {}): {}! <='.format(html, nLine, msg))
 
 
 ###############################################################################
-#VALIDATION OF OPTIONS
+#REPORT CONTENT
 ###############################################################################
-class _Validator(object):
+class _Rows(object):
     """
-    Returns a new _Validator instance to validate user inputs
-
-    USAGE:
-        _Validator(option,value)
-
-    EXAMPLE:
-        _Validator('report_name','report')
+    Column-oriented storage of the rows of Report.cont.
+
+    Names of packages/models are stored in a single UTF-8 buffer, results as
+    small integer codes and numbers of errors and warnings as integers (-1,
+    if the row has none, i.e. in mode 'compact'). Durations of the check
+    (round-trip time and duration measured by the checker) are stored as
+    floats (-1, if the row has none). Colors of the cells are
+    derived from the colors of the report, when they are accessed. Only
+    colors, which have been set explicitly and differ from the derived ones
+    (e.g. by Report.compare_to()), are stored per row.
+
+    Indexing and iterating returns rows, which behave like the dictionaries of
+    previous versions, e.g. cont[0]['Err'] == '3' or
+    cont[0]['colRes'] = 'green'. Internally, the columns are used directly.
     """
 
-    def __init__(self, key, val, val2=None):
-
-        if key in 'report':
-            self._validate_report(val)
+    #results of all reports, each result is stored as its index (codes of
+    #other results are given by each instance, see _get_code())
+    _tRes = ('True', 'False', 'Not_found', 'Timeout')
+    _dResFixed = {res:code for code, res in enumerate(_tRes)}
+
+    #keys of a row with and without numbers of errors and warnings, rows
+    #with a duration additionally have the keys _keysTime
+    _keysFull = ('Pck', 'Res', 'Err', 'Wrn', 'colPck', 'colRes', 'colErr', 'colWrn')
+    _keysCompact = ('Pck', 'Res', 'colPck', 'colRes')
+    _keysTime = ('Time', 'CheckerTime', 'colTime')
+    _keysFullTime = _keysFull + _keysTime
+    _keysCompactTime = _keysCompact + _keysTime
+
+    #order of the values of a row, see _iter_values()
+    _keysValues = _keysFull + ('Time', 'colTime', 'CheckerTime')
+
+    def __init__(self, report, rows=()):
+        self._report = report
+        self._lRes = list(self._tRes)
+        self._dRes = dict(self._dResFixed)
+        #number of changes of the names, e.g. to invalidate an index of them
+        self._changes = 0
+        self._names = bytearray()
+        self._offsets = array.array('Q', [0])
+        self._res = array.array('H')
+        self._err = array.array('l')
+        self._wrn = array.array('l')
+        self._time = array.array('d')
+        self._timeChecker = array.array('d')
+        self._col = {}
+
+        self.extend(rows)
+
+    def add(self, pck, res, err=-1, wrn=-1, time=-1, time_checker=-1):
+        """
+        Appends a row given by its values.
 
-        elif key in 'report_name':
-            self._validate_report_name(val)
+        ARGUMENTS:
+        pck (string): name of the package/model
+        res (string): result, e.g. 'True'
+        err, wrn (int, default=-1): numbers of errors and warnings
+        time (float, default=-1): round-trip time of the check in seconds
+        time_checker (float, default=-1): duration of the check measured by
+            the checker in seconds
+        """
 
-        elif key in 'report_path':
-            self._validate_report_path(val)
+        self._names += pck.encode('utf-8')
+        self._offsets.append(len(self._names))
+        self._changes += 1
+        self._res.append(self._get_code(res))
+        self._err.append(int(err))
+        self._wrn.append(int(wrn))
+        self._time.append(float(time))
+        self._timeChecker.append(float(time_checker))
 
-        elif key in 'report_disp':
-            self._validate_report_disp(val)
+    def append(self, row):
+        """
+        Appends a row given as a dictionary.
+        """
 
-        elif key in 'report_cont':
-            self._validate_report_cont(val)
+        self.add(row['Pck'], row['Res'], row.get('Err', -1), row.get('Wrn', -1), row.get('Time', -1), row.get('CheckerTime', -1))
+        self._set_colors(len(self._res) - 1, row)
 
-        elif key in 'report_meta':
-            self._validate_report_meta(val)
+    def extend(self, rows):
+        if rows is self:
+            rows = list(rows)
 
-        elif key in 'report_mode':
-            self._validate_report_mode(val)
+        for row in rows:
+            self.append(row)
 
-        elif key in 'report_colors':
-            self._validate_report_colors(val)
+    def __len__(self):
+        return len(self._res)
 
-        elif key in 'report_compare':
-            self._validate_report_compare(val,val2)
+    def __getitem__(self, ind):
+        if isinstance(ind, slice):
+            return [_Row(self, i) for i in range(*ind.indices(len(self._res)))]
 
-        elif key in 'dymola_path':
-            self._validate_dymola_path(val)
+        if ind < 0:
+            ind += len(self._res)
+        if not 0 <= ind < len(self._res):
+            raise IndexError('row index out of range')
 
-        elif key in 'dymola_pedantic':
-            self._validate_dymola_pedantic(val)
+        return _Row(self, ind)
 
-        elif key in 'modelica_lib_path':
-            self._validate_modelica_lib_path(val)
+    def __setitem__(self, ind, row):
+        row = dict(row)
+        ind = self[ind]._ind
 
-        elif key in 'modelica_lib_firstlevel':
-            self._validate_modelica_lib_firstlevel(val)
+        self._col.pop(ind, None)
+        self._set(ind, 'Pck', row['Pck'])
+        self._set(ind, 'Res', row['Res'])
+        self._set(ind, 'Err', row.get('Err', -1))
+        self._set(ind, 'Wrn', row.get('Wrn', -1))
+        self._set(ind, 'Time', row.get('Time', -1))
+        self._set(ind, 'CheckerTime', row.get('CheckerTime', -1))
+        self._set_colors(ind, row)
 
-        elif key in 'modelica_lib_depth':
-            self._validate_modelica_lib_depth(val)
+    def __iter__(self):
+        return (_Row(self, ind) for ind in range(len(self._res)))
 
-        elif key in 'general_filepath':
-            self._validate_general_filepath(val, val2)
+    def __eq__(self, other):
+        if not isinstance(other, (list, _Rows)):
+            return NotImplemented
+        return list(self) == list(other)
 
-        elif key in 'general_kwargs':
-            self._validate_general_kwargs(val,val2)
+    def __repr__(self):
+        return repr([dict(row) for row in self])
 
 
     #PRIVATE API
     ###########################################################################
-    def _validate_report_name(self,val):
-        if val:
-            self._validate_general_instance('name',val,str,'string')
-            fname, fext = os.path.splitext(val)
-            assert len(fname)>0 , '\n\n => Value of \'name\' must be an acutal non-zero sized string! <='
-            assert len(fext)==0, '\n\n => Value of \'name\' must not have a file extension, but has \'{}\'! <='.format(fext)
+    def _iter_names(self):
+        """
+        Yields the names of all packages/models.
+        """
 
+        offsets = self._offsets
+        text = self._names.decode('utf-8')
+        if len(text) == len(self._names):
+            #only ASCII characters, so offsets of bytes and characters match
+            for ind in range(len(self._res)):
+                yield text[offsets[ind]:offsets[ind+1]]
+        else:
+            names = self._names
+            for ind in range(len(self._res)):
+                yield names[offsets[ind]:offsets[ind+1]].decode('utf-8')
 
-    def _validate_report_path(self,val):
-        if val:
-            self._validate_general_instance('path',val,str,'string')
-            self._validate_general_dirpath('path',val)
+    def _iter_values(self):
+        """
+        Yields the values of all rows as tuples of strings in the order of
+        _keysValues (durations as floats). Numbers of errors and warnings,
+        durations (and their colors) of rows without them are None.
+        """
 
+        colors = self._report.colors
+        lRes = [(res, self._get_res_color(colors, res)) for res in self._lRes]
+        cErr = colors['cErr']
+        cWrn = colors['cWrn']
 
-    def _validate_report_disp(self,val):
-        if val:
-            self._validate_general_instance('disp',val,list,'list')
-            for elem in val:
-                assert isinstance(elem,dict), '\n\n => Each entry in \'disp\' must be a dictionary itself, but entry [{}] is \'{}\'! <='.format(elem,elem.__class__)
-                self._validate_general_key_in_dict('disp', elem, ['Key','Val'])
+        #strings of small numbers are reused
+        lNum = [str(n) for n in range(100)]
 
+        for ind, (pck, res, err, wrn, dur, durChecker) in enumerate(zip(self._iter_names(), self._res, self._err, self._wrn,
+                                                                        self._time, self._timeChecker)):
+            sRes, colRes = lRes[res]
+            if err >= 0:
+                row = (pck, sRes, lNum[err] if err < 100 else str(err), lNum[wrn] if wrn < 100 else str(wrn), 'white', colRes,
+                       'white' if err==0 else cErr, 'white' if wrn==0 else cWrn)
+            else:
+                row = (pck, sRes, None, None, 'white', colRes, None, None)
+            row += (dur, 'white', durChecker if durChecker >= 0 else None) if dur >= 0 else (None, None, None)
 
-    def _validate_report_cont(self,val):
-        if val:
-            self._validate_general_instance('cont',val,list,'list')
-            for elem in val:
-                assert isinstance(elem,dict), '\n\n => Each entry in \'cont\' must be a dictionary, but entry [{}] is \'{}\'! <='.format(elem,elem.__class__)
-                self._validate_general_key_in_dict('cont', elem, ['Pck', 'Res', 'Err', 'Wrn', 'colPck', 'colRes', 'colWrn', 'colErr'])
+            if ind in self._col:
+                col = self._col[ind]
+                row = (row[:4] + tuple(col.get(key, val) for key, val in zip(self._keysFull[4:], row[4:8])) + row[8:9] +
+                       (col.get('colTime', row[9]),) + row[10:])
 
+            yield row
 
-    def _validate_report_meta(self,val):
-        if val:
-            self._validate_general_instance('meta',val,dict,'dictionary')
-            assert len(val)==5, '\n\n => \'meta\' must have only four keys (\'pck\', \'ped\', \'lod\', \'git\' and \'viewport\') but not \'{}\'! <='.format(len(val))
-            self._validate_general_key_in_dict('meta', val, ['pck','lod','ped','git','viewport'])
+    def _add_row(self, rows, ind):
+        """
+        Appends a row of other rows of the same report including its colors.
 
+        ARGUMENTS:
+        rows (_Rows): rows, which contain the row
+        ind (int): index of the row
+        """
 
-    def _validate_report_mode(self,val):
-        if val:
-            self._validate_general_instance('mode',val,str,'string')
-            assert val in('full','compact'), '\n\n => Value of \'mode\' must be either \'full\' or \'compact\', but is \'{}\'! <='.format(val)
+        self._names += rows._names[rows._offsets[ind]:rows._offsets[ind+1]]
+        self._offsets.append(len(self._names))
+        self._changes += 1
+        self._res.append(self._get_code(rows._lRes[rows._res[ind]]))
+        self._err.append(rows._err[ind])
+        self._wrn.append(rows._wrn[ind])
+        self._time.append(rows._time[ind])
+        self._timeChecker.append(rows._timeChecker[ind])
+        if ind in rows._col:
+            self._col[len(self._res)-1] = dict(rows._col[ind])
+
+    def _copy(self, report):
+        """
+        Returns a copy of all rows for another report with the same colors.
+        """
 
+        rows = _Rows(report)
+        rows._lRes = list(self._lRes)
+        rows._dRes = dict(self._dRes)
+        rows._names = bytearray(self._names)
+        rows._offsets = array.array('Q', self._offsets)
+        rows._res = array.array('H', self._res)
+        rows._err = array.array('l', self._err)
+        rows._wrn = array.array('l', self._wrn)
+        rows._time = array.array('d', self._time)
+        rows._timeChecker = array.array('d', self._timeChecker)
+        rows._col = {ind:dict(col) for ind, col in self._col.items()}
+
+        return rows
+
+    @staticmethod
+    def _get_res_color(colors, res):
+        """
+        Returns the color of the cell 'Res' of a result, which is derived from
+        colors of a report ('cTO' is optional).
+        """
 
-    def _validate_report_colors(self,val):
-        if val:
-            self._validate_general_instance('colors',val,dict,'dictionary')
-            self._validate_general_key_in_dict('colors', val, ['cTrue','cFalse', 'cNF','cErr','cWrn'])
+        if res == 'True':
+            return colors['cTrue']
+        if res == 'False':
+            return colors['cFalse']
+        if res == 'Timeout':
+            return colors.get('cTO', 'orange')
 
+        return colors['cNF']
 
-    def _validate_report(self,val):
-        self._validate_general_instance('Report',val, Report ,'Report')
-        self._validate_report_name(val.name)
-        self._validate_report_path(val.path)
-        self._validate_report_disp(val.disp)
+    @staticmethod
+    def _derive_colors(colors, res, err, wrn):
+        """
+        Returns the colors of the cells 'Pck', 'Res', 'Err' and 'Wrn' of a
+        row, which are derived from colors of a report (None for the cells
+        'Err' and 'Wrn' of rows without them).
+        """
+
+        colRes = _Rows._get_res_color(colors, res)
+        if err is None:
+            return ('white', colRes, None, None)
+
+        return ('white', colRes, 'white' if str(err)=='0' else colors['cErr'], 'white' if str(wrn)=='0' else colors['cWrn'])
+
+    def _get_code(self, res):
+        """
+        Returns the code of a result, new results get a new code of this
+        instance.
+        """
+
+        code = self._dRes.get(res)
+        if code is None:
+            code = len(self._lRes)
+            self._lRes.append(res)
+            self._dRes[res] = code
+
+        return code
+
+    def _set_colors(self, ind, row):
+        """
+        Sets the colors of a row given as a dictionary.
+        """
+
+        for key in ('colPck', 'colRes', 'colErr', 'colWrn', 'colTime'):
+            if key in row and key in self._get_keys(ind):
+                self._set(ind, key, row[key])
+
+    def _get_keys(self, ind):
+        if self._time[ind] >= 0:
+            return self._keysFullTime if self._err[ind] >= 0 else self._keysCompactTime
+        return self._keysFull if self._err[ind] >= 0 else self._keysCompact
+
+    def _get_slowest(self, n, key='Time'):
+        """
+        Returns indices of the n rows with the longest durations ('Time' or
+        'CheckerTime'), in descending order of their durations.
+        """
+
+        durs = self._time if key == 'Time' else self._timeChecker
+        return heapq.nlargest(n, (ind for ind in range(len(durs)) if durs[ind] >= 0), key=durs.__getitem__)
+
+    def _get_time(self, ind, key):
+        """
+        Returns a duration of a row ('Time' or 'CheckerTime', -1 if the row
+        has none).
+        """
+
+        return self._time[ind] if key == 'Time' else self._timeChecker[ind]
+
+    def _get(self, ind, key):
+        if key == 'Pck':
+            return self._names[self._offsets[ind]:self._offsets[ind+1]].decode('utf-8')
+        if key == 'Res':
+            return self._lRes[self._res[ind]]
+        if not key in self._get_keys(ind):
+            raise KeyError(key)
+        if key == 'Err':
+            return str(self._err[ind])
+        if key == 'Wrn':
+            return str(self._wrn[ind])
+        if key == 'Time':
+            return self._time[ind]
+        if key == 'CheckerTime':
+            return self._timeChecker[ind]
+
+        col = self._col.get(ind)
+        if col and key in col:
+            return col[key]
+
+        return self._get_color(ind, key)
+
+    def _set(self, ind, key, val):
+        if key == 'Pck':
+            #names of all following rows are moved
+            name = val.encode('utf-8')
+            delta = len(name) - (self._offsets[ind+1] - self._offsets[ind])
+            self._names[self._offsets[ind]:self._offsets[ind+1]] = name
+            if delta:
+                for i in range(ind+1, len(self._offsets)):
+                    self._offsets[i] += delta
+            self._changes += 1
+        elif key == 'Res':
+            self._res[ind] = self._get_code(val)
+        elif key == 'Err':
+            self._err[ind] = int(val)
+        elif key == 'Wrn':
+            self._wrn[ind] = int(val)
+        elif key == 'Time':
+            self._time[ind] = -1 if val is None else float(val)
+        elif key == 'CheckerTime':
+            self._timeChecker[ind] = -1 if val is None else float(val)
+        elif not key in self._get_keys(ind):
+            raise KeyError(key)
+        elif val == self._get_color(ind, key):
+            self._col.get(ind, {}).pop(key, None)
+        else:
+            self._col.setdefault(ind, {})[key] = val
+
+    def _get_color(self, ind, key):
+        """
+        Returns the color of a cell, which is derived from the reports colors.
+        """
+
+        colors = self._report.colors
+
+        if key == 'colRes':
+            return self._get_res_color(colors, self._lRes[self._res[ind]])
+        if key == 'colErr':
+            return 'white' if self._err[ind]==0 else colors['cErr']
+        if key == 'colWrn':
+            return 'white' if self._wrn[ind]==0 else colors['cWrn']
+
+        return 'white'
+
+
+class _Row(collections.abc.MutableMapping):
+    """
+    A row of Report.cont, which behaves like a dictionary.
+    """
+
+    __slots__ = ('_rows', '_ind')
+
+    def __init__(self, rows, ind):
+        self._rows = rows
+        self._ind = ind
+
+    def __getitem__(self, key):
+        return self._rows._get(self._ind, key)
+
+    def __setitem__(self, key, val):
+        self._rows._set(self._ind, key, val)
+
+    def __delitem__(self, key):
+        raise TypeError('\n\n => Keys of rows of \'cont\' can not be deleted! <=')
+
+    def __iter__(self):
+        return iter(self._rows._get_keys(self._ind))
+
+    def __len__(self):
+        return len(self._rows._get_keys(self._ind))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+###############################################################################
+#LIBRARY TREE
+###############################################################################
+class LibraryWalker(object):
+    """
+    Returns a new LibraryWalker instance.
+
+    Traverses the package tree of a Modelica library, which is given by the
+    files package.order. Each directory is listed once by os.scandir(), so
+    no further stat calls are needed to distinguish packages from models.
+    Contents of package.order and the subdirectories of each package are
+    cached by the instance, i.e. create a new instance to see changes of the
+    library.
+
+    The cache can be persisted as an index of the library tree. Entries of
+    the index are revalidated by the modification times of the directory
+    and its package.order (two stat calls per package), only changed
+    directories are read again.
+
+    ATTRIBUTES:
+    modelica_lib_path (string):
+        Path to a Modelica library
+
+    OPTIONAL ATTRIBUTES:
+    index_path (string, default=None):
+        Path to a file, in which the index is persisted.
+
+    API:
+    walk(curPckDP=None, depth=1):
+        Returns all packages/models of a package up to the given level.
+
+    get_package_order(curPckDP):
+        Returns the (cached) entries of the package.order of a package.
+
+    save():
+        Writes the index to index_path, if it has changed.
+    """
+
+    #increase, if the format of the persisted index changes
+    _version = 1
+
+    def __init__(self, modelica_lib_path, index_path=None):
+
+        self.modelica_lib_path = os.path.abspath(modelica_lib_path)
+        self.index_path = index_path
+
+        #entries of package.order and names of subdirectories of each package
+        #(None, if the directory is not a package)
+        self._packages = {}
+
+        #persisted entries of each directory (relative path using slashes):
+        #[mtime of directory, mtime of package.order, entries, subdirectories]
+        self._index = {}
+        self._changed = False
+
+        if index_path:
+            try:
+                with open(index_path) as file:
+                    data = json.load(file)
+                if data['version'] == self._version and data['lib'] == self.modelica_lib_path:
+                    self._index = data['dirs']
+            except (OSError, ValueError, KeyError):
+                pass
+
+
+    #PUBLIC API
+    ###########################################################################
+    def walk(self, curPckDP=None, depth=1):
+        """
+        Returns all packages/models of a package up to the given level in
+        order of the files package.order (depth first). Subpackages above the
+        given level are not returned themselves, but their content.
+
+        OPTIONAL ARGUMENTS:
+        curPckDP (string, default=modelica_lib_path):
+            path to the package, whose content is returned
+        depth (int, default=1):
+            level of detail, '-1' returns all packages/models
+
+        RETURNS:
+        lItems (list of tuples):
+            (Modelica path including the library name, filesystem path,
+             level, is_package) of each package/model, e.g.
+            ('test_library.L1Pck1', '.../test_library/L1Pck1', 1, True)
+        """
+
+        curPckDP = os.path.abspath(curPckDP or self.modelica_lib_path)
+        pmoCurPck = os.path.relpath(curPckDP, os.path.dirname(self.modelica_lib_path)).replace(os.sep, '.')
+
+        lItems = []
+        self._walk(curPckDP, pmoCurPck, 1, depth, lItems)
+        return lItems
+
+    def get_package_order(self, curPckDP):
+        """
+        Returns the entries of the package.order of a package (list of
+        strings) or None, if the directory is not a package.
+        """
+
+        package = self._get_package(os.path.abspath(curPckDP))
+        return package and package[0]
+
+    def save(self):
+        """
+        Writes the index to index_path, if it has changed. Directories, which
+        do not exist anymore, are removed from the index.
+        """
+
+        if not self.index_path or not self._changed:
+            return
+
+        self._index = {rel:entry for rel, entry in self._index.items()
+                       if self._get_abs(rel) in self._packages or os.path.isdir(self._get_abs(rel))}
+
+        tmpFP = '{}.tmp'.format(self.index_path)
+        with open(tmpFP, 'w') as file:
+            json.dump({'version':self._version, 'lib':self.modelica_lib_path, 'dirs':self._index}, file)
+        os.replace(tmpFP, self.index_path)
+        self._changed = False
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _walk(self, curPckDP, pmoCurPck, curLevel, depth, lItems):
+        package = self._get_package(curPckDP)
+        if package is None:
+            return
+
+        lOrder, sDirs = package
+        for elem in lOrder:
+            pCurEl = os.path.join(curPckDP, elem)
+            pmoCurEl = '{}.{}'.format(pmoCurPck, elem)
+
+            if depth != -1 and curLevel >= depth:
+                lItems.append((pmoCurEl, pCurEl, curLevel, elem in sDirs))
+            elif elem in sDirs:
+                self._walk(pCurEl, pmoCurEl, curLevel + 1, depth, lItems)
+            else:
+                lItems.append((pmoCurEl, pCurEl, curLevel, False))
+
+    def _get_package(self, curPckDP):
+        """
+        Returns the entries of package.order and the names of subdirectories
+        of a directory (tuple) or None, if it is not a package. Each directory
+        is only read once and only, if its entry of the index is outdated.
+        """
+
+        try:
+            return self._packages[curPckDP]
+        except KeyError:
+            pass
+
+        rel = os.path.relpath(curPckDP, self.modelica_lib_path).replace(os.sep, '/')
+        stamps = self._get_stamps(curPckDP)
+        entry = self._index.get(rel)
+
+        if entry is not None and entry[:2] == stamps:
+            package = None if entry[2] is None else (entry[2], set(entry[3]))
+        else:
+            package = self._read_package(curPckDP)
+            if self.index_path:
+                self._index[rel] = stamps + ([None, None] if package is None else [package[0], sorted(package[1])])
+                self._changed = True
+
+        self._packages[curPckDP] = package
+        return package
+
+    def _read_package(self, curPckDP):
+        package = None
+        try:
+            with os.scandir(curPckDP) as it:
+                sDirs = set()
+                bOrder = False
+                for entry in it:
+                    if entry.name == 'package.order':
+                        bOrder = True
+                    elif entry.is_dir():
+                        sDirs.add(entry.name)
+
+            if bOrder:
+                with open(os.path.join(curPckDP, 'package.order')) as file:
+                    lOrder = [elem.strip() for elem in file.read().splitlines() if elem.strip()]
+                package = (lOrder, sDirs)
+        except OSError:
+            pass
+
+        return package
+
+    def _get_stamps(self, curPckDP):
+        """
+        Returns the modification times of a directory and its package.order
+        (None, if they do not exist). Without index, no stamps are needed.
+        """
+
+        if not self.index_path:
+            return [None, None]
+
+        stamps = []
+        for path in (curPckDP, os.path.join(curPckDP, 'package.order')):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+
+        return stamps
+
+    def _get_abs(self, rel):
+        return os.path.join(self.modelica_lib_path, *rel.split('/'))
+
+
+###############################################################################
+#CHECKER BACKENDS
+###############################################################################
+class CheckerError(Exception):
+    """
+    Raised by a checker backend, if the checker fails, e.g. if it could not be
+    started or if it crashed while checking a package/model.
+    """
+
+
+class CheckerBackend(object):
+    """
+    Base class of all checker backends.
+
+    A checker backend actually applies checkModel() to packages/models of a
+    Modelica library on behalf of a DymolaMode instance. Results are exchanged
+    via a log file: each call of check_model() appends one row
+
+        [name] [result] [number of errors] [number of warnings]
+
+    to the log file, which is exactly the format written by Dymola. Checkers,
+    which measure the duration of checkModel() themselves, may append it in
+    seconds as fifth value. It is stored in addition to the round-trip time
+    of the call (see option report_timing of DymolaMode).
+
+    API:
+    connect():
+        Starts the checker and establishes the connection to it.
+
+    open_model(filepath):
+        Loads a Modelica library given by the path to its package.mo.
+
+    close_model(name):
+        Unloads a Modelica library given by its name.
+
+    set_pedantic(flag):
+        Activates (flag=True) or deactivates the pedantic mode of checkModel().
+
+    check_model(mopath, name, logFP):
+        Applies checkModel() to the package/model mopath (Modelica syntax,
+        including the library name) and appends the result for name to the
+        log file logFP.
+
+    check_models(lItems, logFP):
+        Same as check_model(), but for a list of tuples (mopath, name) at
+        once.
+
+    get_results(logFP, pos=0):
+        Returns all result rows of the log file logFP starting at position
+        pos and the position after the last row.
+
+    shutdown():
+        Closes the checker and the connection to it.
+
+    kill():
+        Terminates the checker immediately, e.g. if it hangs. It is called
+        from another thread, while a call of check_model() or check_models()
+        may still be blocking, which must then return or raise. connect()
+        starts a new checker afterwards.
+
+    clone():
+        Returns a new, not connected backend with the same configuration,
+        e.g. for parallel workers.
+
+    version (string):
+        Identifies the checker and its configuration, e.g. for caching of
+        results.
+
+    Derived classes must implement all methods but check_models(),
+    get_results() and kill(), which is only required by the option
+    'check_timeout' of DymolaMode.
+    """
+
+    def connect(self):
+        raise NotImplementedError
+
+    def open_model(self, filepath):
+        raise NotImplementedError
+
+    def close_model(self, name):
+        raise NotImplementedError
+
+    def set_pedantic(self, flag):
+        raise NotImplementedError
+
+    def check_model(self, mopath, name, logFP):
+        raise NotImplementedError
+
+    def check_models(self, lItems, logFP):
+        for mopath, name in lItems:
+            self.check_model(mopath, name, logFP)
+
+    def _poll(self, probe, timeout):
+        """
+        Calls probe with exponential backoff until it returns True.
+
+        ARGUMENTS:
+        probe (callable):
+            returns True, if the checker is ready. Exceptions are interpreted
+            as 'not ready'.
+
+        timeout (float):
+            overall timeout in seconds
+
+        RETURNS:
+        elapsed (float):
+            time in seconds until the checker was ready
+        """
+
+        t0 = time.monotonic()
+        delay = 0.05
+        while True:
+            try:
+                if probe():
+                    return time.monotonic() - t0
+            except CheckerError:
+                raise
+            except Exception:
+                pass
+
+            remaining = timeout - (time.monotonic() - t0)
+            if remaining <= 0:
+                raise CheckerError('\n\n => Checker did not respond within {} s! <='.format(timeout))
+
+            time.sleep(min(delay, remaining))
+            delay = min(2*delay, 2.0)
+
+    def get_results(self, logFP, pos=0):
+        """
+        Reads result rows from the log file.
+
+        ARGUMENTS:
+        logFP (string):
+            filepath of log file
+
+        OPTIONAL ARGUMENT:
+        pos (int, default=0):
+            position in the log file, from which on rows are read
+
+        RETURNS:
+        lines, pos (list of strings, int):
+            result rows and the position after the last row
+        """
+
+        if not os.path.exists(logFP):
+            return [], pos
+
+        with open(logFP) as file:
+            file.seek(pos)
+            lines = file.read().splitlines()
+            pos = file.tell()
+
+        return lines, pos
+
+    def shutdown(self):
+        raise NotImplementedError
+
+    def kill(self):
+        raise NotImplementedError
+
+    def clone(self):
+        raise NotImplementedError
+
+    @property
+    def version(self):
+        return self.__class__.__name__
+
+
+def _import_dde():
+    """
+    Imports and returns the module dde of pywin32, which is only available on
+    Windows. win32ui must be imported beforehand.
+    """
+
+    try:
+        import win32ui;
+        import dde;
+    except ImportError:
+        raise ImportError('\n\n => DdeBackend requires pywin32 (modules \'win32ui\' and \'dde\')! <=') from None
+
+    return dde
+
+
+class DdeBackend(CheckerBackend):
+    """
+    Returns a new DdeBackend instance.
+
+    Applies checkModel() by remote controlling Dymola via DDE. This backend is
+    only available on Windows, as it requires pywin32.
+
+    ATTRIBUTES:
+    dymola_path(string):
+        Path to the Dymola installation, e.g. dymola.exe
+
+    OPTIONAL ATTRIBUTES:
+    startup_timeout (float, default=60):
+        Maximum time in seconds until Dymola must respond after its start.
+    """
+
+    #Modelica function of check_models(), equivalent to the code of check_model(),
+    #additionally the duration of checkModel() (measured by Dymola) is logged
+    _moCheckFunction = '''function MolianaCheckModel
+  "Applies checkModel() and prints name, result, number of errors and warnings and duration to a log file"
+  input String model;
+  input String name;
+  input String logFile;
+protected
+  Boolean bCheck;
+  String s;
+  Integer indW1;
+  Integer indW2;
+  Integer indE1;
+  Integer indE2;
+  String nWarnings;
+  String nErrors;
+  Integer t0[4];
+  Integer t1[4];
+  String sTime;
+algorithm
+  (t0[1], t0[2], t0[3], t0[4]) := Modelica.Utilities.System.getTime();
+  bCheck := checkModel(model);
+  (t1[1], t1[2], t1[3], t1[4]) := Modelica.Utilities.System.getTime();
+  sTime := " " + String(mod((t1[4]-t0[4])*3600 + (t1[3]-t0[3])*60 + (t1[2]-t0[2]) + (t1[1]-t0[1])/1000, 86400), significantDigits=9);
+  s := getLastError();
+  if bCheck then
+    indW1 := Modelica.Utilities.Strings.findLast(s, "WARNING:");
+    if indW1 > 0 then
+      indW2 := Modelica.Utilities.Strings.findLast(s, " warnings were issued");
+      if indW2 > 0 then
+        nWarnings := Modelica.Utilities.Strings.substring(s, indW1+9, indW2-1);
+      else
+        nWarnings := "1";
+      end if;
+      Modelica.Utilities.Streams.print(name + " True 0 " + nWarnings + sTime, logFile);
+    else
+      Modelica.Utilities.Streams.print(name + " True 0 0" + sTime, logFile);
+    end if;
+  else
+    indE1 := Modelica.Utilities.Strings.findLast(s, "ERROR:");
+    if indE1 > 0 then
+      indE2 := Modelica.Utilities.Strings.findLast(s, " errors were found");
+      if indE2 > 0 then
+        nErrors := Modelica.Utilities.Strings.substring(s, indE1+7, indE2-1);
+      else
+        nErrors := "1";
+      end if;
+      indW1 := Modelica.Utilities.Strings.findLast(s, "WARNING:");
+      indW2 := Modelica.Utilities.Strings.findLast(s, " warnings were issued");
+      if indW2 > 0 then
+        nWarnings := Modelica.Utilities.Strings.substring(s, indW1+9, indW2-1);
+      else
+        nWarnings := "1";
+      end if;
+      Modelica.Utilities.Streams.print(name + " False " + nErrors + " " + nWarnings + sTime, logFile);
+    elseif Modelica.Utilities.Strings.findLast(s, "Did not find model") > 0 then
+      Modelica.Utilities.Streams.print(name + " Not_found 0 0" + sTime, logFile);
+    end if;
+  end if;
+  annotation(__Dymola_interactive=true);
+end MolianaCheckModel;
+'''
+
+    def __init__(self, dymola_path, startup_timeout=60):
+
+        assert dymola_path, '\n\n => DdeBackend requires the path to the Dymola installation! <='
+        _Validator('dymola_path',dymola_path)
+
+        self.dymola_path = dymola_path
+        self.startup_timeout = startup_timeout
+        self._ddeServer = None
+        self._ddeConv = None
+        self._process = None
+        self._tmpDP = None
+
+    def connect(self):
+        """
+        Opens Dymola and establishes the DDE connection. Returns as soon as
+        Dymola responds to a no-op command.
+        """
+
+        import subprocess;
+        dde = _import_dde()
+
+        #dispose of the connection to a killed Dymola
+        self._dispose()
+
+        #Establish connection
+        self._ddeServer = dde.CreateServer();
+        self._ddeServer.Create("TestClient");
+        self._ddeConv = dde.CreateConversation(self._ddeServer);
+
+        #open Dymola and wait until it responds
+        self._process = subprocess.Popen(self.dymola_path, stdin=subprocess.PIPE);
+        connected = []
+
+        def probe():
+            if self._process.poll() is not None:
+                raise CheckerError('\n\n => Dymola terminated during startup! <=')
+            if not connected:
+                self._ddeConv.ConnectTo("dymola", " ");
+                connected.append(True)
+            self._ddeConv.Exec("true");
+            return True
+
+        try:
+            self._poll(probe, self.startup_timeout)
+        except CheckerError:
+            self._process.kill()
+            raise
+
+    def open_model(self, filepath):
+        self._ddeConv.Exec("openModel(\"" + filepath.replace('\\', '/') + "\")");
+
+    def close_model(self, name):
+        self._ddeConv.Exec("eraseClasses({{\"{}\"}})".format(name));
+
+    def set_pedantic(self, flag):
+        self._ddeConv.Exec("Advanced.PedanticModelica={}".format(str(flag).lower()));
+
+    def check_model(self, mopath, name, logFP):
+        """
+        Applies Dymolas checkModel() to a given package/model. The result is
+        parsed from getLastError() and written to the log file within Dymola.
+
+        ARGUMENTS:
+        mopath (string):
+            package/model in Modelica syntax, including the library name
+
+        name (string):
+            name of the package/model in the log file
+
+        logFP (string):
+            filepath of log file
+        """
+
+        #replace \ with / to escape \t,\b etc
+        pathFP = logFP.replace('\\','/')
+
+        #actually applying the check and saving the result
+        moCode = ["if bCheck then ",
+                  "s = getLastError(); ",
+                  "indW1 = Modelica.Utilities.Strings.findLast(s,\"WARNING:\"); ",
+                  "if indW1>0 then ",
+                  "indW2 = Modelica.Utilities.Strings.findLast(s,\" warnings were issued\"); ",
+                  "if indW2 >0 then ",
+                  "nWarnings = Modelica.Utilities.Strings.substring(s,indW1+9,indW2-1); ",
+                  "else ",
+                  "nWarnings = \"1\"; "
+                  "end if; ",
+                  "Modelica.Utilities.Streams.print(\"{} True 0 \" + nWarnings,\"{}\"); ".format(name, pathFP),
+                  "else ",
+                  "Modelica.Utilities.Streams.print(\"{} True 0 0\",\"{}\"); ".format(name, pathFP),
+                  "end if; ",
+                  "else ",
+                  "s = getLastError(); ",
+                  "indE1 = Modelica.Utilities.Strings.findLast(s,\"ERROR:\"); ",
+                  "if indE1>0 then ",
+                  "indE2 = Modelica.Utilities.Strings.findLast(s,\" errors were found\"); ",
+                  "if indE2 >0 then ",
+                  "nErrors = Modelica.Utilities.Strings.substring(s,indE1+7,indE2-1); ",
+                  "else ",
+                  "nErrors = \"1\"; ",
+                  "end if; ",
+                  "indW1 = Modelica.Utilities.Strings.findLast(s,\"WARNING:\"); ",
+                  "indW2 = Modelica.Utilities.Strings.findLast(s,\" warnings were issued\"); ",
+                  "if indW2 >0 then ",
+                  "nWarnings = Modelica.Utilities.Strings.substring(s,indW1+9,indW2-1); ",
+                  "else ",
+                  "nWarnings = \"1\"; "
+                  "end if; ",
+                  "Modelica.Utilities.Streams.print(\"{} False \" + nErrors + \" \" + nWarnings,\"{}\"); ".format(name, pathFP),
+                  "else ",
+                  "if Modelica.Utilities.Strings.findLast(s,\"Did not find model\")>0 then ",
+                  "Modelica.Utilities.Streams.print(\"{} Not_found 0 0\",\"{}\"); ".format(name, pathFP),
+                  "end if; ",
+                  "end if; ",
+                  "end if; "]
+
+        smoCode =  " ".join("{}".format(row) for row in moCode)
+        self._ddeConv.Exec("bCheck = checkModel(\"{}\"); ".format(mopath))
+        self._ddeConv.Exec(smoCode)
+
+    def check_models(self, lItems, logFP):
+        """
+        Applies Dymolas checkModel() to several packages/models with a single
+        DDE call: a script is generated, which calls a Modelica function for
+        each package/model. The function is loaded once per connection and
+        parses the result exactly like check_model().
+
+        ARGUMENTS:
+        lItems (list of tuples):
+            packages/models in Modelica syntax, including the library name,
+            and their names in the log file
+
+        logFP (string):
+            filepath of log file
+        """
+
+        import tempfile;
+
+        if self._tmpDP is None:
+            self._tmpDP = tempfile.mkdtemp(prefix='moliana')
+            funFP = os.path.join(self._tmpDP, 'MolianaCheckModel.mo')
+            with open(funFP, 'w') as file:
+                file.write(self._moCheckFunction)
+            self._ddeConv.Exec("openModel(\"{}\", changeDirectory=false)".format(funFP.replace('\\', '/')))
+
+        #replace \ with / to escape \t,\b etc
+        pathFP = logFP.replace('\\','/')
+
+        mosFP = os.path.join(self._tmpDP, 'checkModels.mos')
+        with open(mosFP, 'w') as file:
+            for mopath, name in lItems:
+                file.write('MolianaCheckModel("{}", "{}", "{}");\n'.format(mopath, name, pathFP))
+
+        self._ddeConv.Exec("RunScript(\"{}\")".format(mosFP.replace('\\', '/')))
+
+    def shutdown(self):
+        """
+        Closes Dymola and shuts down the DDE server.
+        """
+
+        #close dymola
+        self._ddeConv.Exec('exit()')
+
+        #shutdown server, delete generated scripts
+        self._dispose()
+
+    def kill(self):
+        """
+        Kills the Dymola process, a blocking DDE call then fails.
+        """
+
+        if self._process is not None:
+            self._process.kill()
+
+    def clone(self):
+        return DdeBackend(self.dymola_path, self.startup_timeout)
+
+    def _dispose(self):
+        """
+        Shuts down the DDE server and deletes the generated scripts (the
+        Modelica function of check_models() must be loaded again by a new
+        Dymola).
+        """
+
+        import shutil;
+
+        if self._ddeServer is not None:
+            self._ddeServer.Shutdown()
+            self._ddeServer = None
+            self._ddeConv = None
+
+        if self._tmpDP:
+            shutil.rmtree(self._tmpDP, ignore_errors=True)
+            self._tmpDP = None
+
+    @property
+    def version(self):
+        return 'DdeBackend {}'.format(self.dymola_path)
+
+
+class FakeBackend(CheckerBackend):
+    """
+    Returns a new FakeBackend instance.
+
+    Pure-Python stand-in for Dymola, which allows to run, profile and
+    load-test DymolaMode without Dymola (and on any platform). The sources of
+    checked packages/models are located and read from disk, results are
+    scripted.
+
+    OPTIONAL ATTRIBUTES:
+    results (dictionary, default={}):
+        Scripted results. Keys are packages/models as listed in the report
+        (Modelica syntax without library name), values are tuples of result,
+        number of errors and number of warnings.
+        Example: results = {'L1Pck3.L2Model2_bad':('False', 2, 1)}
+
+    default (tuple, default=('True', 0, 0)):
+        Result of all found packages/models, which are not part of results.
+        Packages/models without sources result in ('Not_found', 0, 0).
+
+    latency (float or dictionary, default=0):
+        Duration of each checkModel() in seconds. If a dictionary is given,
+        keys are packages/models (see results) and the duration of all other
+        packages/models is zero.
+
+    failures (list, default=[]):
+        Packages/models (see results), for which check_model() raises a
+        CheckerError, i.e. simulates a crashing checker.
+
+    startup (float, default=0):
+        Time in seconds until the checker responds after connect() has been
+        called.
+
+    startup_timeout (float, default=60):
+        Maximum time in seconds until the checker must respond.
+
+    overhead (float, default=0):
+        Duration of each call of check_model() or check_models() in seconds,
+        in addition to latency, e.g. the round-trip time of DDE.
+
+    hangs (list, default=[]):
+        Packages/models (see results), for which check_model() does not
+        return until the checker is killed, i.e. simulates a hanging checker.
+
+    timing (bool, default=False):
+        If true, the latency of each package/model is appended to its result
+        row as duration measured by the checker, like Dymola does within
+        check_models() of DdeBackend.
+
+    After a check, attribute 'calls' gives the number of calls of
+    check_model() and check_models() (including all clones).
+
+    Attribute 'opened' lists all libraries loaded by open_model() (including
+    all clones).
+
+    After a check, attribute 'checked' lists all packages/models (see
+    results) in the order check_model() has been applied to them (including
+    all clones).
+    """
+
+    def __init__(self, results=None, default=('True',0,0), latency=0, failures=None, startup=0, overhead=0,
+                 startup_timeout=60, hangs=None, timing=False):
+
+        self.results = results or {}
+        self.default = default
+        self.latency = latency
+        self.failures = failures or []
+        self.startup = startup
+        self.overhead = overhead
+        self.startup_timeout = startup_timeout
+        self.hangs = hangs or []
+        self.timing = timing
+        self.checked = []
+        self.opened = []
+        self._calls = []
+        self.pedantic = False
+        self._libDP = None
+        self._killed = threading.Event()
+
+    def connect(self):
+        self._killed.clear()
+        tReady = time.monotonic() + self.startup
+        self._poll(lambda: time.monotonic() >= tReady, self.startup_timeout)
+
+    def open_model(self, filepath):
+        if not os.path.isfile(filepath):
+            raise CheckerError('\n\n => Could not open model \'{}\'! <='.format(filepath))
+
+        self._libDP = os.path.dirname(filepath)
+        self.opened.append(filepath)
+
+    def close_model(self, name):
+        self._libDP = None
+
+    def set_pedantic(self, flag):
+        self.pedantic = flag
+
+    def check_model(self, mopath, name, logFP):
+        """
+        Locates and reads the sources of mopath and appends the scripted
+        result for name to the log file.
+
+        ARGUMENTS:
+        mopath (string):
+            package/model in Modelica syntax, including the library name
+
+        name (string):
+            name of the package/model in the log file and key of results,
+            latency and failures
+
+        logFP (string):
+            filepath of log file
+        """
+
+        self.check_models([(mopath, name)], logFP)
+
+    def check_models(self, lItems, logFP):
+        """
+        Same as check_model() for a list of tuples (mopath, name), but with
+        overhead of a single call.
+        """
+
+        self._calls.append(lItems)
+        if self.overhead:
+            self._sleep(self.overhead)
+
+        for mopath, name in lItems:
+            self.checked.append(name)
+
+            latency = self.latency.get(name, 0) if isinstance(self.latency, dict) else self.latency
+            if name in self.hangs:
+                self._sleep(None)
+            elif latency:
+                self._sleep(latency)
+
+            if name in self.failures:
+                raise CheckerError('\n\n => Checker failed on \'{}\'! <='.format(mopath))
+
+            if self._read_source(mopath):
+                res, err, wrn = self.results.get(name, self.default)
+            else:
+                res, err, wrn = 'Not_found', 0, 0
+
+            with open(logFP, 'a') as file:
+                if self.timing:
+                    file.write('{} {} {} {} {}\n'.format(name, res, err, wrn, latency))
+                else:
+                    file.write('{} {} {} {}\n'.format(name, res, err, wrn))
+
+    def shutdown(self):
+        self._libDP = None
+
+    def kill(self):
+        self._libDP = None
+        self._killed.set()
+
+    def clone(self):
+        """
+        Returns a new FakeBackend with the same configuration. Attributes
+        'checked', 'opened' and 'calls' are shared with this instance.
+        """
+
+        backend = FakeBackend(self.results, self.default, self.latency, self.failures, self.startup, self.overhead,
+                              self.startup_timeout, self.hangs, self.timing)
+        backend.checked = self.checked
+        backend.opened = self.opened
+        backend._calls = self._calls
+        return backend
+
+    @property
+    def calls(self):
+        return len(self._calls)
+
+    @property
+    def version(self):
+        return 'FakeBackend {} {}'.format(sorted(self.results.items()), self.default)
+
+    def _sleep(self, duration):
+        """
+        Waits for given duration in seconds (None: forever), but raises a
+        CheckerError as soon as the checker is killed.
+        """
+
+        if self._killed.wait(duration):
+            raise CheckerError('\n\n => Checker has been killed! <=')
+
+    def _read_source(self, mopath):
+        """
+        Reads the source of a package/model of the opened library.
+
+        ARGUMENTS:
+        mopath (string):
+            package/model in Modelica syntax, including the library name
+
+        RETURNS:
+        True, if the source could be found, else False
+        """
+
+        if self._libDP is None:
+            raise CheckerError('\n\n => No library opened! <=')
+
+        pEl = os.path.join(os.path.dirname(self._libDP), *mopath.split('.'))
+        inParent = False
+
+        if os.path.isfile(os.path.join(pEl, 'package.mo')):
+            filepath = os.path.join(pEl, 'package.mo')
+        elif os.path.isfile(pEl + '.mo'):
+            filepath = pEl + '.mo'
+        elif os.path.isfile(os.path.join(os.path.dirname(pEl), 'package.mo')):
+            #class might be defined within the package.mo of its parent
+            filepath = os.path.join(os.path.dirname(pEl), 'package.mo')
+            inParent = True
+        else:
+            return False
+
+        with open(filepath, encoding='utf-8', errors='replace') as file:
+            source = file.read()
+
+        return not inParent or os.path.basename(pEl) in source.split()
+
+
+class CheckerSession(object):
+    """
+    Returns a new CheckerSession instance.
+
+    A session keeps checkers (e.g. Dymola instances) running and a Modelica
+    library loaded across several checks - also of different DymolaMode
+    instances, e.g. with different modelica_lib_firstlevel or report
+    options. The library is only loaded again, if its sources (.mo and
+    package.order files) have been changed on disk. Checkers are only closed
+    by close() or at the end of a with-block.
+
+    EXAMPLE:
+        with moliana.CheckerSession(moliana.DdeBackend(pDym)) as session:
+            dm = moliana.DymolaMode(pLib, None, session=session)
+            dm.execute_check('html')
+            dm = moliana.DymolaMode(pLib, None, session=session,
+                                    modelica_lib_firstlevel='A')
+            dm.execute_check('html')
+
+    ATTRIBUTES:
+    checker_backend (CheckerBackend):
+        Backend of the first checker. Further checkers (see option 'workers'
+        of DymolaMode) are clones of it.
+
+    API:
+    acquire(modelica_lib_path, workers=1, hooks=None):
+        Returns the given number of connected checkers, which have loaded
+        the library. Checkers are started and the library is (re-)loaded only
+        if necessary. The session is locked until release() is called.
+
+    restart(backend, hooks=None):
+        Kills an acquired checker (e.g. a hanging one), starts it again and
+        loads the library.
+
+    release(failed=False):
+        Releases the checkers. If failed is True, the checkers are closed and
+        restarted at the next acquire().
+
+    close():
+        Closes all checkers.
+    """
+
+    def __init__(self, checker_backend):
+
+        _Validator('checker_backend',checker_backend)
+
+        self.checker_backend = checker_backend
+        self._backends = []
+        self._libPath = None
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    #PUBLIC API
+    ###########################################################################
+    def acquire(self, modelica_lib_path, workers=1, hooks=None):
+        """
+        Returns connected checkers, which have loaded a Modelica library.
+
+        ARGUMENTS:
+        modelica_lib_path (string):
+            Path to a Modelica library
+
+        OPTIONAL ARGUMENTS:
+        workers (int, default=1):
+            Number of checkers
+
+        hooks (list of callables, default=None):
+            Called with the events 'startup' and 'load', see option 'hooks'
+            of DymolaMode
+
+        RETURNS:
+        lBackends (list of CheckerBackend):
+            connected checkers
+        """
+
+        self._lock.acquire()
+        try:
+            fingerprint = _get_fingerprint(modelica_lib_path)
+
+            #reload library, if it has been changed or another one is checked
+            if self._backends and (modelica_lib_path != self._libPath or fingerprint != self._fingerprint):
+                _run_parallel(self._reload_library, [(backend, modelica_lib_path, hooks) for backend in self._backends])
+
+            self._libPath = modelica_lib_path
+            self._fingerprint = fingerprint
+
+            #start missing checkers
+            lNew = [self.checker_backend if not self._backends and i == 0 else self.checker_backend.clone()
+                    for i in range(len(self._backends), workers)]
+            lStarted = []
+            try:
+                _run_parallel(self._connect_backend, [(backend, hooks, lStarted) for backend in lNew])
+            except BaseException:
+                #close all checkers, which have been started nonetheless
+                for backend in lStarted:
+                    try:
+                        backend.shutdown()
+                    except Exception:
+                        pass
+                raise
+            self._backends.extend(lNew)
+
+            return self._backends[:workers]
+
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def restart(self, backend, hooks=None):
+        """
+        Kills an acquired checker, starts it again and loads the library.
+        Settings of the checker (e.g. the pedantic mode) are lost.
+
+        ARGUMENTS:
+        backend (CheckerBackend):
+            one of the checkers returned by acquire()
+
+        OPTIONAL ARGUMENTS:
+        hooks (list of callables, default=None):
+            Called with the events 'startup' and 'load', see option 'hooks'
+            of DymolaMode
+        """
+
+        backend.kill()
+        self._connect_backend(backend, hooks)
+
+    def release(self, failed=False):
+        """
+        Releases the checkers.
+
+        OPTIONAL ARGUMENTS:
+        failed (bool, default=False):
+            If True, all checkers are closed.
+        """
+
+        try:
+            if failed:
+                self._shutdown()
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """
+        Closes all checkers.
+        """
+
+        with self._lock:
+            self._shutdown()
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _connect_backend(self, backend, hooks=None, lStarted=None):
+        """
+        Opens Dymola (or respectively the checker of the backend) and loads
+        the library. Started checkers are appended to lStarted (if given).
+        """
+
+        with _Phase(hooks, 'startup'):
+            backend.connect()
+        if lStarted is not None:
+            lStarted.append(backend)
+
+        with _Phase(hooks, 'load', Path=self._libPath):
+            backend.open_model(os.path.join(self._libPath,'package.mo'))
+
+    def _reload_library(self, backend, modelica_lib_path, hooks=None):
+        """
+        Unloads the current library and loads another (or changed) one.
+        """
+
+        with _Phase(hooks, 'load', Path=modelica_lib_path):
+            backend.close_model(os.path.basename(self._libPath))
+            backend.open_model(os.path.join(modelica_lib_path,'package.mo'))
+
+    def _shutdown(self):
+        lBackends = self._backends
+        self._backends = []
+        self._libPath = None
+        for backend in lBackends:
+            backend.shutdown()
+
+
+def _run_parallel(func, args):
+    """
+    Executes a function in one thread per set of arguments and waits for all
+    threads. If a thread raises an exception, it is raised again. A single
+    set of arguments is executed directly.
+
+    ARGUMENTS:
+    func: function, which is executed (callable)
+    args: arguments of each call (list of tuples)
+    """
+
+    if len(args) == 1:
+        func(*args[0])
+        return
+
+    errors = []
+    def target(*arg):
+        try:
+            func(*arg)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target, args=arg) for arg in args]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _clear_queue(q):
+    """
+    Removes all items of a queue, which may be emptied by other threads at
+    the same time, e.g. to stop all workers.
+
+    ARGUMENT:
+    q: queue, which is emptied (Queue)
+    """
+
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _get_fingerprint(modelica_lib_path):
+    """
+    Returns a hash of paths, modification times and sizes of the Modelica
+    sources (.mo and package.order files) of a library. Other files, e.g.
+    log files, reports, checkpoints or caches, are ignored.
+    """
+
+    import hashlib;
+
+    sha = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(modelica_lib_path):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if fname.endswith('.mo') or fname == 'package.order':
+                st = os.stat(os.path.join(dirpath, fname))
+                sha.update('{} {} {}\n'.format(os.path.join(dirpath, fname), st.st_mtime_ns, st.st_size).encode('utf-8'))
+
+    return sha.hexdigest()
+
+
+###############################################################################
+#INSTRUMENTATION
+###############################################################################
+def _emit(hooks, name, phase, **payload):
+    """
+    Calls all hooks with an event (see option 'hooks' of DymolaMode). Without
+    hooks, nothing is done.
+
+    ARGUMENTS:
+    hooks (list of callables or None)
+    name (string): name of the phase, e.g. 'connect'
+    phase (string): 'Begin' or 'End'
+    payload: additional keys of the event, e.g. Path='...'
+    """
+
+    if not hooks:
+        return
+
+    event = dict(payload, Name=name, Phase=phase, Time=time.monotonic(), Thread=threading.get_ident())
+    for hook in hooks:
+        hook(event)
+
+
+class _Phase(object):
+    """
+    Returns a new _Phase instance.
+
+    Context manager, which calls all hooks with the events 'Begin' and 'End'
+    of a phase (see _emit()). The event 'End' is also emitted, if the phase
+    fails, then with the name of the exception as key 'Exception'. Keys of
+    the dictionary returned by the with statement are added to the event
+    'End'.
+
+    USAGE:
+        with _Phase(hooks, 'worklist', Library='A') as end:
+            end['Count'] = 3
+    """
+
+    def __init__(self, hooks, name, **payload):
+
+        self.hooks = hooks
+        self.name = name
+        self.payload = payload
+        self.end = {}
+
+    def __enter__(self):
+        _emit(self.hooks, self.name, 'Begin', **self.payload)
+        return self.end
+
+    def __exit__(self, excType, exc, tb):
+        #a generator stopped by the caller has not failed
+        if excType is not None and not issubclass(excType, GeneratorExit):
+            self.end['Exception'] = excType.__name__
+        _emit(self.hooks, self.name, 'End', **self.end)
+
+
+class TraceCollector(object):
+    """
+    Returns a new TraceCollector instance.
+
+    Hook (see option 'hooks' of DymolaMode), which collects all events of
+    checks and writes them as JSON file in the Chrome trace event format,
+    which can be viewed e.g. by chrome://tracing or Perfetto. Each thread
+    (i.e. each worker) is shown as its own track, payloads of the events are
+    shown as arguments.
+
+    EXAMPLE:
+        trace = moliana.TraceCollector('trace.json')
+        moliana.DymolaMode(pLib, pDym, hooks=[trace]).execute_check('html')
+        trace.save()
+
+    ATTRIBUTES:
+    filepath (string):
+        Path of the JSON file
+
+    API:
+    save():
+        Writes all events collected so far to filepath.
+
+    events (list of dictionaries):
+        All events collected so far
+    """
+
+    def __init__(self, filepath):
+
+        self.filepath = filepath
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+    #PUBLIC API
+    ###########################################################################
+    def save(self):
+        """
+        Writes all events collected so far to filepath. Timestamps are given
+        in microseconds since the first event.
+        """
+
+        t0 = self.events[0]['Time'] if self.events else 0
+        pid = os.getpid()
+
+        lEvents = []
+        for event in self.events:
+            lEvents.append({'name':event['Name'],
+                            'ph':'B' if event['Phase'] == 'Begin' else 'E',
+                            'ts':round((event['Time'] - t0)*1e6, 1),
+                            'pid':pid,
+                            'tid':event['Thread'],
+                            'args':{key:val for key, val in event.items() if not key in ('Name', 'Phase', 'Time', 'Thread')}})
+
+        with open(self.filepath, 'w') as file:
+            json.dump({'traceEvents':lEvents, 'displayTimeUnit':'ms'}, file, default=str)
+
+
+###############################################################################
+#RESULT CACHE
+###############################################################################
+class _ResultCache(object):
+    """
+    Returns a new _ResultCache instance.
+
+    Persistent cache of the result rows of checkModel(). Entries are keyed by
+    the source of the checked package/model (its .mo file or all files of
+    its package directory), the sources of all files it depends on, its
+    name, the pedantic mode and the version of the checker. If there are more
+    than max_entries entries, least recently used entries are evicted.
+
+    USAGE:
+        cache = _ResultCache(filepath, max_entries)
+        key = cache.get_key(pCurEl, name, pedantic, version, deps)
+        lines = cache.get(key)
+        cache.put(key, lines)
+        cache.save()
+    """
+
+    #increase, if the format of keys or entries changes
+    _version = 3
+
+    def __init__(self, filepath, max_entries):
+
+        self.filepath = filepath
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+        try:
+            with open(filepath) as file:
+                data = json.load(file)
+            if data['version'] == self._version:
+                self._entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get_key(self, pCurEl, name, pedantic, version, deps=None):
+        """
+        Computes the key of a package/model.
+
+        ARGUMENTS:
+        pCurEl (string):
+            path to the package/model (without file extension)
+        name (string):
+            name of the package/model in the log file
+        pedantic (bool):
+            pedantic mode of checkModel()
+        version (string):
+            version of the checker
+
+        OPTIONAL ARGUMENTS:
+        deps (dictionary, default=None):
+            content hashes of all files, on which the package/model depends
+
+        RETURNS:
+        key (string):
+            hex digest of all inputs
+        """
+
+        import hashlib;
+
+        sha = hashlib.sha1('{}\n{}\n{}\n{}\n'.format(self._version, version, pedantic, name).encode('utf-8'))
+
+        for dep, depSha in sorted((deps or {}).items()):
+            sha.update('{} {}\n'.format(dep, depSha).encode('utf-8'))
+
+        if os.path.isdir(pCurEl):
+            for dirpath, dirnames, filenames in os.walk(pCurEl):
+                dirnames.sort()
+                for fname in sorted(filenames):
+                    if fname.startswith('checklog') and fname.endswith('.Log'):
+                        continue
+                    fp = os.path.join(dirpath, fname)
+                    sha.update(os.path.relpath(fp, pCurEl).replace(os.sep, '/').encode('utf-8'))
+                    self._update_hash(sha, fp)
+
+        elif os.path.isfile(pCurEl + '.mo'):
+            self._update_hash(sha, pCurEl + '.mo')
+
+        elif os.path.isfile(os.path.join(os.path.dirname(pCurEl), 'package.mo')):
+            #class might be defined within the package.mo of its parent
+            self._update_hash(sha, os.path.join(os.path.dirname(pCurEl), 'package.mo'))
+
+        return sha.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the cached result rows of key or None, if there are none.
+        """
+
+        lines = self._entries.pop(key, None)
+        if lines is None:
+            self.misses += 1
+            return None
+
+        #most recently used entries are stored last
+        self._entries[key] = lines
+        self.hits += 1
+        return lines
+
+    def put(self, key, lines):
+        """
+        Stores result rows for key and evicts least recently used entries.
+        """
+
+        self._entries.pop(key, None)
+        self._entries[key] = lines
+
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def save(self):
+        """
+        Writes the cache to disk.
+        """
+
+        tmpFP = '{}.tmp'.format(self.filepath)
+        with open(tmpFP, 'w') as file:
+            json.dump({'version':self._version, 'entries':self._entries}, file)
+        os.replace(tmpFP, self.filepath)
+
+    def _update_hash(self, sha, filepath):
+        with open(filepath, 'rb') as file:
+            sha.update(file.read())
+
+
+###############################################################################
+#CHECKPOINT
+###############################################################################
+class _Checkpoint(object):
+    """
+    Returns a new _Checkpoint instance.
+
+    Durable record of the result rows of a running check, so that an
+    interrupted check can be resumed (see options 'checkpoint_path' and
+    'resume' of DymolaMode). The file starts with a header, which identifies
+    the check (library, sources, work list and options), followed by one line
+    per finished package/model with its index in the work list and its
+    result rows. Each line is flushed to disk as soon as it is written, a
+    truncated last line (e.g. after a crash) is ignored.
+
+    USAGE:
+        checkpoint = _Checkpoint(filepath, header)
+        dResults = checkpoint.load()
+        checkpoint.start(dResults)
+        checkpoint.add(lInds, lResults)
+        checkpoint.close(remove=True)
+    """
+
+    #increase, if the format of the file changes
+    _version = 2
+
+    def __init__(self, filepath, header):
+
+        self.filepath = filepath
+        self.header = dict(header, version=self._version)
+        self._file = None
+
+    def load(self):
+        """
+        Returns the result rows recorded by a previous check with the same
+        header as dictionary {index in the work list: rows}. Checkpoints of
+        other checks are ignored.
+        """
+
+        dResults = {}
+        try:
+            with open(self.filepath) as file:
+                if json.loads(file.readline()) != self.header:
+                    return {}
+                for line in file:
+                    ind, lines = json.loads(line)
+                    dResults[ind] = lines
+        except (OSError, ValueError):
+            pass
+
+        return dResults
+
+    def start(self, dResults):
+        """
+        Starts a new checkpoint file, which contains the header and the
+        given result rows (e.g. of load()).
+        """
+
+        tmpFP = '{}.tmp'.format(self.filepath)
+        with open(tmpFP, 'w') as file:
+            file.write(json.dumps(self.header) + '\n')
+            for ind, lines in sorted(dResults.items()):
+                file.write(json.dumps([ind, lines]) + '\n')
+        os.replace(tmpFP, self.filepath)
+
+        self._file = open(self.filepath, 'a')
+
+    def add(self, lInds, lResults):
+        """
+        Appends the result rows of finished packages/models, given by their
+        indices in the work list, and flushes them to disk.
+        """
+
+        self._file.write(''.join(json.dumps([ind, lResults[ind]]) + '\n' for ind in lInds))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self, remove=False):
+        """
+        Closes the checkpoint file, which is deleted, if remove is True
+        (i.e. the check has been finished).
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if remove:
+            try:
+                os.remove(self.filepath)
+            except OSError:
+                pass
+
+
+###############################################################################
+#RESULT HISTORY
+###############################################################################
+class ResultHistory(object):
+    """
+    Returns a new ResultHistory instance.
+
+    Local SQLite database, which stores the results of several checks (runs),
+    so that the history of a library can be queried without reading any
+    HTML reports. Each run is stored with its library, branch, commit,
+    pedantic mode, level of detail and timings, each package/model with its
+    result and numbers of errors and warnings (NULL in mode 'compact').
+
+    EXAMPLE:
+        moliana.DymolaMode(pLib, pDym, history_path='history.db').execute_check()
+
+        with moliana.ResultHistory('history.db') as history:
+            history.get_first_failure('L1Pck1.L2Model1')
+
+    ATTRIBUTES:
+    filepath (string):
+        Path to the database file, which is created if necessary.
+
+    API:
+    add_run(report, commit=None, started=None, duration=None, checker=None):
+        Stores a report as a new run and returns its id.
+
+    get_runs(library=None, branch=None):
+        Returns all runs, optionally of a library and/or branch only.
+
+    get_latest_runs(library=None):
+        Returns the latest run of each branch.
+
+    get_results(run):
+        Returns the results of a run.
+
+    get_first_failure(name, library=None, branch=None):
+        Returns the run, since which a package/model fails.
+
+    get_warning_trend(library=None, branch=None):
+        Returns the number of warnings of each top-level package per run.
+
+    close():
+        Closes the database.
+    """
+
+    #increase, if the tables change
+    _version = 1
+
+    _tables = ['''CREATE TABLE IF NOT EXISTS runs (
+                      id INTEGER PRIMARY KEY,
+                      library TEXT NOT NULL,
+                      branch TEXT,
+                      git_commit TEXT,
+                      pedantic INTEGER,
+                      depth INTEGER,
+                      started REAL,
+                      startup REAL,
+                      duration REAL,
+                      checker TEXT,
+                      n_results INTEGER)''',
+               '''CREATE TABLE IF NOT EXISTS results (
+                      run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+                      name TEXT NOT NULL,
+                      toplevel TEXT NOT NULL,
+                      result TEXT NOT NULL,
+                      errors INTEGER,
+                      warnings INTEGER)''',
+               'CREATE INDEX IF NOT EXISTS runs_library_branch ON runs (library, branch, started)',
+               'CREATE INDEX IF NOT EXISTS results_name ON results (name, run_id)',
+               'CREATE INDEX IF NOT EXISTS results_run ON results (run_id, toplevel)']
+
+    _runKeys = ['id', 'library', 'branch', 'git_commit', 'pedantic', 'depth', 'started', 'startup',
+                'duration', 'checker', 'n_results']
+
+    #number of results, which are inserted at once
+    _batchSize = 10000
+
+    def __init__(self, filepath):
+
+        import sqlite3;
+
+        self.filepath = filepath
+        self._db = sqlite3.connect(filepath)
+
+        version = self._db.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, self._version):
+            self._db.close()
+            raise ValueError('\n\n => \'{}\' is a result history of an unsupported version ({})! <='.format(filepath, version))
+
+        with self._db:
+            for sql in self._tables:
+                self._db.execute(sql)
+            self._db.execute('PRAGMA user_version = {}'.format(self._version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    #PUBLIC API
+    ###########################################################################
+    def add_run(self, report, commit=None, started=None, duration=None, checker=None):
+        """
+        Stores the results of a report as a new run within a single
+        transaction.
+
+        ARGUMENTS:
+        report (Report):
+            report of a check, its meta information gives library ('pck'),
+            branch ('git'), pedantic mode ('ped'), level of detail ('lod')
+            and the time needed to start the checker ('startup')
+
+        OPTIONAL ARGUMENTS:
+        commit (string, default=None): git commit of the library
+        started (float, default=time.time()): start of the check (seconds
+            since the epoch)
+        duration (float, default=None): duration of the check in seconds
+        checker (string, default=None): version of the checker
+
+        RETURNS:
+        run (int):
+            id of the new run
+        """
+
+        meta = report.meta or {}
+        cont = report.cont if isinstance(report.cont, _Rows) else _Rows(report, report.cont or [])
+
+        ped = meta.get('ped')
+        lod = meta.get('lod')
+
+        with self._db:
+            cursor = self._db.execute('INSERT INTO runs (library, branch, git_commit, pedantic, depth, started, startup, duration, checker, n_results) '
+                                      'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                      (meta.get('pck', report.name), meta.get('git'), commit,
+                                       None if ped is None else int(str(ped) == 'True'),
+                                       None if lod is None else int(lod),
+                                       time.time() if started is None else started,
+                                       meta.get('startup'), duration, checker, len(cont)))
+            run = cursor.lastrowid
+
+            lResults = cont._lRes
+            lRows = []
+            for name, res, err, wrn in zip(cont._iter_names(), cont._res, cont._err, cont._wrn):
+                lRows.append((run, name, name.split('.', 1)[0], lResults[res],
+                              err if err >= 0 else None, wrn if wrn >= 0 else None))
+                if len(lRows) == self._batchSize:
+                    self._insert_results(lRows)
+                    lRows = []
+            self._insert_results(lRows)
+
+        return run
+
+    def get_runs(self, library=None, branch=None):
+        """
+        Returns all runs (oldest first) as dictionaries with the keys 'id',
+        'library', 'branch', 'git_commit', 'pedantic', 'depth', 'started',
+        'startup', 'duration', 'checker' and 'n_results'.
+
+        OPTIONAL ARGUMENTS:
+        library (string, default=None): only runs of this library
+        branch (string, default=None): only runs of this branch
+        """
+
+        sWhere, args = self._get_filter(library, branch)
+        return self._get_runs('SELECT * FROM runs {} ORDER BY started, id'.format(sWhere), args)
+
+    def get_latest_runs(self, library=None):
+        """
+        Returns the latest run of each branch as dictionary {branch: run}
+        (see get_runs()).
+
+        OPTIONAL ARGUMENTS:
+        library (string, default=None): only runs of this library
+        """
+
+        #runs are sorted oldest first, so the latest run of a branch remains
+        sWhere, args = self._get_filter(library, None)
+        lRuns = self._get_runs('SELECT * FROM runs {} ORDER BY started, id'.format(sWhere), args)
+
+        return {run['branch']:run for run in lRuns}
+
+    def get_results(self, run):
+        """
+        Returns the results of a run as list of tuples (name, result, errors,
+        warnings).
+        """
+
+        return self._db.execute('SELECT name, result, errors, warnings FROM results WHERE run_id = ? ORDER BY rowid', (run,)).fetchall()
+
+    def get_first_failure(self, name, library=None, branch=None):
+        """
+        Returns the first run of the latest uninterrupted series of runs, in
+        which a package/model failed (i.e. its result is not 'True'). Runs,
+        which did not include the package/model, are ignored.
+
+        ARGUMENTS:
+        name (string): name of the package/model, e.g. 'L1Pck1.L2Model1'
+
+        OPTIONAL ARGUMENTS:
+        library (string, default=None): only runs of this library
+        branch (string, default=None): only runs of this branch
+
+        RETURNS:
+        run (dictionary):
+            see get_runs(). None, if the package/model does not fail in its
+            latest run.
+        """
+
+        sWhere, args = self._get_filter(library, branch, 'AND')
+        sRuns = 'SELECT runs.*, results.result FROM results JOIN runs ON runs.id = results.run_id WHERE results.name = ? {}'.format(sWhere)
+
+        last = self._db.execute('{} AND results.result = \'True\' ORDER BY started DESC, id DESC LIMIT 1'.format(sRuns), [name] + args).fetchone()
+        lRuns = self._get_runs('{} AND results.result != \'True\' {} ORDER BY started, id LIMIT 1'.format(sRuns, '' if last is None else 'AND (started, id) > (?, ?)'),
+                               [name] + args + ([] if last is None else [last[6], last[0]]))
+
+        return lRuns[0] if lRuns else None
+
+    def get_warning_trend(self, library=None, branch=None):
+        """
+        Returns the number of warnings of each top-level package per run.
+
+        OPTIONAL ARGUMENTS:
+        library (string, default=None): only runs of this library
+        branch (string, default=None): only runs of this branch
+
+        RETURNS:
+        trend (dictionary):
+            {top-level package: [(run, started, warnings), ...]}, runs are
+            sorted oldest first. Runs without numbers of warnings (mode
+            'compact') are omitted.
+        """
+
+        sWhere, args = self._get_filter(library, branch, 'AND')
+        lRows = self._db.execute('SELECT results.toplevel, runs.id, runs.started, SUM(results.warnings) FROM results JOIN runs ON runs.id = results.run_id '
+                                 'WHERE results.warnings IS NOT NULL {} GROUP BY runs.id, results.toplevel ORDER BY runs.started, runs.id'.format(sWhere), args)
+
+        trend = {}
+        for toplevel, run, started, warnings in lRows:
+            trend.setdefault(toplevel, []).append((run, started, warnings))
+
+        return trend
+
+    def close(self):
+        """
+        Closes the database.
+        """
+
+        self._db.close()
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _insert_results(self, lRows):
+        self._db.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)', lRows)
+
+    def _get_filter(self, library, branch, sOp='WHERE'):
+        """
+        Returns the SQL condition (starting with sOp) and its arguments to
+        select runs of a library and/or branch.
+        """
+
+        lConditions = []
+        args = []
+        for key, val in (('library', library), ('branch', branch)):
+            if val is not None:
+                lConditions.append('runs.{} = ?'.format(key))
+                args.append(val)
+
+        if not lConditions:
+            return '', args
+
+        return '{} {}'.format(sOp, ' AND '.join(lConditions)), args
+
+    def _get_runs(self, sql, args):
+        return [dict(zip(self._runKeys, row)) for row in self._db.execute(sql, args)]
+
+
+###############################################################################
+#DEPENDENCIES
+###############################################################################
+class DependencyIndex(object):
+    """
+    Returns a new DependencyIndex instance.
+
+    Lightweight index of the dependencies between the .mo files of a Modelica
+    library. Each file is scanned for class declarations, extends- and
+    import-clauses and type references, which are resolved to the files, that
+    declare the referenced classes. The index can be persisted and is updated
+    incrementally, i.e. only files with changed modification time or size are
+    scanned again.
+
+    Scanning is not a full Modelica parser: references are resolved to any
+    matching class of the library, so dependencies are rather overestimated
+    than missed. References to classes outside of the library are ignored.
+
+    ATTRIBUTES:
+    modelica_lib_path (string):
+        Path to a Modelica library
+
+    OPTIONAL ATTRIBUTES:
+    index_path (string, default=None):
+        Path to a file, in which the index is persisted.
+
+    API:
+    update():
+        Scans new and modified files, resolves their dependencies and saves
+        the index (if index_path is given).
+
+    get_affected_files(lChanged):
+        Returns the paths of all files, which depend (transitively) on the
+        given changed files - including these.
+
+    get_dependencies(pCurEl):
+        Returns all files outside of a package/model, on which the
+        package/model depends (transitively), and their content hashes.
+
+    For more details take a look at the module itsself
+    """
+
+    #increase, if the format of the persisted index changes
+    _version = 1
+
+    _reStrip = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.S)
+    _reWithin = re.compile(r'\bwithin\s+([\w.]*)\s*;')
+    _reScope = re.compile(r'\b(?:class|model|record|block|connector|type|package|function)\s+(?!extends\b)([A-Za-z_]\w*)(\s*=)?'
+                          r'|\bend\s+([A-Za-z_]\w*)\s*;')
+    _reRefs = re.compile(r'\bextends\s+([A-Za-z_][\w.]*)'
+                         r'|\bimport\s+(?:[A-Za-z_]\w*\s*=\s*)?([A-Za-z_][\w.]*?)(\.\*|\.\{[^}]*\})?\s*;'
+                         r'|(?<![\w.])([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+)'
+                         r'|^[ \t]*(?:(?:parameter|constant|input|output|flow|stream|discrete|final|inner|outer|replaceable|redeclare)\s+)*'
+                         r'(?!(?:extends|import)\b)([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)?[ \t]+[A-Za-z_]\w*', re.M)
+    _keywords = set('''algorithm and annotation block break class connect connector constant constrainedby der
+                       discrete each else elseif elsewhen encapsulated end enumeration equation expandable extends
+                       external final flow for function if import impure in initial inner input loop model not
+                       operator or outer output package parameter partial protected public pure record redeclare
+                       replaceable return stream then type when while within'''.split())
+
+    def __init__(self, modelica_lib_path, index_path=None):
+
+        self.modelica_lib_path = os.path.abspath(modelica_lib_path)
+        self.index_path = index_path
+
+        #scan results for each file (relative path using slashes)
+        self._files = {}
+        #file of each class (fully qualified name)
+        self._classes = {}
+        #dependent files of each file
+        self._rdeps = {}
+        #former dependent files of removed files and of files, whose classes
+        #have changed, see update()
+        self._stale = {}
+        #files of all classes of each package
+        self._children = {}
+        #sorted relative paths of all files, see get_dependencies()
+        self._sorted = []
+
+        if index_path:
+            try:
+                with open(index_path) as file:
+                    data = json.load(file)
+                if data['version'] == self._version and data['lib'] == self.modelica_lib_path:
+                    self._files = data['files']
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self._classes = self._get_classes()
+        self._rdeps = self._get_rdeps()
+        self._sorted = sorted(self._files)
+
+
+    #PUBLIC API
+    ###########################################################################
+    def update(self):
+        """
+        Scans new and modified files of the library, resolves dependencies and
+        saves the index.
+
+        RETURNS:
+        lScanned (list of strings):
+            relative paths of all scanned files
+        """
+
+        lScanned = []
+        lStale = []
+        sSeen = set()
+        for dirpath, dirnames, filenames in os.walk(self.modelica_lib_path):
+            dirnames.sort()
+            for fname in filenames:
+                if not fname.endswith('.mo'):
+                    continue
+
+                fp = os.path.join(dirpath, fname)
+                rel = self._get_rel(fp)
+                sSeen.add(rel)
+
+                st = os.stat(fp)
+                entry = self._files.get(rel)
+                if entry and entry['mtime'] == st.st_mtime and entry['size'] == st.st_size:
+                    continue
+
+                self._files[rel] = self._scan(fp, rel, st)
+                if entry and entry['classes'] != self._files[rel]['classes']:
+                    lStale.append(rel)
+                lScanned.append(rel)
+
+        lRemoved = [rel for rel in self._files if not rel in sSeen]
+        for rel in lRemoved:
+            del self._files[rel]
+
+        #files, which referenced classes of removed files or removed classes,
+        #do not depend on them anymore, but are still affected by the change
+        for rel in lRemoved + lStale:
+            self._stale.setdefault(rel, set()).update(self._rdeps.get(rel, ()))
+
+        #if classes have been added or removed, all references are resolved again
+        classes = self._get_classes()
+        if classes != self._classes:
+            self._classes = classes
+            lScanned = list(self._files)
+
+        self._children = {}
+        for qname, rel in self._classes.items():
+            self._children.setdefault(qname.rpartition('.')[0], set()).add(rel)
+
+        for rel in lScanned:
+            self._files[rel]['deps'] = self._resolve(rel)
+
+        self._rdeps = self._get_rdeps()
+        self._sorted = sorted(self._files)
+
+        if self.index_path and (lScanned or lRemoved):
+            tmpFP = '{}.tmp'.format(self.index_path)
+            with open(tmpFP, 'w') as file:
+                json.dump({'version':self._version, 'lib':self.modelica_lib_path, 'files':self._files}, file)
+            os.replace(tmpFP, self.index_path)
+
+        return lScanned
+
+
+    def get_affected_files(self, lChanged):
+        """
+        Returns all files, which depend (transitively) on changed files.
+        Files, which depended on removed files or on removed classes (see
+        update()), are affected, too. Dependents of deleted files, which have
+        never been scanned, are found by the names of their classes.
+
+        ARGUMENTS:
+        lChanged (list of strings):
+            paths of changed files
+
+        RETURNS:
+        sAffected (set of strings):
+            paths of all affected files, including lChanged
+        """
+
+        sAffected = set(lChanged)
+        lStack = [self._get_rel(fp) for fp in lChanged]
+        sVisited = set(lStack)
+        while lStack:
+            changed = lStack.pop()
+            sDependents = self._rdeps.get(changed, set()) | self._stale.get(changed, set())
+            if changed.endswith('.mo') and not changed in self._files:
+                sDependents |= self._get_referencing(changed)
+
+            for rel in sDependents:
+                if not rel in sVisited:
+                    sVisited.add(rel)
+                    lStack.append(rel)
+                    sAffected.add(os.path.join(self.modelica_lib_path, *rel.split('/')))
+
+        return sAffected
+
+
+    def get_dependencies(self, pCurEl):
+        """
+        Returns all files outside of a package/model, on which the
+        package/model depends (transitively).
+
+        ARGUMENTS:
+        pCurEl (string):
+            path to a package/model (without file extension)
+
+        RETURNS:
+        dic (dictionary):
+            content hash of each file (relative path using slashes)
+        """
+
+        #files within the package directory are a contiguous range of the
+        #sorted paths ('0' follows '/')
+        rel = self._get_rel(pCurEl)
+        sSeeds = set(self._sorted[bisect.bisect_left(self._sorted, rel + '/'):bisect.bisect_left(self._sorted, rel + '0')])
+        if not sSeeds:
+            if rel + '.mo' in self._files:
+                sSeeds.add(rel + '.mo')
+            elif self._get_parent_package(rel) in self._files:
+                sSeeds.add(self._get_parent_package(rel))
+
+        sVisited = set(sSeeds)
+        lStack = list(sSeeds)
+        while lStack:
+            for dep in self._files[lStack.pop()]['deps']:
+                if not dep in sVisited:
+                    sVisited.add(dep)
+                    lStack.append(dep)
+
+        return {dep:self._files[dep]['sha'] for dep in sVisited - sSeeds}
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _get_rel(self, filepath):
+        return os.path.relpath(filepath, self.modelica_lib_path).replace(os.sep, '/')
+
+    def _get_parent_package(self, rel):
+        parent = rel.rpartition('/')[0]
+        return '{}/package.mo'.format(parent) if parent else 'package.mo'
+
+    def _get_classes(self):
+        return {qname:rel for rel, entry in self._files.items() for qname in entry['classes']}
+
+    def _get_rdeps(self):
+        rdeps = {}
+        for rel, entry in self._files.items():
+            for dep in entry['deps']:
+                rdeps.setdefault(dep, set()).add(rel)
+        return rdeps
+
+    def _get_referencing(self, rel):
+        """
+        Returns all files with references, which may refer to a class
+        declared by a file, which is not part of the index (anymore). The
+        name of the class is given by the location of the file.
+
+        ARGUMENTS:
+        rel (string):
+            path of the file relative to the library (using slashes)
+
+        RETURNS:
+        sFiles (set of strings):
+            relative paths of all referencing files
+        """
+
+        lParts = [os.path.basename(self.modelica_lib_path)] + rel[:-3].split('/')
+        qname = '.'.join(lParts[:-1] if lParts[-1] == 'package' else lParts)
+
+        def refers(scope, ref):
+            #the reference may be resolved in any enclosing scope
+            ref = ref[:-2] if ref.endswith('.*') else ref
+            while True:
+                name = '{}.{}'.format(scope, ref) if scope else ref
+                if name == qname or name.startswith(qname + '.'):
+                    return True
+                if not scope:
+                    return False
+                scope = scope.rpartition('.')[0]
+
+        return {other for other, entry in self._files.items() if any(refers(scope, ref) for scope, ref in entry['refs'])}
+
+    def _scan(self, filepath, rel, st):
+        """
+        Scans a .mo file for declared classes and references.
+
+        ARGUMENTS:
+        filepath (string):
+            path of the file
+        rel (string):
+            path of the file relative to the library (using slashes)
+        st (os.stat_result):
+            stat of the file
+
+        RETURNS:
+        entry (dictionary):
+            modification time, size and content hash of the file, fully
+            qualified names of all declared classes and all references as
+            pairs of scope and referenced name. Referenced names ending with
+            '.*' refer to all classes of a package.
+        """
+
+        import hashlib;
+
+        with open(filepath, 'rb') as file:
+            content = file.read()
+
+        s = self._reStrip.sub(' ', content.decode('utf-8', errors='replace'))
+
+        #enclosing package: within-clause or based on the location of the file
+        match = self._reWithin.search(s)
+        if match:
+            within = match.group(1)
+        else:
+            lParts = [os.path.basename(self.modelica_lib_path)] + rel.split('/')[:-1]
+            within = '.'.join(lParts[:-1] if rel.endswith('package.mo') else lParts)
+
+        #declared classes and positions, at which the scope changes
+        lClasses = []
+        lPos = [0]
+        lScopes = [within]
+        lStack = [within]
+        for match in self._reScope.finditer(s):
+            name, short, end = match.groups()
+            if name:
+                qname = '{}.{}'.format(lStack[-1], name) if lStack[-1] else name
+                lClasses.append(qname)
+                if short:
+                    #short class definition, e.g. type A = B, has no end
+                    continue
+                lStack.append(qname)
+            elif len(lStack) > 1 and lStack[-1].rpartition('.')[2] == end:
+                lStack.pop()
+            else:
+                continue
+            lPos.append(match.end())
+            lScopes.append(lStack[-1])
+
+        lRefs = []
+        for match in self._reRefs.finditer(s):
+            ext, imp, wild, dotted, decl = match.groups()
+            ref = ext or imp or dotted or decl
+            if ref in self._keywords:
+                continue
+            scope = lScopes[bisect.bisect_right(lPos, match.start()) - 1]
+            lRefs.append([scope, ref + '.*' if wild else ref])
+
+        return {'mtime':st.st_mtime, 'size':st.st_size,
+                'sha':hashlib.sha1(content).hexdigest(),
+                'classes':lClasses, 'refs':lRefs, 'deps':[]}
+
+    def _resolve(self, rel):
+        """
+        Resolves all references of a file to the files declaring the
+        referenced classes.
+
+        ARGUMENTS:
+        rel (string):
+            path of the file relative to the library (using slashes)
+
+        RETURNS:
+        lDeps (list of strings):
+            relative paths of all files, the file depends on
+        """
+
+        sDeps = set()
+        for scope, ref in self._files[rel]['refs']:
+            wild = ref.endswith('.*')
+            qname = self._lookup(scope, ref[:-2] if wild else ref)
+            if qname is None:
+                continue
+
+            sDeps.add(self._classes[qname])
+            if wild:
+                sDeps.update(self._children.get(qname, ()))
+
+        sDeps.discard(rel)
+        return sorted(sDeps)
+
+    def _lookup(self, scope, ref):
+        """
+        Looks up a referenced class starting in scope and continuing in all
+        enclosing scopes.
+
+        RETURNS:
+        qname (string):
+            fully qualified name of the longest matching class or None
+        """
+
+        lParts = ref.split('.')
+        while True:
+            qname = '{}.{}'.format(scope, lParts[0]) if scope else lParts[0]
+            if qname in self._classes:
+                for part in lParts[1:]:
+                    if not '{}.{}'.format(qname, part) in self._classes:
+                        break
+                    qname = '{}.{}'.format(qname, part)
+                return qname
+
+            if not scope:
+                return None
+            scope = scope.rpartition('.')[0]
+
+
+###############################################################################
+#VALIDATION OF OPTIONS
+###############################################################################
+class _Validator(object):
+    """
+    Returns a new _Validator instance to validate user inputs
+
+    USAGE:
+        _Validator(option,value)
+
+    Options are matched exactly and dispatched by the table _methods. Some
+    options take a second value, e.g. _Validator('report_compare',rep1,rep2).
+
+    EXAMPLE:
+        _Validator('report_name','report')
+    """
+
+    #validation method of each option (exact keys)
+    _methods = {'report':'_validate_report',
+                'report_name':'_validate_report_name',
+                'report_path':'_validate_report_path',
+                'report_disp':'_validate_report_disp',
+                'report_cont':'_validate_report_cont',
+                'report_meta':'_validate_report_meta',
+                'report_mode':'_validate_report_mode',
+                'report_colors':'_validate_report_colors',
+                'report_compare':'_validate_report_compare',
+                'report_timing':'_validate_report_timing',
+                'time_ratio':'_validate_time_ratio',
+                'time_key':'_validate_time_key',
+                'dymola_path':'_validate_dymola_path',
+                'checker_backend':'_validate_checker_backend',
+                'workers':'_validate_workers',
+                'cache_path':'_validate_cache_path',
+                'cache_size':'_validate_cache_size',
+                'git_base_ref':'_validate_git_base_ref',
+                'baseline_report':'_validate_baseline_report',
+                'dependency_path':'_validate_dependency_path',
+                'batch_size':'_validate_batch_size',
+                'check_timeout':'_validate_check_timeout',
+                'checkpoint_path':'_validate_checkpoint_path',
+                'resume':'_validate_resume',
+                'session':'_validate_session',
+                'progress':'_validate_progress',
+                'hooks':'_validate_hooks',
+                'history_path':'_validate_history_path',
+                'library_index_path':'_validate_library_index_path',
+                'dymola_pedantic':'_validate_dymola_pedantic',
+                'modelica_lib_path':'_validate_modelica_lib_path',
+                'modelica_lib_firstlevel':'_validate_modelica_lib_firstlevel',
+                'modelica_lib_depth':'_validate_modelica_lib_depth',
+                'general_filepath':'_validate_general_filepath',
+                'general_kwargs':'_validate_general_kwargs'}
+
+    def __init__(self, key, *args):
+
+        try:
+            method = self._methods[key]
+        except KeyError:
+            raise KeyError('\n\n => \'{}\' is not a known option to validate! <='.format(key)) from None
+
+        getattr(self, method)(*args)
+
+
+    #PRIVATE API
+    ###########################################################################
+    def _validate_report_name(self,val):
+        if val:
+            self._validate_general_instance('name',val,str,'string')
+            fname, fext = os.path.splitext(val)
+            assert len(fname)>0 , '\n\n => Value of \'name\' must be an acutal non-zero sized string! <='
+            assert len(fext)==0, '\n\n => Value of \'name\' must not have a file extension, but has \'{}\'! <='.format(fext)
+
+
+    def _validate_report_path(self,val):
+        if val:
+            self._validate_general_instance('path',val,str,'string')
+            self._validate_general_dirpath('path',val)
+
+
+    def _validate_report_disp(self,val):
+        if val:
+            self._validate_general_instance('disp',val,list,'list')
+            for elem in val:
+                assert isinstance(elem,dict), '\n\n => Each entry in \'disp\' must be a dictionary itself, but entry [{}] is \'{}\'! <='.format(elem,elem.__class__)
+                self._validate_general_key_in_dict('disp', elem, ['Key','Val'])
+
+
+    def _validate_report_cont(self,val):
+        if isinstance(val,_Rows):
+            #rows are valid by construction
+            return
+
+        if val:
+            self._validate_general_instance('cont',val,list,'list')
+            for elem in val:
+                assert isinstance(elem,collections.abc.Mapping), '\n\n => Each entry in \'cont\' must be a dictionary, but entry [{}] is \'{}\'! <='.format(elem,elem.__class__)
+                self._validate_general_key_in_dict('cont', elem, ['Pck', 'Res', 'Err', 'Wrn', 'Time', 'CheckerTime', 'colPck', 'colRes', 'colWrn', 'colErr', 'colTime'])
+                for key in ('Pck', 'Res'):
+                    assert key in elem, '\n\n => Each entry in \'cont\' must have the key \'{}\', but entry [{}] has not! <='.format(key,elem)
+                for key in ('Err', 'Wrn'):
+                    assert not key in elem or str(elem[key]).isdigit(), '\n\n => Value of \'{}\' in \'cont\' must be a number, but is \'{}\'! <='.format(key,elem[key])
+                for key in ('Time', 'CheckerTime'):
+                    assert isinstance(elem.get(key, 0), (int, float)), '\n\n => Value of \'{}\' in \'cont\' must be a number, but is \'{}\'! <='.format(key,elem[key])
+
+
+    def _validate_report_meta(self,val):
+        if val:
+            self._validate_general_instance('meta',val,dict,'dictionary')
+            for key in Converter._htmlMeta:
+                assert key in val, '\n\n => \'meta\' must have the keys (\'pck\', \'ped\', \'lod\', \'git\' and \'viewport\') but \'{}\' is missing! <='.format(key)
+            self._validate_general_key_in_dict('meta', val, Converter._htmlMeta + ['startup'])
+
+
+    def _validate_report_mode(self,val):
+        if val:
+            self._validate_general_instance('mode',val,str,'string')
+            assert val in('full','compact'), '\n\n => Value of \'mode\' must be either \'full\' or \'compact\', but is \'{}\'! <='.format(val)
+
+
+    def _validate_report_timing(self,val):
+        self._validate_general_instance('report_timing',val,bool,'boolean')
+
+
+    def _validate_time_ratio(self,val):
+        if val is not None:
+            self._validate_general_instance('time_ratio',val,(int,float),'number')
+            assert val>=1, '\n\n => Value of \'time_ratio\' must be at least 1, but is \'{}\'! <='.format(val)
+
+
+    def _validate_time_key(self,val):
+        assert val in ('Time','CheckerTime'), '\n\n => Value of \'time_key\' must be either \'Time\' or \'CheckerTime\', but is \'{}\'! <='.format(val)
+
+
+    def _validate_report_colors(self,val):
+        if val:
+            self._validate_general_instance('colors',val,dict,'dictionary')
+            self._validate_general_key_in_dict('colors', val, ['cTrue','cFalse', 'cNF','cTO','cErr','cWrn'])
+
+
+    def _validate_report(self,val):
+        self._validate_general_instance('Report',val, Report ,'Report')
+        self._validate_report_name(val.name)
+        self._validate_report_path(val.path)
+        self._validate_report_disp(val.disp)
         self._validate_report_meta(val.meta)
         self._validate_report_mode(val.mode)
         self._validate_report_colors(val.colors)
@@ -1481,13 +6013,102 @@ class _Validator(object):
 
     def _validate_report_compare(self,rep1,rep2):
         assert rep1.meta['pck'] == rep2.meta['pck'], '\n\n => Reports corresponds to different Modelica libraries! <='
-        assert rep1.meta['lod'] == rep2.meta['lod'], '\n\n => Reports have different level of detail! <='
-        assert rep1.meta['ped'] == rep2.meta['ped'], '\n\n => Reports correspond to different Dymola checkModel() mode! <='
+        assert str(rep1.meta['lod']) == str(rep2.meta['lod']), '\n\n => Reports have different level of detail! <='
+        assert str(rep1.meta['ped']) == str(rep2.meta['ped']), '\n\n => Reports correspond to different Dymola checkModel() mode! <='
 
 
     def _validate_dymola_path(self,val):
-        self._validate_general_instance('dymola_path',val,str,'string')
-        self._validate_general_filepath('dymola_path',val)
+        if val is not None:
+            self._validate_general_instance('dymola_path',val,str,'string')
+            self._validate_general_filepath('dymola_path',val)
+
+
+    def _validate_checker_backend(self,val):
+        self._validate_general_instance('checker_backend',val,CheckerBackend,'CheckerBackend')
+
+
+    def _validate_cache_path(self,val):
+        if val:
+            self._validate_general_instance('cache_path',val,str,'string')
+            self._validate_general_dirpath('cache_path',os.path.dirname(os.path.abspath(val)))
+
+
+    def _validate_history_path(self,val):
+        if val:
+            self._validate_general_instance('history_path',val,str,'string')
+            self._validate_general_dirpath('history_path',os.path.dirname(os.path.abspath(val)))
+
+
+    def _validate_library_index_path(self,val):
+        if val:
+            self._validate_general_instance('library_index_path',val,str,'string')
+            self._validate_general_dirpath('library_index_path',os.path.dirname(os.path.abspath(val)))
+
+
+    def _validate_cache_size(self,val):
+        self._validate_general_instance('cache_size',val,int,'integer')
+        assert val>0, '\n\n => Value of \'cache_size\' must be greater than zero, but is \'{}\'! <='.format(val)
+
+
+    def _validate_git_base_ref(self,val):
+        if val:
+            self._validate_general_instance('git_base_ref',val,str,'string')
+
+
+    def _validate_baseline_report(self,val):
+        if isinstance(val,Report):
+            self._validate_report(val)
+        elif val:
+            self._validate_general_filepath('baseline_report',val)
+
+
+    def _validate_dependency_path(self,val):
+        if val:
+            self._validate_general_instance('dependency_path',val,str,'string')
+            self._validate_general_dirpath('dependency_path',os.path.dirname(os.path.abspath(val)))
+
+
+    def _validate_batch_size(self,val):
+        self._validate_general_instance('batch_size',val,int,'integer')
+        assert val>0 or val==-1, '\n\n => Value of \'batch_size\' must be greater than zero or -1 , but is \'{}\'! <='.format(val)
+
+
+    def _validate_check_timeout(self,val):
+        if val is not None:
+            self._validate_general_instance('check_timeout',val,(int,float),'number')
+            assert val>0, '\n\n => Value of \'check_timeout\' must be greater than zero, but is \'{}\'! <='.format(val)
+
+
+    def _validate_checkpoint_path(self,val):
+        if val:
+            self._validate_general_instance('checkpoint_path',val,str,'string')
+            self._validate_general_dirpath('checkpoint_path',os.path.dirname(os.path.abspath(val)))
+
+
+    def _validate_resume(self,val):
+        self._validate_general_instance('resume',val,bool,'boolean')
+
+
+    def _validate_progress(self,val):
+        if val:
+            assert callable(val), '\n\n => Value of \'progress\' must be callable, but is \'{}\'! <='.format(val.__class__)
+
+
+    def _validate_hooks(self,val):
+        if val:
+            self._validate_general_instance('hooks',val,list,'list')
+            for hook in val:
+                assert callable(hook), '\n\n => Each entry in \'hooks\' must be callable, but entry [{}] is \'{}\'! <='.format(hook,hook.__class__)
+
+
+    def _validate_session(self,val):
+        if val:
+            self._validate_general_instance('session',val,CheckerSession,'CheckerSession')
+
+
+    def _validate_workers(self,val):
+        self._validate_general_instance('workers',val,int,'integer')
+        assert val>0, '\n\n => Value of \'workers\' must be greater than zero, but is \'{}\'! <='.format(val)
 
 
     def _validate_dymola_pedantic(self,val):
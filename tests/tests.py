@@ -5,11 +5,17 @@ Test different parts of Moliana.
 @author: jmoeckel
 """
 
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
 import unittest
 
 os.chdir('../examples')
 import examples
+import moliana
 
 class TestMolianaMethods(unittest.TestCase):
 
@@ -73,5 +79,1009 @@ class TestMolianaMethods(unittest.TestCase):
         validated, new = self._readReport('example7')
         self.assertListEqual(new,validated)
 
+
+class TmpTestCase(unittest.TestCase):
+    """
+    Base class of tests, which write to a temporary directory. _check() checks
+    the test library (or a copy, see _copy_library()) with the options given
+    by attribute options and the given ones.
+    """
+
+    lib = 'test_library'
+    options = {}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _copy_library(self):
+        self.lib = os.path.join(self.tmp.name, 'test_library')
+        shutil.copytree('test_library', self.lib)
+
+    def _dymola_mode(self, backend=None, lib=None, **kwargs):
+        options = dict(self.options, report_path=self.tmp.name)
+        if backend is not None:
+            options['checker_backend'] = backend
+        options.update(kwargs)
+        return moliana.DymolaMode(lib or self.lib, None, **options)
+
+    def _check(self, backend=None, lib=None, **kwargs):
+        return self._dymola_mode(backend, lib, **kwargs).execute_check()
+
+class TestFakeBackend(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.results = {'L1Pck1':('False',3,2), 'L1Pck2':('True',0,1)}
+
+    def test_results(self):
+        backend = moliana.FakeBackend(results=self.results)
+        rep = self._check(backend)
+
+        self.assertListEqual([dic['Pck'] for dic in rep.cont], ['L1Pck1','L1Pck2','L1Pck3','L1Pck4_NoModelica','L1Pck5_OneFile'])
+        self.assertListEqual([dic['Res'] for dic in rep.cont], ['False','True','True','True','True'])
+        self.assertEqual(rep.cont[0]['colErr'], 'red')
+        self.assertEqual(rep.cont[1]['colWrn'], 'yellow')
+
+    def test_not_found(self):
+        backend = moliana.FakeBackend()
+        backend.open_model(os.path.join('test_library','package.mo'))
+        logFP = os.path.join(self.tmp.name,'checklog.Log')
+        backend.check_model('test_library.L1Pck2.NoModel', 'L1Pck2.NoModel', logFP)
+
+        self.assertListEqual(backend.get_results(logFP)[0], ['L1Pck2.NoModel Not_found 0 0'])
+
+    def test_failure(self):
+        backend = moliana.FakeBackend(failures=['L1Pck3'])
+        with self.assertRaises(moliana.CheckerError):
+            self._check(backend)
+
+    def test_startup(self):
+        rep = self._check(moliana.FakeBackend(startup=0.2))
+        self.assertGreaterEqual(rep.meta['startup'], 0.2)
+        self.assertLess(rep.meta['startup'], 1)
+
+    def test_startup_timeout(self):
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(startup=1, startup_timeout=0.2))
+
+class TestWorkers(TmpTestCase):
+
+    options = {'modelica_lib_depth':-1}
+
+    def test_order(self):
+        latency = {'L1Pck2.L2Model1_good':0.05, 'L1Pck3.L2Model2_bad':0.02}
+        results = {'L1Pck3.L2Model2_bad':('False',1,0)}
+
+        rep1 = self._check(moliana.FakeBackend(results=results))
+        backend = moliana.FakeBackend(results=results, latency=latency)
+        rep4 = self._check(backend, workers=4)
+
+        self.assertEqual(rep4.cont, rep1.cont)
+        self.assertEqual(len(backend.checked), len(rep1.cont))
+
+    def test_failure(self):
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(failures=['L1Pck2.L2Model2_good']), workers=3)
+
+        self.assertListEqual([f for f in os.listdir('test_library') if f.endswith('.Log')], [])
+
+class TestLibraryWalker(unittest.TestCase):
+
+    def test_walk(self):
+        walker = moliana.LibraryWalker('test_library')
+        lItems = walker.walk(depth=2)
+
+        self.assertEqual(lItems[0], ('test_library.L1Pck1.L2Pck1', os.path.abspath(os.path.join('test_library', 'L1Pck1', 'L2Pck1')), 2, True))
+        self.assertEqual(lItems[-1][0:1] + lItems[-1][2:], ('test_library.L1Pck5_OneFile', 1, False))
+        self.assertNotIn('test_library.L1Pck4_NoModelica', [item[0] for item in lItems])
+        self.assertEqual(len(walker.walk(depth=-1)), 11)
+
+    def test_firstlevel(self):
+        walker = moliana.LibraryWalker('test_library')
+        lItems = walker.walk(os.path.join('test_library', 'L1Pck3'), depth=1)
+
+        self.assertListEqual([item[0] for item in lItems], ['test_library.L1Pck3.L2Pck1', 'test_library.L1Pck3.L2Model1_good',
+                                                            'test_library.L1Pck3.L2Model2_bad'])
+        self.assertListEqual(walker.get_package_order(os.path.join('test_library', 'L1Pck4_NoModelica')), [])
+        self.assertIsNone(walker.get_package_order(os.path.join('test_library', 'L1Pck5_OneFile')))
+        self.assertIn('L2Pck1', walker.get_package_order(os.path.join('test_library', 'L1Pck3')))
+
+    def test_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pLib = os.path.join(tmp, 'test_library')
+            pIndex = os.path.join(tmp, 'index.json')
+            shutil.copytree('test_library', pLib)
+
+            walker = moliana.LibraryWalker(pLib, pIndex)
+            lItems = walker.walk(depth=-1)
+            walker.save()
+            self.assertTrue(os.path.isfile(pIndex))
+
+            walker = moliana.LibraryWalker(pLib, pIndex)
+            walker._read_package = None
+            self.assertListEqual(walker.walk(depth=-1), lItems)
+            self.assertFalse(walker._changed)
+
+            with open(os.path.join(pLib, 'L1Pck3', 'package.order'), 'w') as file:
+                file.write('L2Model1_good\n')
+
+            walker = moliana.LibraryWalker(pLib, pIndex)
+            self.assertListEqual([item[0] for item in walker.walk(os.path.join(pLib, 'L1Pck3'))], ['test_library.L1Pck3.L2Model1_good'])
+            self.assertEqual(len(walker.walk(depth=-1)), len(lItems) - 3)
+            self.assertTrue(walker._changed)
+
+class TestResultCache(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = os.path.join(self.tmp.name,'cache.json')
+        self.options = {'cache_path':self.cache}
+
+    def _disp(self, rep):
+        return {dic['Key']:dic['Val'] for dic in rep.disp}
+
+    def test_hits(self):
+        rep1 = self._check(moliana.FakeBackend(results={'L1Pck1':('False',3,2)}))
+        self.assertEqual(self._disp(rep1)['Cache Misses'], 5)
+
+        backend = moliana.FakeBackend(results={'L1Pck1':('False',3,2)})
+        rep2 = self._check(backend)
+        self.assertEqual(self._disp(rep2)['Cache Hits'], 5)
+        self.assertListEqual(backend.checked, [])
+        self.assertEqual(rep2.cont, rep1.cont)
+
+    def test_changed_source(self):
+        pLib = os.path.join(self.tmp.name,'test_library')
+        shutil.copytree('test_library', pLib)
+        self._check(moliana.FakeBackend(), lib=pLib)
+
+        with open(os.path.join(pLib,'L1Pck3','L2Pck1','L3Model_bad.mo'),'a') as file:
+            file.write('\n')
+
+        backend = moliana.FakeBackend()
+        self._check(backend, lib=pLib)
+        self.assertListEqual(backend.checked, ['L1Pck3'])
+
+    def test_invalidation(self):
+        self._check(moliana.FakeBackend())
+
+        backend = moliana.FakeBackend()
+        self._check(backend, dymola_pedantic=True)
+        self.assertEqual(len(backend.checked), 5)
+
+    def test_eviction(self):
+        self._check(moliana.FakeBackend(), cache_size=2)
+
+        backend = moliana.FakeBackend()
+        self._check(backend, cache_size=2)
+        self.assertEqual(len(backend.checked), 3)
+
+class TestGitBaseRef(TmpTestCase):
+
+    options = {'modelica_lib_depth':2}
+
+    def setUp(self):
+        super().setUp()
+        self._copy_library()
+
+        for cmd in (['init','-q'], ['add','.'], ['-c','user.name=moliana','-c','user.email=moliana@localhost','commit','-q','-m','base']):
+            subprocess.check_call(['git'] + cmd, cwd=self.lib)
+
+    def test_selective(self):
+        baseline = self._check(moliana.FakeBackend())
+
+        with open(os.path.join(self.lib,'L1Pck3','L2Pck1','L3Model_bad.mo'),'a') as file:
+            file.write('\n')
+
+        backend = moliana.FakeBackend(results={'L1Pck3.L2Pck1':('False',1,0)})
+        rep = self._check(backend, git_base_ref='HEAD', baseline_report=baseline)
+
+        self.assertListEqual(backend.checked, ['L1Pck3.L2Pck1'])
+        self.assertListEqual([dic['Pck'] for dic in rep.cont], [dic['Pck'] for dic in baseline.cont])
+        self.assertListEqual([dic['Res'] for dic in rep.cont if dic['Res']=='False'], ['False'])
+
+    def test_dependent(self):
+        baseline = self._check(moliana.FakeBackend())
+
+        with open(os.path.join(self.lib,'L1Pck2','L2Model1_good.mo'),'w') as file:
+            file.write('within test_library.L1Pck2;\nmodel L2Model1_good\n  extends L1Pck3.L2Model1_good;\nend L2Model1_good;\n')
+        subprocess.check_call(['git','-c','user.name=moliana','-c','user.email=moliana@localhost','commit','-q','-a','-m','extends'], cwd=self.lib)
+
+        with open(os.path.join(self.lib,'L1Pck3','L2Model1_good.mo'),'a') as file:
+            file.write('\n')
+
+        backend = moliana.FakeBackend()
+        self._check(backend, git_base_ref='HEAD', baseline_report=baseline)
+
+        self.assertListEqual(backend.checked, ['L1Pck2.L2Model1_good', 'L1Pck3.L2Model1_good'])
+
+    def test_deleted_dependency(self):
+        with open(os.path.join(self.lib,'L1Pck2','L2Model1_good.mo'),'w') as file:
+            file.write('within test_library.L1Pck2;\nmodel L2Model1_good\n  extends L1Pck3.L2Model1_good;\nend L2Model1_good;\n')
+        subprocess.check_call(['git','-c','user.name=moliana','-c','user.email=moliana@localhost','commit','-q','-a','-m','extends'], cwd=self.lib)
+        baseline = self._check(moliana.FakeBackend())
+
+        #the result of the dependent is not copied from the baseline report
+        os.remove(os.path.join(self.lib,'L1Pck3','L2Model1_good.mo'))
+        with open(os.path.join(self.lib,'L1Pck3','package.order'),'w') as file:
+            file.write('L2Pck1\nL2Model2_bad\n')
+
+        backend = moliana.FakeBackend(results={'L1Pck2.L2Model1_good':('False',1,0)})
+        rep = self._check(backend, git_base_ref='HEAD', baseline_report=baseline)
+
+        self.assertListEqual(backend.checked, ['L1Pck2.L2Model1_good'])
+        self.assertListEqual([dic['Pck'] for dic in rep.cont if dic['Res']=='False'], ['L1Pck2.L2Model1_good'])
+
+    def test_changed_package(self):
+        baseline = self._check(moliana.FakeBackend())
+
+        with open(os.path.join(self.lib,'L1Pck2','package.mo'),'a') as file:
+            file.write('\n')
+
+        backend = moliana.FakeBackend()
+        self._check(backend, git_base_ref='HEAD', baseline_report=baseline)
+
+        self.assertListEqual(backend.checked, ['L1Pck2.L2Model1_good', 'L1Pck2.L2Model2_good', 'L1Pck2.L2Model3_warning'])
+
+class TestDependencyIndex(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._copy_library()
+        self.index = os.path.join(self.tmp.name,'deps.json')
+
+        self.base = os.path.join(self.lib,'L1Pck3','L2Model1_good.mo')
+        self.model = os.path.join(self.lib,'L1Pck2','L2Model1_good.mo')
+        with open(self.model,'w') as file:
+            file.write('within test_library.L1Pck2;\nmodel L2Model1_good\n  test_library.L1Pck3.L2Model1_good m;\nend L2Model1_good;\n')
+
+        with open(os.path.join(self.lib,'L1Pck2','L2Model2_good.mo'),'w') as file:
+            file.write('within test_library.L1Pck2;\nmodel L2Model2_good\n  extends L2Model1_good;\nend L2Model2_good;\n')
+
+    def test_affected(self):
+        deps = moliana.DependencyIndex(self.lib)
+        deps.update()
+
+        affected = deps.get_affected_files([self.base])
+        self.assertSetEqual(affected, {self.base, self.model, os.path.join(self.lib,'L1Pck2','L2Model2_good.mo')})
+
+    def test_dependencies(self):
+        deps = moliana.DependencyIndex(self.lib)
+        deps.update()
+
+        self.assertListEqual(sorted(deps.get_dependencies(os.path.join(self.lib,'L1Pck2'))), ['L1Pck3/L2Model1_good.mo'])
+        self.assertListEqual(sorted(deps.get_dependencies(os.path.join(self.lib,'L1Pck3'))), [])
+
+    def test_incremental(self):
+        deps = moliana.DependencyIndex(self.lib, self.index)
+        self.assertEqual(len(deps.update()), 20)
+
+        deps = moliana.DependencyIndex(self.lib, self.index)
+        self.assertListEqual(deps.update(), [])
+
+        with open(self.base,'a') as file:
+            file.write('\n')
+        self.assertListEqual(deps.update(), ['L1Pck3/L2Model1_good.mo'])
+        self.assertEqual(len(deps.get_affected_files([self.base])), 3)
+
+    def test_removed(self):
+        sAffected = {self.base, self.model, os.path.join(self.lib,'L1Pck2','L2Model2_good.mo')}
+        deps = moliana.DependencyIndex(self.lib, self.index)
+        deps.update()
+
+        #dependents of a deleted file are still affected - also, if the file
+        #has never been scanned
+        os.rename(self.base, self.base + '.bak')
+        deps.update()
+        self.assertSetEqual(deps.get_affected_files([self.base]), sAffected)
+
+        deps = moliana.DependencyIndex(self.lib)
+        deps.update()
+        self.assertSetEqual(deps.get_affected_files([self.base]), sAffected)
+
+        #the same for a renamed class
+        os.rename(self.base + '.bak', self.base)
+        deps = moliana.DependencyIndex(self.lib, self.index)
+        deps.update()
+        with open(self.base,'w') as file:
+            file.write('within test_library.L1Pck3;\nmodel L2Model1_renamed\nend L2Model1_renamed;\n')
+        deps.update()
+        self.assertSetEqual(deps.get_affected_files([self.base]), sAffected)
+
+class TestBatches(TmpTestCase):
+
+    options = {'modelica_lib_depth':-1}
+
+    def test_batch_size(self):
+        results = {'L1Pck3.L2Model2_bad':('False',1,0)}
+        rep1 = self._check(moliana.FakeBackend(results=results))
+
+        backend = moliana.FakeBackend(results=results)
+        rep2 = self._check(backend, batch_size=4)
+
+        self.assertEqual(rep2.cont, rep1.cont)
+        self.assertEqual(backend.calls, 3)
+
+    def test_package(self):
+        backend = moliana.FakeBackend()
+        self._check(backend, batch_size=-1, workers=2)
+
+        #L3Pck1 (3 models), L1Pck2 (3 models), L2Pck1 of L1Pck3 (2 models), L1Pck3 (2 models), L1Pck5_OneFile
+        self.assertEqual(backend.calls, 5)
+        self.assertEqual(len(backend.checked), 11)
+
+class TestCheckerSession(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._copy_library()
+
+    def test_reuse(self):
+        backend = moliana.FakeBackend(results={'L1Pck3.L2Model2_bad':('False',1,0)})
+        with moliana.CheckerSession(backend) as session:
+            rep1 = self._check(session=session)
+            rep2 = self._check(session=session, modelica_lib_firstlevel='L1Pck3', report_colors={'cFalse':'red'})
+            rep3 = self._check(session=session, workers=2)
+
+        self.assertEqual(len(backend.opened), 2)
+        self.assertEqual(rep3.cont, rep1.cont)
+        self.assertEqual(len(rep2.cont), 3)
+
+    def test_reload(self):
+        backend = moliana.FakeBackend()
+        with moliana.CheckerSession(backend) as session:
+            self._check(session=session)
+            self._check(session=session)
+            self.assertEqual(len(backend.opened), 1)
+
+            #files other than Modelica sources, e.g. caches, are ignored
+            with open(os.path.join(self.lib, 'results.cache'), 'w') as f:
+                f.write('{}')
+            self._check(session=session)
+            self.assertEqual(len(backend.opened), 1)
+
+            with open(os.path.join(self.lib, 'package.mo'), 'a') as f:
+                f.write('\n')
+            self._check(session=session)
+
+        self.assertEqual(len(backend.opened), 2)
+
+    def test_failure(self):
+        backend = moliana.FakeBackend(failures=['L1Pck3'])
+        with moliana.CheckerSession(backend) as session:
+            self.assertRaises(moliana.CheckerError, self._check, session=session)
+            self.assertListEqual(session._backends, [])
+
+    def test_failed_start(self):
+        lClones = []
+        lClosed = []
+        class Backend(moliana.FakeBackend):
+            def clone(self):
+                #the second clone does not respond
+                backend = Backend(startup=1 if len(lClones) == 1 else 0, startup_timeout=0.01)
+                lClones.append(backend)
+                return backend
+            def shutdown(self):
+                lClosed.append(self)
+
+        #all started checkers are closed again
+        backend = Backend()
+        with moliana.CheckerSession(backend) as session:
+            self.assertRaises(moliana.CheckerError, self._check, session=session, workers=3)
+            self.assertListEqual(session._backends, [])
+        self.assertCountEqual(lClosed, [backend, lClones[0]])
+
+class TestProgress(TmpTestCase):
+
+    options = {'modelica_lib_depth':-1}
+
+    def test_callback(self):
+        lProgress = []
+        dm = self._dymola_mode(moliana.FakeBackend(), progress=lProgress.append, workers=2, batch_size=2)
+        rep = dm.execute_check()
+
+        self.assertEqual(lProgress[-1]['Completed'], lProgress[-1]['Total'])
+        self.assertEqual(lProgress[-1]['ETA'], 0)
+        self.assertListEqual([p['Completed'] for p in lProgress], sorted(p['Completed'] for p in lProgress))
+        self.assertEqual(sum(len(p['Rows']) for p in lProgress), len(rep.cont))
+
+    def test_iter_check(self):
+        backend = moliana.FakeBackend()
+        dm = self._dymola_mode(backend)
+        for progress in dm.iter_check():
+            self.assertEqual(len(dm.get_report().cont), progress['Completed'])
+            if progress['Completed'] == 3:
+                break
+
+        self.assertEqual(len(backend.checked), 3)
+        self.assertFalse(os.path.exists(os.path.join('test_library', 'checklog.Log')))
+
+    def test_order(self):
+        results = {'L1Pck2.L2Model1_good':('False',2,0)}
+        rep1 = self._dymola_mode(moliana.FakeBackend(results=results)).execute_check()
+
+        #the delayed package/model is finished after the following ones
+        lProgress = []
+        backend = moliana.FakeBackend(results=results, latency={'L1Pck2.L2Model1_good':0.2})
+        rep2 = self._dymola_mode(backend, workers=3, progress=lProgress.append).execute_check()
+        lFinished = [row['Pck'] for p in lProgress for row in p['Rows']]
+
+        self.assertNotEqual(lFinished, [row['Pck'] for row in rep1.cont])
+        self.assertGreater(lFinished.index('L1Pck2.L2Model1_good'), lFinished.index('L1Pck2.L2Model2_good'))
+        self.assertEqual(rep2.cont, rep1.cont)
+
+class TestResultHistory(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db = os.path.join(self.tmp.name, 'history.db')
+
+    def _report(self, dRes, branch='master'):
+        cont = [{'Pck':pck, 'Res':res, 'Err':str(int(res!='True')), 'Wrn':str(wrn)} for pck, (res, wrn) in sorted(dRes.items())]
+        meta = {'pck':'test_library', 'ped':False, 'lod':2, 'git':branch,
+                'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes'}
+        return moliana.Report(name='report', path=self.tmp.name, mode='full', cont=cont, meta=meta)
+
+    def test_check(self):
+        for i in range(2):
+            rep = self._check(moliana.FakeBackend(results={'L1Pck1':('False',3,2)}), history_path=self.db)
+
+        with moliana.ResultHistory(self.db) as history:
+            lRuns = history.get_runs()
+            self.assertEqual(len(lRuns), 2)
+            self.assertEqual(lRuns[1]['n_results'], len(rep.cont))
+            self.assertEqual(lRuns[1]['pedantic'], 0)
+            self.assertEqual(lRuns[1]['depth'], 1)
+            self.assertIn(('L1Pck1', 'False', 3, 2), history.get_results(lRuns[1]['id']))
+            self.assertEqual(history.get_latest_runs()[rep.meta['git']]['id'], lRuns[1]['id'])
+
+    def test_queries(self):
+        with moliana.ResultHistory(self.db) as history:
+            lRuns = []
+            for i, dRes in enumerate([{'A.M1':('True', 0), 'B.M1':('True', 1), 'B.M2':('True', 1)},
+                                      {'A.M1':('False', 1), 'B.M1':('True', 2), 'B.M2':('True', 2)},
+                                      {'A.M1':('False', 2), 'B.M1':('True', 0), 'B.M2':('True', 0)}]):
+                lRuns.append(history.add_run(self._report(dRes), started=i))
+            other = history.add_run(self._report({'A.M1':('True', 0)}, branch='feature'), started=3)
+
+            self.assertEqual(history.get_first_failure('A.M1', branch='master')['id'], lRuns[1])
+            self.assertIsNone(history.get_first_failure('A.M1'))
+            self.assertIsNone(history.get_first_failure('B.M1'))
+
+            trend = history.get_warning_trend(branch='master')
+            self.assertListEqual([wrn for run, started, wrn in trend['A']], [0, 1, 2])
+            self.assertListEqual([wrn for run, started, wrn in trend['B']], [2, 4, 0])
+
+            dLatest = history.get_latest_runs('test_library')
+            self.assertEqual(dLatest['master']['id'], lRuns[2])
+            self.assertEqual(dLatest['feature']['id'], other)
+
+class TestCompare(TmpTestCase):
+
+    def _report(self, lPck, res='True'):
+        cont = [{'Pck':pck, 'Res':res, 'Err':'0', 'Wrn':'0', 'colPck':'white', 'colRes':'white', 'colErr':'white', 'colWrn':'white'}
+                for pck in lPck]
+        meta = {'pck':'test_library', 'ped':False, 'lod':1, 'git':'no git',
+                'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes'}
+        return moliana.Report(name='report', path=self.tmp.name, mode='full', cont=cont, meta=meta,
+                              disp=[{'Key':'Checked Library', 'Val':'test_library'}])
+
+    def test_added_removed(self):
+        rep1 = self._report(['A', 'C', 'D'], res='False')
+        rep2 = self._report(['X', 'A', 'B', 'C'])
+
+        dic = rep1.compare_to(rep2)
+
+        self.assertDictEqual(dic, {'Added':['D'], 'Removed':['X', 'B']})
+        self.assertListEqual([row['Pck'] for row in rep1.cont], ['X', 'A', 'B', 'C', 'D'])
+        self.assertListEqual([row['Res'] for row in rep1.cont], ['Removed', 'False', 'Removed', 'False', 'False'])
+        self.assertListEqual([row['colRes'] for row in rep1.cont], ['lightgrey', 'red', 'lightgrey', 'red', 'white'])
+        self.assertEqual(rep1.cont[-1]['colPck'], 'lightblue')
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp.name, 'report_compare.html')))
+
+    def test_index(self):
+        rep = self._report(['A', 'B'])
+        self.assertIs(rep._get_index(), rep._get_index())
+
+        rep.cont.append(dict(rep.cont[0], Pck='C'))
+        self.assertIn('C', rep._get_index())
+
+        rep.cont = rep.cont[:1]
+        self.assertListEqual(list(rep._get_index()), ['A'])
+
+        #renamed rows
+        rep = self._report(['A', 'B'])
+        rep._get_index()
+        rep.cont[0] = dict(rep.cont[0], Pck='C')
+        rep.cont[1]['Pck'] = 'D'
+        self.assertDictEqual(rep._get_index(), {'C':0, 'D':1})
+
+class TestReportMatrix(TmpTestCase):
+
+    def _report(self, name, dRes):
+        cont = [{'Pck':pck, 'Res':res, 'Err':str(err), 'Wrn':str(wrn)} for pck, (res, err, wrn) in dRes.items()]
+        meta = {'pck':'test_library', 'ped':False, 'lod':1, 'git':name,
+                'viewport':'width=device-width, initial-scale=1.0, user-scalable=yes'}
+        return moliana.Report(name=name, path=self.tmp.name, mode='full', cont=cont, meta=meta,
+                              disp=[{'Key':'Checked Library', 'Val':'test_library'}])
+
+    def _reports(self):
+        return [self._report('master', {'A':('True',0,0), 'B':('True',0,1), 'C':('False',2,0)}),
+                self._report('dev1', {'A':('False',1,0), 'B':('True',0,0), 'C':('False',2,0), 'D':('True',0,0)}),
+                self._report('dev2', {'B':('True',0,3), 'C':('True',0,0)})]
+
+    def test_deltas(self):
+        lReports = self._reports()
+        lConts = [list(map(dict, rep.cont)) for rep in lReports]
+
+        matrix = moliana.ReportMatrix(lReports)
+
+        self.assertListEqual(matrix.get_names(), ['A', 'B', 'C', 'D'])
+        self.assertListEqual(matrix.get_results('A'), [('True',0,0), ('False',1,0), None])
+        self.assertListEqual([dic and dic['State'] for dic in matrix.get_deltas('A')], [None, 'Regression', 'Removed'])
+        self.assertDictEqual(matrix.get_deltas('B')[2], {'State':'Regression', 'Res':None, 'Err':0, 'Wrn':2})
+        self.assertEqual(matrix.get_deltas('C')[2]['State'], 'Improvement')
+        self.assertEqual(matrix.get_deltas('D')[1]['State'], 'Added')
+
+        dSummary = matrix.get_summary()[1]
+        self.assertEqual((dSummary['Regression'], dSummary['Improvement'], dSummary['Added'], dSummary['Wrn']), (1, 1, 1, -1))
+
+        #inputs are not changed
+        self.assertListEqual([rep.name for rep in lReports], ['master', 'dev1', 'dev2'])
+        self.assertListEqual([list(map(dict, rep.cont)) for rep in lReports], lConts)
+
+    def test_previous(self):
+        matrix = moliana.ReportMatrix(self._reports(), reference='previous', name='history')
+        self.assertListEqual([dic and dic['State'] for dic in matrix.get_deltas('B')], [None, 'Improvement', 'Regression'])
+        self.assertEqual(matrix.get_summary()[2]['Reference'], 'dev1')
+
+        matrix.generate_html()
+        with open(os.path.join(self.tmp.name, 'history.html')) as file:
+            html = file.read()
+        self.assertIn('<td class="bg-red">True 0/3 (+0/+3)</td>', html)
+
+class TestReportContent(TmpTestCase):
+
+    def test_dict_access(self):
+        rep = moliana.Report(cont=[{'Pck':'A', 'Res':'False', 'Err':'3', 'Wrn':'0'}])
+        row = rep.cont[0]
+
+        self.assertDictEqual(dict(row), {'Pck':'A', 'Res':'False', 'Err':'3', 'Wrn':'0',
+                                         'colPck':'white', 'colRes':'red', 'colErr':'red', 'colWrn':'white'})
+
+        row['colRes'] = 'green'
+        rep.colors['cErr'] = 'blue'
+        self.assertEqual(rep.cont[0]['colRes'], 'green')
+        self.assertEqual(rep.cont[0]['colErr'], 'blue')
+        self.assertEqual(rep.cont, [dict(row)])
+
+    def test_unknown_results(self):
+        meta = {'pck':'test_library', 'ped':False, 'lod':1, 'git':'no git', 'viewport':''}
+        rep1 = moliana.Report(cont=[{'Pck':'A', 'Res':'Weird'}, {'Pck':'B', 'Res':'True'}], mode='compact', meta=meta)
+        rep2 = moliana.Report(cont=[{'Pck':'B', 'Res':'Odd'}, {'Pck':'A', 'Res':'Weird'}], mode='compact', meta=meta)
+
+        #results, which are not known by moliana, are not shared between reports
+        self.assertNotIn('Weird', moliana._Rows._tRes)
+        self.assertNotIn('Odd', rep1.cont._lRes)
+        self.assertEqual(rep2.cont[0]['Res'], 'Odd')
+
+        matrix = moliana.ReportMatrix([rep1, rep2])
+        self.assertEqual(matrix.get_results('A'), [('Weird', None, None)]*2)
+        self.assertEqual(matrix.get_results('B'), [('True', None, None), ('Odd', None, None)])
+
+    def test_compact(self):
+        rep = moliana.Report(cont=[{'Pck':'A', 'Res':'Not_found', 'colPck':'white', 'colRes':'yellow'}])
+
+        self.assertEqual(len(rep.cont[0]), 4)
+        self.assertNotIn('Err', rep.cont[0])
+        self.assertRaises(KeyError, lambda: rep.cont[0]['colErr'])
+
+    def test_html(self):
+        rep1 = moliana.Report()
+        rep1.read_html(os.path.join('reports', 'example6.html'))
+        rep1.path = self.tmp.name
+        rep1.generate_html()
+
+        rep2 = moliana.Report()
+        rep2.read_html(os.path.join(self.tmp.name, 'example6.html'))
+
+        self.assertEqual(rep1.mode, 'compact')
+        self.assertEqual(rep2.cont, rep1.cont)
+
+    def test_set_cont(self):
+        rows = [{'Pck':'A', 'Res':'True', 'Err':'0', 'Wrn':'x'}]
+        self.assertRaises(AssertionError, moliana.Report, cont=rows)
+
+        rep1 = moliana.Report(cont=[{'Pck':'A', 'Res':'True', 'Err':'0', 'Wrn':'1'}])
+        rep2 = moliana.Report()
+        rep2.cont = rep1.cont
+        self.assertIsNot(rep2.cont, rep1.cont)
+
+        cont = rep1.cont
+        rep2.set_cont(cont, trusted=True)
+        self.assertIs(rep2.cont, cont)
+        self.assertEqual(rep2.cont[0]['colWrn'], 'yellow')
+
+    def test_validator_keys(self):
+        self.assertRaises(KeyError, moliana._Validator, 'report_', 'name')
+        self.assertRaises(KeyError, moliana._Validator, 'name', 'name')
+        moliana._Validator('report_name', 'name')
+
+class TestHtmlWriter(TmpTestCase):
+
+    def test_stream(self):
+        dm = self._dymola_mode(moliana.FakeBackend(), report_name='stream', modelica_lib_depth=-1, workers=2)
+        rows = (row for progress in dm.iter_check() for row in progress['Rows'])
+        moliana.Converter().report_to_html(dm.get_report(), rows)
+
+        rep = moliana.Report()
+        rep.read_html(os.path.join(self.tmp.name, 'stream.html'))
+
+        self.assertEqual(len(rep.cont), len(dm.get_report().cont))
+        self.assertEqual(sorted(map(dict, rep.cont), key=str), sorted(map(dict, dm.get_report().cont), key=str))
+
+    def test_colors(self):
+        rep1 = moliana.Report()
+        rep1.read_html(os.path.join('reports', 'example1.html'))
+        rep1.path = self.tmp.name
+        rep1.cont[0]['colPck'] = '#00ff00'
+        rep1.cont[1]['colPck'] = 'orange'
+        rep1.generate_html()
+
+        with open(os.path.join(self.tmp.name, 'example1.html')) as file:
+            html = file.read()
+        self.assertIn('.bg-orange {background-color: orange}', html)
+        self.assertIn('style="background-color: #00ff00"', html)
+        self.assertNotIn('text-align', html.split('</style>')[1])
+
+        rep2 = moliana.Report()
+        rep2.read_html(os.path.join(self.tmp.name, 'example1.html'))
+        self.assertEqual(rep2.cont, rep1.cont)
+
+class TestHtmlParser(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        with open(os.path.join('reports', 'example1.html')) as file:
+            #without report data, the HTML itself is parsed
+            self.html = file.read().split('\n\t\t<script')[0] + '\n\t</body>\n</html>'
+
+    def _read(self, html):
+        filepath = os.path.join(self.tmp.name, 'report.html')
+        with open(filepath, 'w') as file:
+            file.write(html)
+
+        rep = moliana.Report()
+        rep.read_html(filepath)
+        return rep
+
+    def test_legacy(self):
+        rep = moliana.Report()
+        rep.read_html(os.path.join('reports', 'example6.html'))
+
+        self.assertEqual(rep.mode, 'compact')
+        self.assertEqual(len(rep.cont), 9)
+        self.assertEqual(dict(rep.cont[0]), {'Pck':'L1Pck1.L2Pck1.L3Pck1', 'Res':'False', 'colPck':'white', 'colRes':'red'})
+        self.assertEqual(rep.disp[0], {'Key':'Checked Library', 'Val':'test_library'})
+
+    def test_empty(self):
+        rep1 = moliana.Report()
+        rep1.read_html(os.path.join('reports', 'example1.html'))
+        rep1.path = self.tmp.name
+        rep1.cont = []
+        rep1.generate_html()
+
+        rep2 = moliana.Report()
+        rep2.read_html(os.path.join(self.tmp.name, 'example1.html'))
+        self.assertEqual(len(rep2.cont), 0)
+        self.assertEqual(rep2.mode, 'full')
+
+    def test_malformed(self):
+        self.assertEqual(len(self._read(self.html).cont), 5)
+
+        for html in (self.html[:len(self.html)//2], self.html.replace('id="Wrn"', 'id="Wxx"', 1),
+                     self.html.replace('</body>', '<table>\n</table>\n</body>'), ''):
+            with self.assertRaisesRegex(ValueError, 'is not a valid report'):
+                self._read(html)
+
+class TestReportData(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.rep = moliana.Report()
+        self.rep.read_html(os.path.join('reports', 'example6_compare.html'))
+        self.rep.path = self.tmp.name
+        self.rep.meta['startup'] = 0.5
+        self.rep.colors['cTrue'] = 'lightgrey'
+        self.rep.generate_html()
+        self.filepath = os.path.join(self.tmp.name, 'example6_compare.html')
+
+    def test_types(self):
+        rep = moliana.Report()
+        rep.read_html(self.filepath)
+
+        self.assertIs(rep.meta['ped'], False)
+        self.assertEqual(rep.meta['lod'], 3)
+        self.assertEqual(rep.meta['startup'], 0.5)
+        self.assertEqual(rep.mode, 'compact')
+        self.assertEqual(rep.cont, self.rep.cont)
+
+    def test_fallback(self):
+        with open(self.filepath) as file:
+            html = file.read()
+        with open(self.filepath, 'w') as file:
+            file.write(html.replace('"schema": 1', '"schema": 0'))
+
+        rep = moliana.Report()
+        rep.read_html(self.filepath)
+
+        self.assertIs(rep.meta['ped'], False)
+        self.assertNotIn('startup', rep.meta)
+        self.assertEqual(rep.cont, self.rep.cont)
+
+class TestTiming(TmpTestCase):
+
+    options = {'report_timing':True}
+
+    def test_durations(self):
+        rep = self._check(moliana.FakeBackend(latency={'L1Pck3':0.05}))
+
+        self.assertGreaterEqual(rep.cont[2]['Time'], 0.05)
+        self.assertEqual(rep.get_slowest(1), [('L1Pck3', rep.cont[2]['Time'])])
+
+        rep = self._check(moliana.FakeBackend(latency={'L1Pck3':0.05}), batch_size=-1)
+        self.assertGreaterEqual(rep.cont[0]['Time'], 0.01)
+        self.assertNotIn('Time', self._check(moliana.FakeBackend(), report_timing=False).cont[0])
+
+    def test_checker_time(self):
+        #without a duration measured by the checker, only the round-trip
+        #time is given
+        rep = self._check(moliana.FakeBackend(latency={'L1Pck3':0.05}))
+        self.assertListEqual([row['CheckerTime'] for row in rep.cont], [-1] * len(rep.cont))
+        self.assertListEqual(rep.get_slowest(time_key='CheckerTime'), [])
+
+        rep = self._check(moliana.FakeBackend(latency={'L1Pck1':0.02, 'L1Pck3':0.05}, timing=True), batch_size=-1)
+        self.assertListEqual([row['CheckerTime'] for row in rep.cont], [0.02, 0, 0.05, 0, 0])
+        #the round-trip time of the single batch is shared by all rows
+        self.assertEqual(len({row['Time'] for row in rep.cont}), 1)
+        self.assertListEqual(rep.get_slowest(2, time_key='CheckerTime'), [('L1Pck3', 0.05), ('L1Pck1', 0.02)])
+
+        rep.generate_html()
+        rep2 = moliana.Report()
+        rep2.read_html(os.path.join(self.tmp.name, 'report.html'))
+        self.assertEqual(rep2.cont, rep.cont)
+
+        with self.assertRaises(AssertionError):
+            rep.get_slowest(time_key='Duration')
+
+    def test_html(self):
+        rep1 = self._check(moliana.FakeBackend(latency={'L1Pck3':0.05}))
+        rep1.generate_html()
+        filepath = os.path.join(self.tmp.name, 'report.html')
+
+        rep2 = moliana.Report()
+        rep2.read_html(filepath)
+        self.assertEqual(rep2.cont, rep1.cont)
+
+        #without the last line, the report data is not found
+        with open(filepath) as file:
+            html = file.read()
+        self.assertIn('<th>Slowest Packages/Models</th>', html)
+        with open(filepath, 'w') as file:
+            file.write(html[:html.rindex('\n')])
+
+        rep3 = moliana.Report()
+        rep3.read_html(filepath)
+        self.assertListEqual([row['Time'] for row in rep3.cont], [round(row['Time'], 3) for row in rep1.cont])
+
+    def test_compare(self):
+        rep1 = self._check(moliana.FakeBackend(latency={'L1Pck1':0.1, 'L1Pck3':0.01}))
+        rep2 = self._check(moliana.FakeBackend(latency={'L1Pck1':0.01, 'L1Pck3':0.1}))
+        dic = rep2.compare_to(rep1, time_ratio=3)
+
+        self.assertListEqual(dic['Slower'], ['L1Pck3'])
+        self.assertEqual(rep2.cont[0]['colTime'], 'green')
+        self.assertEqual(rep2.cont[2]['colTime'], 'red')
+        self.assertIn({'Key':'Slower', 'Val':1}, rep2.disp)
+
+        #durations measured by the checker are only compared to each other
+        rep3 = self._check(moliana.FakeBackend(latency={'L1Pck1':0.01, 'L1Pck3':0.1}, timing=True), batch_size=-1)
+        self.assertListEqual(rep3.compare_to(rep1, time_ratio=3, time_key='CheckerTime')['Slower'], [])
+        self.assertListEqual(rep3.compare_to(rep3, time_ratio=3, time_key='CheckerTime')['Slower'], [])
+        rep4 = self._check(moliana.FakeBackend(latency={'L1Pck1':0.1, 'L1Pck3':0.01}, timing=True), batch_size=-1)
+        self.assertListEqual(rep3.compare_to(rep4, time_ratio=3, time_key='CheckerTime')['Slower'], ['L1Pck3'])
+
+class TestImport(unittest.TestCase):
+
+    def test_lazy_modules(self):
+        code = 'import sys, moliana; print(sorted(set(sys.modules) & {"subprocess", "sqlite3", "hashlib", "dde", "win32ui"}))'
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(moliana.__file__)),
+                                      universal_newlines=True)
+        self.assertEqual(out.strip(), '[]')
+
+    def test_dde_missing(self):
+        try:
+            import dde
+        except ImportError:
+            with self.assertRaises(ImportError):
+                moliana.DdeBackend(sys.executable).connect()
+
+class TestTimeout(TmpTestCase):
+
+    options = {'modelica_lib_depth':-1, 'check_timeout':0.2}
+
+    def _get_rows(self, backend, **kwargs):
+        return {row['Pck']:row for row in self._check(backend, **kwargs).cont}
+
+    def test_timeout(self):
+        backend = moliana.FakeBackend(hangs=['L1Pck2.L2Model2_good'])
+        dRows = self._get_rows(backend)
+
+        self.assertEqual(len(dRows), 11)
+        self.assertEqual(dRows['L1Pck2.L2Model2_good']['Res'], 'Timeout')
+        self.assertEqual(dRows['L1Pck2.L2Model2_good']['colRes'], 'orange')
+        self.assertEqual(dRows['L1Pck2.L2Model3_warning']['Res'], 'True')
+        #library is loaded again after the restart
+        self.assertEqual(len(backend.opened), 2)
+
+    def test_html(self):
+        rep1 = self._check(moliana.FakeBackend(hangs=['L1Pck2']), modelica_lib_depth=1)
+        rep1.generate_html()
+
+        filepath = os.path.join(self.tmp.name, 'report.html')
+        with open(filepath) as file:
+            self.assertIn('.bg-orange {background-color: orange}', file.read())
+
+        rep2 = moliana.Report()
+        rep2.read_html(filepath)
+        self.assertEqual(rep2.cont, rep1.cont)
+        self.assertEqual(rep2.cont[1]['Res'], 'Timeout')
+
+    def test_batches(self):
+        backend = moliana.FakeBackend(hangs=['L1Pck2.L2Model2_good'])
+        dRows = self._get_rows(backend, batch_size=-1, workers=2)
+
+        self.assertEqual([row['Res'] for row in dRows.values()].count('Timeout'), 1)
+        self.assertEqual(dRows['L1Pck2.L2Model3_warning']['Res'], 'True')
+        self.assertEqual(backend.checked.count('L1Pck2.L2Model3_warning'), 1)
+        self.assertEqual(backend.checked.count('L1Pck2.L2Model2_good'), 1)
+
+    def test_cache(self):
+        cache_path = os.path.join(self.tmp.name, 'cache.json')
+        self._check(moliana.FakeBackend(hangs=['L1Pck2.L2Model2_good']), cache_path=cache_path)
+
+        backend = moliana.FakeBackend()
+        dRows = self._get_rows(backend, cache_path=cache_path)
+        self.assertEqual(backend.checked, ['L1Pck2.L2Model2_good'])
+        self.assertEqual(dRows['L1Pck2.L2Model2_good']['Res'], 'True')
+
+    def test_unsupported(self):
+        class Backend(moliana.FakeBackend):
+            kill = moliana.CheckerBackend.kill
+
+        with self.assertRaises(AssertionError):
+            self._check(Backend())
+
+class TestCheckpoint(TmpTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.checkpoint_path = os.path.join(self.tmp.name, 'checkpoint.json')
+        self.options = {'modelica_lib_depth':-1, 'checkpoint_path':self.checkpoint_path}
+
+    def test_resume(self):
+        results = {'L1Pck2.L2Model3_warning':('True', 0, 2)}
+        rep1 = self._check(moliana.FakeBackend(results))
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+        #the second batch fails, while the first one is still checked by the
+        #other worker, which is recorded nevertheless
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(results, latency={'L1Pck2.L2Model3_warning':0.3},
+                                            failures=['L1Pck3.L2Pck1.L3Model1_good']), workers=2, batch_size=6)
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+        backend = moliana.FakeBackend(results)
+        rep2 = self._check(backend, resume=True)
+
+        self.assertListEqual(backend.checked, ['L1Pck3.L2Pck1.L3Model1_good', 'L1Pck3.L2Pck1.L3Model_bad',
+                                               'L1Pck3.L2Model1_good', 'L1Pck3.L2Model2_bad', 'L1Pck5_OneFile'])
+        self.assertEqual(rep2.cont, rep1.cont)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_stopped(self):
+        def progress(dic):
+            if dic['Completed'] == 4:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            self._check(moliana.FakeBackend(), progress=progress)
+
+        #a truncated last line is ignored
+        with open(self.checkpoint_path, 'a') as file:
+            file.write('[5, ["L1Pck')
+
+        backend = moliana.FakeBackend()
+        rep = self._check(backend, resume=True)
+        self.assertEqual(len(backend.checked), len(rep.cont) - 4)
+
+    def test_changed(self):
+        pLib = os.path.join(self.tmp.name, 'test_library')
+        shutil.copytree('test_library', pLib)
+
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(failures=['L1Pck3.L2Model1_good']), lib=pLib)
+
+        #the checkpoint of the library before the change is ignored
+        with open(os.path.join(pLib, 'L1Pck2', 'L2Model1_good.mo'), 'a') as file:
+            file.write('\n')
+        backend = moliana.FakeBackend()
+        rep = self._check(backend, lib=pLib, resume=True)
+        self.assertEqual(len(backend.checked), len(rep.cont))
+
+        with self.assertRaises(AssertionError):
+            moliana.DymolaMode('test_library', None, checker_backend=backend, resume=True).execute_check()
+
+class TestHooks(TmpTestCase):
+
+    def test_events(self):
+        events = []
+        rep = self._check(moliana.FakeBackend(), hooks=[events.append], workers=2)
+
+        #each phase, which has begun, has ended
+        for name in ('check', 'connect', 'startup', 'load', 'worklist', 'element', 'parse', 'cleanup'):
+            lPhases = [event['Phase'] for event in events if event['Name'] == name]
+            self.assertEqual(lPhases.count('Begin'), lPhases.count('End'), name)
+            self.assertTrue(lPhases, name)
+        self.assertEqual([event['Name'] for event in events][::len(events)-1], ['check', 'check'])
+        self.assertListEqual([event['Time'] for event in events], sorted(event['Time'] for event in events))
+
+        lEnds = [event for event in events if event['Name'] == 'element' and event['Phase'] == 'End']
+        self.assertEqual(len(lEnds), len(rep.cont))
+        self.assertIn({'Path':'test_library.L1Pck1', 'Level':1, 'Result':'True', 'Errors':0, 'Warnings':0},
+                      [{key:event[key] for key in ('Path', 'Level', 'Result', 'Errors', 'Warnings')} for event in lEnds])
+
+        events = []
+        self._check(moliana.FakeBackend(), hooks=[events.append], batch_size=-1)
+        self.assertIn('batch', [event['Name'] for event in events])
+
+    def test_failure(self):
+        events = []
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(failures=['L1Pck3']), hooks=[events.append])
+
+        #failed phases have ended, too
+        for name in ('check', 'element'):
+            lPhases = [event['Phase'] for event in events if event['Name'] == name]
+            self.assertEqual(lPhases.count('Begin'), lPhases.count('End'), name)
+        lFailed = [event for event in events if event['Phase'] == 'End' and 'Exception' in event]
+        self.assertListEqual([(event['Name'], event['Exception']) for event in lFailed],
+                             [('element', 'CheckerError'), ('check', 'CheckerError')])
+        self.assertEqual(lFailed[0]['Path'], 'test_library.L1Pck3')
+
+        events = []
+        with self.assertRaises(moliana.CheckerError):
+            self._check(moliana.FakeBackend(startup=1, startup_timeout=0.01), hooks=[events.append])
+        self.assertListEqual([event['Name'] for event in events if event['Phase'] == 'End' and 'Exception' in event],
+                             ['startup', 'connect', 'check'])
+
+    def test_trace(self):
+        filepath = os.path.join(self.tmp.name, 'trace.json')
+        trace = moliana.TraceCollector(filepath)
+        self._check(moliana.FakeBackend(), hooks=[trace])
+        trace.save()
+
+        with open(filepath) as file:
+            dic = json.load(file)
+        self.assertEqual(len(dic['traceEvents']), len(trace.events))
+        self.assertEqual(dic['traceEvents'][0]['ts'], 0)
+        self.assertSetEqual({event['ph'] for event in dic['traceEvents']}, {'B', 'E'})
+
+        with self.assertRaises(AssertionError):
+            self._check(moliana.FakeBackend(), hooks=trace)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)